@@ -19,7 +19,45 @@ qcrtlopencontrols
 """
 
 from .dynamic_decoupling_sequences import (DynamicDecouplingSequence,
+                                           DynamicDecouplingSequenceBuilder,
                                            new_predefined_dds,
-                                           convert_dds_to_driven_controls)
+                                           count_predefined_dds_offsets,
+                                           new_walsh_offsets_batch,
+                                           new_quadratic_offsets_batch,
+                                           new_carr_purcell_meiboom_gill_offsets_batch,
+                                           new_uhrig_single_axis_offsets_batch,
+                                           set_template_cache_size,
+                                           clear_template_cache,
+                                           get_template_cache_info,
+                                           set_template_store,
+                                           build_template_store,
+                                           DynamicDecouplingTemplateStore,
+                                           write_template_store,
+                                           DynamicDecouplingScheme,
+                                           register_dds_scheme,
+                                           unregister_dds_scheme,
+                                           get_dds_scheme,
+                                           get_dds_scheme_names,
+                                           convert_dds_to_driven_controls,
+                                           set_conversion_cache_size,
+                                           clear_conversion_cache,
+                                           get_conversion_cache_info,
+                                           iterate_driven_control_segments,
+                                           convert_dds_to_shaped_driven_controls,
+                                           convert_dds_batch_to_driven_controls,
+                                           DrivenControlsBatch,
+                                           new_predefined_dds_grid,
+                                           DynamicDecouplingSequenceBatch,
+                                           compute_minimum_rabi_rate,
+                                           compute_minimum_detuning_rate,
+                                           diagnose_dds_conversion,
+                                           save_dds, load_dds,
+                                           DynamicDecouplingSequenceArchive,
+                                           simplify_dds,
+                                           calculate_filter_function,
+                                           estimate_dephasing_infidelity,
+                                           rank_dds_by_dephasing_infidelity,
+                                           sample_switching_function,
+                                           iterate_switching_function)
 from .driven_controls import DrivenControls
 from .qiskit import convert_dds_to_quantum_circuit
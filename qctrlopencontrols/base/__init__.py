@@ -19,3 +19,4 @@ Base module
 """
 
 from .qctrl_object import QctrlObject
+from .lru_cache import LRUCache
@@ -0,0 +1,177 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+==============
+base.lru_cache
+==============
+"""
+
+from collections import OrderedDict
+
+from qctrlopencontrols.exceptions import ArgumentsValueError
+
+from .qctrl_object import QctrlObject
+
+
+class LRUCache(QctrlObject):
+    """Bounded cache that discards the least recently used entry when full.
+
+    Parameters
+    ----------
+    maximum_size : int, optional
+        Maximum number of entries held by the cache; Defaults to 128.
+        A cache of maximum size 0 is disabled: it never holds any entry.
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+
+    Notes
+    -----
+    The numbers of hits and misses count the calls to `get` that found
+    and did not find the requested key, respectively.
+    """
+
+    def __init__(self, maximum_size=128):
+
+        super(LRUCache, self).__init__(
+            base_attributes=['maximum_size', 'hits', 'misses'])
+
+        self.maximum_size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+        self.resize(maximum_size)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def enabled(self):
+        """Whether the cache holds entries
+
+        Returns
+        -------
+        bool
+            True if the maximum size of the cache is above zero
+        """
+        return self.maximum_size > 0
+
+    def get(self, key, default=None):
+
+        """Returns the value stored for a key and marks it as the most recently used.
+
+        Parameters
+        ----------
+        key : hashable
+            The key
+        default : object, optional
+            Value returned if the key is not in the cache; Defaults to None
+
+        Returns
+        -------
+        object
+            The value stored for the key, or the default
+        """
+
+        if key not in self._entries:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key, value):
+
+        """Stores a value for a key, discarding the least recently used
+        entries if the cache is full.
+
+        Parameters
+        ----------
+        key : hashable
+            The key
+        value : object
+            The value
+        """
+
+        if not self.enabled:
+            return
+
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maximum_size:
+            self._entries.popitem(last=False)
+
+    def resize(self, maximum_size):
+
+        """Changes the maximum size of the cache, discarding the least
+        recently used entries if needed.
+
+        Parameters
+        ----------
+        maximum_size : int
+            The new maximum size; 0 disables the cache
+
+        Raises
+        ------
+        ArgumentsValueError
+            Raised if the maximum size is negative.
+        """
+
+        maximum_size = int(maximum_size)
+        if maximum_size < 0:
+            raise ArgumentsValueError('Maximum size of the cache must not be negative.',
+                                      {'maximum_size': maximum_size})
+
+        self.maximum_size = maximum_size
+        while len(self._entries) > self.maximum_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+
+        """Discards all the entries and resets the numbers of hits and misses.
+        """
+
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_info(self):
+
+        """Returns the statistics of the cache.
+
+        Returns
+        -------
+        dict
+            The numbers of 'hits' and 'misses', the 'hit_rate' (None before the
+            first lookup), the current 'size' and the 'maximum_size'
+        """
+
+        lookups = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else None,
+                'size': len(self._entries),
+                'maximum_size': self.maximum_size}
+
+
+if __name__ == '__main__':
+    pass
@@ -18,9 +18,44 @@ base.qctrl_object
 =================
 """
 
+import numpy as np
+
 from qctrlopencontrols.exceptions import ArgumentsValueError
 
 
+def _attribute_repr(value):
+    """Private function to prepare the representation of an attribute.
+
+    Lists and tuples longer than the numpy print threshold are summarised
+    with their leading and trailing items, the same way numpy summarises arrays.
+
+    Parameters
+    ----------
+    value : object
+        The attribute value
+
+    Returns
+    -------
+    str
+        The representation of the attribute value
+    """
+
+    if not isinstance(value, (list, tuple)):
+        return repr(value)
+
+    print_options = np.get_printoptions()
+    if len(value) <= print_options['threshold']:
+        return repr(value)
+
+    edge_items = print_options['edgeitems']
+    items = [repr(item) for item in value[:edge_items]]
+    items.append('...')
+    items.extend(repr(item) for item in value[-edge_items:])
+    if isinstance(value, list):
+        return '[{}]'.format(', '.join(items))
+    return '({})'.format(', '.join(items))
+
+
 class QctrlObject(object):
     """Base class for all classes in QCtrl library.
 
@@ -40,6 +75,11 @@ class QctrlObject(object):
     If the base_attributes is None, __repr__ and __str__
     return a default string "No attributes provided for object
     of class self.__class__.__name__"
+
+    Attributes holding more values than the numpy print threshold are summarised
+    by their leading and trailing values. The full representation can be obtained
+    by raising the threshold, e.g. within
+    ``numpy.printoptions(threshold=sys.maxsize)``.
     """
 
     def __init__(self, base_attributes=None):
@@ -87,9 +127,9 @@ class QctrlObject(object):
 
         repr_string = '{0.__class__.__name__!s}('.format(self)
 
-        attributes_string = ','.join('{0}={1}'.format(attribute,
-                                                      repr(getattr(self, attribute)))
-                                     for attribute in self.base_attributes)
+        attributes_string = ','.join(
+            '{0}={1}'.format(attribute, _attribute_repr(getattr(self, attribute)))
+            for attribute in self.base_attributes)
         repr_string += attributes_string
         repr_string += ')'
 
@@ -22,4 +22,5 @@ from .driven_controls import DrivenControls
 
 from .constants import (
     UPPER_BOUND_RABI_RATE, UPPER_BOUND_DETUNING_RATE,
-    UPPER_BOUND_DURATION, LOWER_BOUND_DURATION, UPPER_BOUND_SEGMENTS)
+    UPPER_BOUND_DURATION, LOWER_BOUND_DURATION, UPPER_BOUND_SEGMENTS,
+    GAUSSIAN, COSINE)
@@ -38,3 +38,13 @@ LOWER_BOUND_DURATION = 1e-12
 UPPER_BOUND_SEGMENTS = 10000
 """Maximum number of segments allowed in a control
 """
+
+#pulse shapes
+GAUSSIAN = 'gaussian'
+"""Gaussian pulse shape, truncated at three standard deviations
+from the centre of the pulse
+"""
+
+COSINE = 'cosine'
+"""Raised cosine pulse shape
+"""
@@ -25,5 +25,28 @@ from .constants import (
     X_CONCATENATED, XY_CONCATENATED)
 
 from .dynamic_decoupling_sequence import DynamicDecouplingSequence
+from .sequence_builder import DynamicDecouplingSequenceBuilder
 from .predefined import new_predefined_dds
-from .driven_controls import convert_dds_to_driven_controls
+from .templates import (set_template_cache_size,
+                        clear_template_cache, get_template_cache_info,
+                        set_template_store, build_template_store)
+from .template_store import (DynamicDecouplingTemplateStore, write_template_store)
+from .scheme_registry import (DynamicDecouplingScheme, register_dds_scheme,
+                              unregister_dds_scheme, get_dds_scheme, get_dds_scheme_names)
+from .scheme_counts import count_predefined_dds_offsets
+from .driven_controls import (convert_dds_to_driven_controls, set_conversion_cache_size,
+                              clear_conversion_cache, get_conversion_cache_info,
+                              iterate_driven_control_segments,
+                              convert_dds_to_shaped_driven_controls)
+from .batch_conversion import (convert_dds_batch_to_driven_controls, DrivenControlsBatch)
+from .batch_generation import (new_predefined_dds_grid, DynamicDecouplingSequenceBatch,
+                               new_walsh_offsets_batch, new_quadratic_offsets_batch,
+                               new_carr_purcell_meiboom_gill_offsets_batch,
+                               new_uhrig_single_axis_offsets_batch)
+from .pulse_timing import (compute_minimum_rabi_rate, compute_minimum_detuning_rate,
+                           diagnose_dds_conversion)
+from .serialization import (save_dds, load_dds, DynamicDecouplingSequenceArchive)
+from .simplification import simplify_dds
+from .filter_functions import (calculate_filter_function, estimate_dephasing_infidelity,
+                               rank_dds_by_dephasing_infidelity,
+                               sample_switching_function, iterate_switching_function)
@@ -0,0 +1,60 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+==================
+sequences.__main__
+==================
+
+Builds a template store of predefined sequences from the command line:
+
+    python -m qctrlopencontrols.dynamic_decoupling_sequences FILENAME
+"""
+
+import argparse
+
+from .templates import build_template_store
+
+
+def main(arguments=None):
+
+    """Builds a template store with the command line arguments.
+
+    Parameters
+    ----------
+    arguments : list, optional
+        The command line arguments; Defaults to the arguments of the process
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='python -m qctrlopencontrols.dynamic_decoupling_sequences',
+        description='Pre-computes the relative templates of predefined dynamic decoupling '
+                    'sequences in a template store file.')
+    parser.add_argument('filename', help='name and path of the template store file')
+    parser.add_argument('--maximum-order', type=int, default=None,
+                        help='highest order parameter of the templates, for all the '
+                             'schemes; defaults to a limit per scheme')
+    parser.add_argument('--schemes', nargs='+', default=None,
+                        help='names of the schemes; defaults to the Walsh, quadratic, '
+                             'X concatenated and XY concatenated schemes')
+    arguments = parser.parse_args(arguments)
+
+    number_of_templates = build_template_store(arguments.filename,
+                                               maximum_order=arguments.maximum_order,
+                                               schemes=arguments.schemes)
+    print('{} templates written to {}'.format(number_of_templates, arguments.filename))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,374 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+==========================
+sequences.batch_conversion
+==========================
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+
+import numpy as np
+
+from qctrlopencontrols.base import QctrlObject
+from qctrlopencontrols.exceptions import ArgumentsValueError
+from qctrlopencontrols.driven_controls import DrivenControls
+
+from .driven_controls import (
+    _check_valid_operation, _check_maximum_rotation_rate, _get_pulse_start_ends,
+    _check_pulse_start_ends, _get_control_segments)
+from .dynamic_decoupling_sequence import _as_sequence_list
+
+# maximum number of control segment values prepared at once for a sequence
+_MAXIMUM_CHUNK_ELEMENTS = 2 ** 22
+
+# conversion status of each entry of a batch
+_VALID_CONVERSION = 0
+_SIMULTANEOUS_ROTATIONS = 1
+_OVERLAPPING_PULSES = 2
+
+
+class DrivenControlsBatch(QctrlObject):
+    """Collection of driven controls converted from dynamic decoupling sequences
+    at a number of maximum rabi and detuning rates.
+
+    The segments of all the controls are stored in a single array; the segments
+    of control k are ``segments[segment_indices[k]:segment_indices[k + 1]]``.
+
+    Parameters
+    ----------
+    segments : numpy.ndarray
+        Array of shape (total_number_of_segments, 4) with the segments of all the controls,
+        each formatted as [amplitude_x, amplitude_y, amplitude_z, duration]
+    segment_indices : numpy.ndarray
+        Array of length number_of_controls + 1 with the position of the first segment
+        of each control in `segments`, followed by the total number of segments
+    sequence_indices : numpy.ndarray
+        Index of the sequence each control was converted from
+    maximum_rabi_rates : numpy.ndarray
+        Maximum rabi rate used to convert each control
+    maximum_detuning_rates : numpy.ndarray
+        Maximum detuning rate used to convert each control
+    valid : numpy.ndarray
+        True for the controls that could be converted; the others have no segments
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+    """
+
+    def __init__(self, segments=None, segment_indices=None, sequence_indices=None,
+                 maximum_rabi_rates=None, maximum_detuning_rates=None, valid=None):
+
+        super(DrivenControlsBatch, self).__init__(
+            base_attributes=['segments', 'segment_indices', 'sequence_indices',
+                             'maximum_rabi_rates', 'maximum_detuning_rates', 'valid'])
+
+        self.segments = np.reshape(np.asarray(segments, dtype=np.float), (-1, 4))
+        self.segment_indices = np.asarray(segment_indices, dtype=np.int64)
+
+        if (self.segment_indices.ndim != 1 or self.segment_indices.shape[0] == 0
+                or self.segment_indices[0] != 0
+                or self.segment_indices[-1] != self.segments.shape[0]
+                or np.any(np.diff(self.segment_indices) < 0)):
+            raise ArgumentsValueError('Segment indices must be non-decreasing, start at 0 '
+                                      'and end at the number of segments.',
+                                      {'segment_indices': self.segment_indices},
+                                      extras={'number_of_segments': self.segments.shape[0]})
+
+        number_of_controls = self.segment_indices.shape[0] - 1
+
+        self.sequence_indices = np.asarray(sequence_indices, dtype=np.int64)
+        self.maximum_rabi_rates = np.asarray(maximum_rabi_rates, dtype=np.float)
+        self.maximum_detuning_rates = np.asarray(maximum_detuning_rates, dtype=np.float)
+        self.valid = np.asarray(valid, dtype=bool)
+
+        for name in ['sequence_indices', 'maximum_rabi_rates',
+                     'maximum_detuning_rates', 'valid']:
+            if getattr(self, name).shape != (number_of_controls,):
+                raise ArgumentsValueError(
+                    '{} must contain one value per control.'.format(name),
+                    {name: getattr(self, name)},
+                    extras={'number_of_controls': number_of_controls})
+
+        self.number_of_segments = np.diff(self.segment_indices)
+
+    def __len__(self):
+        return self.segment_indices.shape[0] - 1
+
+    def get_segments(self, index):
+
+        """Returns the segments of a control of the batch.
+
+        Parameters
+        ----------
+        index : int
+            Index of the control in the batch
+
+        Returns
+        -------
+        numpy.ndarray
+            The segments of the control; empty if the control could not be converted
+        """
+
+        return self.segments[self.segment_indices[index]:self.segment_indices[index + 1]]
+
+    def get_driven_control(self, index, name=None):
+
+        """Creates a driven control from the segments of a control of the batch.
+
+        Parameters
+        ----------
+        index : int
+            Index of the control in the batch
+        name : str, optional
+            Name of the driven control; Defaults to None
+
+        Returns
+        -------
+        DrivenControls
+            The driven control
+
+        Raises
+        ------
+        ArgumentsValueError
+            Raised if the control could not be converted.
+        """
+
+        if not self.valid[index]:
+            raise ArgumentsValueError('The sequence could not be converted at the '
+                                      'requested rates.',
+                                      {'index': index},
+                                      extras={'sequence_index': self.sequence_indices[index],
+                                              'maximum_rabi_rate':
+                                                  self.maximum_rabi_rates[index],
+                                              'maximum_detuning_rate':
+                                                  self.maximum_detuning_rates[index]})
+
+        return DrivenControls(segments=self.get_segments(index), name=name)
+
+
+def _convert_sequence_for_rates(sequence, maximum_rabi_rates, maximum_detuning_rates):
+
+    """Private function to convert a sequence at a number of rates
+
+    Parameters
+    ----------
+    sequence : DynamicDecouplingSequence
+        The sequence
+    maximum_rabi_rates : numpy.ndarray
+        The maximum rabi rates
+    maximum_detuning_rates : numpy.ndarray
+        The maximum detuning rates, one for each maximum rabi rate
+
+    Returns
+    -------
+    tuple
+        The segments of all the controls, the number of segments of each control
+        and the conversion status of each control
+    """
+
+    number_of_rates = maximum_rabi_rates.shape[0]
+
+    if not _check_valid_operation(rabi_rotations=sequence.rabi_rotations,
+                                  detuning_rotations=sequence.detuning_rotations):
+        return (np.zeros((0, 4)), np.zeros(number_of_rates, dtype=np.int64),
+                np.full(number_of_rates, _SIMULTANEOUS_ROTATIONS, dtype=np.int8))
+
+    rabi_rates = maximum_rabi_rates[:, None]
+    detuning_rates = maximum_detuning_rates[:, None]
+
+    pulse_start_ends = _get_pulse_start_ends(
+        sequence.duration, sequence.offsets, sequence.rabi_rotations,
+        sequence.azimuthal_angles, sequence.detuning_rotations,
+        rabi_rates, detuning_rates)
+
+    valid = _check_pulse_start_ends(pulse_start_ends)
+    free_evolution = np.all(np.isclose(pulse_start_ends, 0.), axis=(1, 2)) & valid
+
+    control_segments = _get_control_segments(
+        pulse_start_ends, sequence.azimuthal_angles, sequence.detuning_rotations,
+        rabi_rates)
+    kept = (control_segments[..., 3] != 0) & valid[:, None]
+
+    # the original sequence should be a free evolution
+    control_segments[free_evolution] = 0.
+    control_segments[free_evolution, 0, 3] = sequence.duration
+    kept[free_evolution] = False
+    kept[free_evolution, 0] = True
+
+    return (control_segments[kept], np.sum(kept, axis=1),
+            np.where(valid, _VALID_CONVERSION, _OVERLAPPING_PULSES).astype(np.int8))
+
+
+def _convert_sequences(sequences, maximum_rabi_rates, maximum_detuning_rates):
+
+    """Private function to convert a chunk of sequences at a number of rates
+
+    Parameters
+    ----------
+    sequences : list
+        The sequences
+    maximum_rabi_rates : numpy.ndarray
+        The maximum rabi rates
+    maximum_detuning_rates : numpy.ndarray
+        The maximum detuning rates, one for each maximum rabi rate
+
+    Returns
+    -------
+    tuple
+        The segments of all the controls, the number of segments of each control
+        and the conversion status of each control, ordered by sequence and then by rate
+    """
+
+    segments = []
+    numbers_of_segments = []
+    statuses = []
+    for sequence in sequences:
+        rate_chunk_size = max(1, _MAXIMUM_CHUNK_ELEMENTS // (8 * sequence.number_of_offsets))
+        for start in range(0, maximum_rabi_rates.shape[0], rate_chunk_size):
+            chunk = slice(start, start + rate_chunk_size)
+            chunk_segments, chunk_numbers_of_segments, chunk_statuses = \
+                _convert_sequence_for_rates(sequence, maximum_rabi_rates[chunk],
+                                            maximum_detuning_rates[chunk])
+            segments.append(chunk_segments)
+            numbers_of_segments.append(chunk_numbers_of_segments)
+            statuses.append(chunk_statuses)
+
+    return (np.concatenate(segments), np.concatenate(numbers_of_segments),
+            np.concatenate(statuses))
+
+
+def convert_dds_batch_to_driven_controls(dynamic_decoupling_sequences=None,
+                                         maximum_rabi_rates=2*np.pi,
+                                         maximum_detuning_rates=2*np.pi,
+                                         skip_invalid=False,
+                                         max_workers=None,
+                                         chunk_size=64):
+
+    """Converts dynamic decoupling sequences to driven controls at a number of
+    maximum rabi and detuning rates.
+
+    Parameters
+    ----------
+    dynamic_decoupling_sequences : DynamicDecouplingSequence or list
+        The sequence or list of sequences to be converted; Defaults to None
+    maximum_rabi_rates : float or numpy.ndarray, optional
+        The maximum rabi rates; Defaults to 2*pi
+    maximum_detuning_rates : float or numpy.ndarray, optional
+        The maximum detuning rates; Defaults to 2*pi. The rabi and detuning rates
+        are broadcast against each other and flattened into pairs of rates; use
+        ``numpy.meshgrid`` to convert at every combination of two sets of rates.
+    skip_invalid : bool, optional
+        If True, the controls that cannot be converted are marked as invalid in the
+        batch instead of raising an error; Defaults to False
+    max_workers : int, optional
+        If supplied, the sequences are distributed in chunks to a pool of this many
+        processes; Defaults to None, in which case the sequences are converted in
+        the current process.
+    chunk_size : int, optional
+        Number of sequences converted per task; Defaults to 64
+
+    Returns
+    -------
+    DrivenControlsBatch
+        The converted controls, ordered by sequence and then by pair of rates
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid or, unless `skip_invalid` is True, a valid
+        driven control cannot be created from one of the sequences at one of the rates.
+
+    Notes
+    -----
+    Each sequence is converted at all the rates at once, with the same arithmetic as
+    `convert_dds_to_driven_controls`; the segments of every converted control are
+    identical to those returned by `convert_dds_to_driven_controls`.
+    """
+
+    sequences = _as_sequence_list(dynamic_decoupling_sequences)[0]
+
+    maximum_rabi_rates, maximum_detuning_rates = np.broadcast_arrays(
+        np.asarray(maximum_rabi_rates, dtype=np.float),
+        np.asarray(maximum_detuning_rates, dtype=np.float))
+    maximum_rabi_rates = maximum_rabi_rates.flatten()
+    maximum_detuning_rates = maximum_detuning_rates.flatten()
+
+    if maximum_rabi_rates.shape[0] == 0:
+        raise ArgumentsValueError('At least one pair of rates must be supplied.',
+                                  {'maximum_rabi_rates': maximum_rabi_rates,
+                                   'maximum_detuning_rates': maximum_detuning_rates})
+
+    _check_maximum_rotation_rate(maximum_rabi_rates, maximum_detuning_rates)
+
+    chunk_size = int(chunk_size)
+    if chunk_size <= 0:
+        raise ArgumentsValueError('Chunk size must be above zero.',
+                                  {'chunk_size': chunk_size})
+
+    chunks = [sequences[start:start + chunk_size]
+              for start in range(0, len(sequences), chunk_size)]
+
+    if max_workers is None or len(chunks) == 1:
+        results = [_convert_sequences(chunk, maximum_rabi_rates, maximum_detuning_rates)
+                   for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                _convert_sequences, chunks,
+                itertools.repeat(maximum_rabi_rates),
+                itertools.repeat(maximum_detuning_rates)))
+
+    segments = np.concatenate([result[0] for result in results])
+    numbers_of_segments = np.concatenate([result[1] for result in results])
+    statuses = np.concatenate([result[2] for result in results])
+
+    number_of_rates = maximum_rabi_rates.shape[0]
+    sequence_indices = np.repeat(np.arange(len(sequences)), number_of_rates)
+    maximum_rabi_rates = np.tile(maximum_rabi_rates, len(sequences))
+    maximum_detuning_rates = np.tile(maximum_detuning_rates, len(sequences))
+
+    if not skip_invalid and np.any(statuses != _VALID_CONVERSION):
+        index = int(np.flatnonzero(statuses != _VALID_CONVERSION)[0])
+        extras = {'sequence_index': sequence_indices[index],
+                  'maximum_rabi_rate': maximum_rabi_rates[index],
+                  'maximum_detuning_rate': maximum_detuning_rates[index]}
+        if statuses[index] == _SIMULTANEOUS_ROTATIONS:
+            raise ArgumentsValueError(
+                'Sequence operation includes rabi rotation and '
+                'detuning rotation at the same instance.',
+                {'dynamic_decoupling_sequence': str(sequences[sequence_indices[index]])},
+                extras=extras)
+        raise ArgumentsValueError('Pulse timing could not be properly deduced from '
+                                  'the sequence operation offsets. Try increasing the '
+                                  'maximum rabi rate or maximum detuning rate.',
+                                  {'dynamic_decoupling_sequence':
+                                       sequences[sequence_indices[index]]},
+                                  extras=extras)
+
+    return DrivenControlsBatch(
+        segments=segments,
+        segment_indices=np.concatenate(([0], np.cumsum(numbers_of_segments))),
+        sequence_indices=sequence_indices,
+        maximum_rabi_rates=maximum_rabi_rates,
+        maximum_detuning_rates=maximum_detuning_rates,
+        valid=statuses == _VALID_CONVERSION)
+
+
+if __name__ == '__main__':
+    pass
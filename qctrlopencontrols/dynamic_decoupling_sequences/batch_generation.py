@@ -0,0 +1,785 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+==========================
+sequences.batch_generation
+==========================
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+
+import numpy as np
+
+from qctrlopencontrols.base import QctrlObject
+from qctrlopencontrols.exceptions import ArgumentsValueError
+
+from .constants import UPPER_BOUND_OFFSETS
+from .dynamic_decoupling_sequence import DynamicDecouplingSequence
+from .scheme_registry import get_dds_scheme
+from .templates import (_MAXIMUM_PALEY_ORDER, _lookup_relative_template,
+                        _cache_relative_template, _walsh_switching_masks)
+
+
+class DynamicDecouplingSequenceBatch(QctrlObject):
+    """Collection of dynamic decoupling sequences stored in flat arrays.
+
+    The operations of all the sequences are stored one sequence after the other; the
+    offsets of sequence k are ``offsets[offset_indices[k]:offset_indices[k + 1]]``,
+    and likewise for the rotations and angles.
+
+    Parameters
+    ----------
+    offsets : numpy.ndarray
+        The offsets of all the sequences, including the offsets at their start and end
+    rabi_rotations : numpy.ndarray
+        The rabi rotations at each offset
+    azimuthal_angles : numpy.ndarray
+        The azimuthal angles at each offset
+    detuning_rotations : numpy.ndarray
+        The detuning rotations at each offset
+    offset_indices : numpy.ndarray
+        Array of length number_of_sequences + 1 with the position of the first offset
+        of each sequence in `offsets`, followed by the total number of offsets
+    durations : numpy.ndarray
+        The duration of each sequence
+    pre_post_rotations : numpy.ndarray
+        The pre_post_rotation of each sequence
+    schemes : list, optional
+        The name of the scheme of each sequence; Defaults to None
+    order_parameters : list, optional
+        The order parameters of each sequence, as a dict; Defaults to None
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+    """
+
+    def __init__(self, offsets=None, rabi_rotations=None, azimuthal_angles=None,
+                 detuning_rotations=None, offset_indices=None, durations=None,
+                 pre_post_rotations=None, schemes=None, order_parameters=None):
+
+        super(DynamicDecouplingSequenceBatch, self).__init__(
+            base_attributes=['offsets', 'rabi_rotations', 'azimuthal_angles',
+                             'detuning_rotations', 'offset_indices', 'durations',
+                             'pre_post_rotations', 'schemes', 'order_parameters'])
+
+        self.offsets = np.asarray(offsets, dtype=np.float)
+        self.rabi_rotations = np.asarray(rabi_rotations, dtype=np.float)
+        self.azimuthal_angles = np.asarray(azimuthal_angles, dtype=np.float)
+        self.detuning_rotations = np.asarray(detuning_rotations, dtype=np.float)
+        self.offset_indices = np.asarray(offset_indices, dtype=np.int64)
+
+        for name in ['rabi_rotations', 'azimuthal_angles', 'detuning_rotations']:
+            if getattr(self, name).shape != self.offsets.shape:
+                raise ArgumentsValueError(
+                    '{} must have the same length as offsets.'.format(name),
+                    {name: getattr(self, name)},
+                    extras={'number_of_offsets': self.offsets.shape[0]})
+
+        if (self.offset_indices.ndim != 1 or self.offset_indices.shape[0] == 0
+                or self.offset_indices[0] != 0
+                or self.offset_indices[-1] != self.offsets.shape[0]
+                or np.any(np.diff(self.offset_indices) < 0)):
+            raise ArgumentsValueError('Offset indices must be non-decreasing, start at 0 '
+                                      'and end at the number of offsets.',
+                                      {'offset_indices': self.offset_indices},
+                                      extras={'number_of_offsets': self.offsets.shape[0]})
+
+        number_of_sequences = self.offset_indices.shape[0] - 1
+
+        self.durations = np.asarray(durations, dtype=np.float)
+        self.pre_post_rotations = np.asarray(pre_post_rotations, dtype=bool)
+        self.schemes = [None] * number_of_sequences if schemes is None else list(schemes)
+        self.order_parameters = ([dict() for _ in range(number_of_sequences)]
+                                 if order_parameters is None else list(order_parameters))
+
+        for name in ['durations', 'pre_post_rotations', 'schemes', 'order_parameters']:
+            if len(getattr(self, name)) != number_of_sequences:
+                raise ArgumentsValueError(
+                    '{} must contain one value per sequence.'.format(name),
+                    {name: getattr(self, name)},
+                    extras={'number_of_sequences': number_of_sequences})
+
+        self.number_of_offsets = np.diff(self.offset_indices)
+
+    def __len__(self):
+        return self.offset_indices.shape[0] - 1
+
+    def get_sequence(self, index, name=None):
+
+        """Creates a sequence of the batch.
+
+        Parameters
+        ----------
+        index : int
+            Index of the sequence in the batch
+        name : str, optional
+            Name of the sequence; Defaults to None
+
+        Returns
+        -------
+        DynamicDecouplingSequence
+            The sequence
+        """
+
+        operations = slice(self.offset_indices[index], self.offset_indices[index + 1])
+
+        return DynamicDecouplingSequence(
+            duration=self.durations[index], offsets=self.offsets[operations],
+            rabi_rotations=self.rabi_rotations[operations],
+            azimuthal_angles=self.azimuthal_angles[operations],
+            detuning_rotations=self.detuning_rotations[operations],
+            pre_post_rotation=bool(self.pre_post_rotations[index]),
+            name=name)
+
+
+def _compute_templates(keys):
+
+    """Private function to compute the relative templates of a chunk of schemes
+    and order parameters
+
+    Parameters
+    ----------
+    keys : list
+        The (scheme, parameters) of the templates
+
+    Returns
+    -------
+    list
+        The templates, as tuples of arrays; None for the templates that could not
+        be computed
+    """
+
+    templates = []
+    for scheme, parameters in keys:
+        try:
+            template = get_dds_scheme(scheme).template_function(*parameters)
+        except ArgumentsValueError:
+            template = None
+        templates.append(template if template is None else tuple(
+            np.asarray(array, dtype=np.float) for array in template))
+
+    return templates
+
+
+def _generate_sequences(tasks):
+
+    """Private function to create a chunk of sequences with the generators
+    of their schemes
+
+    Parameters
+    ----------
+    tasks : list
+        The (scheme, order parameters, duration, pre_post_rotation) of the sequences,
+        where the order parameters are a dict
+
+    Returns
+    -------
+    list
+        The offsets, rabi rotations, azimuthal angles and detuning rotations of each
+        sequence; None for the sequences that could not be created
+    """
+
+    operations = []
+    for scheme, parameters, duration, pre_post_rotation in tasks:
+        try:
+            sequence = get_dds_scheme(scheme).generator(
+                duration=duration, pre_post_rotation=pre_post_rotation, **parameters)
+        except ArgumentsValueError:
+            sequence = None
+        operations.append(sequence if sequence is None else (
+            sequence.offsets, sequence.rabi_rotations,
+            sequence.azimuthal_angles, sequence.detuning_rotations))
+
+    return operations
+
+
+def _scale_template(template, durations, pre_post_rotations):
+
+    """Private function to create the sequences of a relative template at a number
+    of durations and pre_post_rotations
+
+    Parameters
+    ----------
+    template : tuple
+        The offsets of the sequence of unit duration, its rabi rotations, azimuthal
+        angles and detuning rotations
+    durations : numpy.ndarray
+        The durations
+    pre_post_rotations : numpy.ndarray
+        The pre_post_rotations
+
+    Returns
+    -------
+    tuple
+        The offsets, rabi rotations, azimuthal angles and detuning rotations of all the
+        sequences and the number of offsets of each sequence, ordered by duration and
+        then by pre_post_rotation
+
+    Notes
+    -----
+    The sequences are padded with the offsets at their start and end exactly as
+    DynamicDecouplingSequence pads them.
+    """
+
+    offsets, rabi_rotations, azimuthal_angles, detuning_rotations = template
+    number_of_offsets = offsets.shape[0]
+    shape = (durations.shape[0], pre_post_rotations.shape[0], number_of_offsets + 2)
+
+    scaled_offsets = np.zeros(shape[0:1] + shape[2:])
+    scaled_offsets[:, 1:-1] = durations[:, None] * offsets
+    scaled_offsets[:, -1] = durations
+    padded_start = scaled_offsets[:, 1] != 0.
+    padded_end = scaled_offsets[:, -2] != durations
+
+    kept = np.ones(shape, dtype=bool)
+    kept[:, :, 0] = padded_start[:, None]
+    kept[:, :, -1] = padded_end[:, None]
+
+    padded_rabi_rotations = np.zeros(shape)
+    padded_rabi_rotations[..., 1:-1] = rabi_rotations
+    rows, columns = np.nonzero(pre_post_rotations[None, :]
+                               & np.ones(shape[0:2], dtype=bool))
+    padded_rabi_rotations[rows, columns, np.where(padded_start[rows], 0, 1)] = np.pi / 2
+    padded_rabi_rotations[rows, columns, np.where(padded_end[rows], -1, -2)] = np.pi / 2
+
+    padded_azimuthal_angles = np.zeros(shape[2:])
+    padded_azimuthal_angles[1:-1] = azimuthal_angles
+    padded_detuning_rotations = np.zeros(shape[2:])
+    padded_detuning_rotations[1:-1] = detuning_rotations
+
+    padded_arrays = [np.broadcast_to(scaled_offsets[:, None, :], shape),
+                     padded_rabi_rotations,
+                     np.broadcast_to(padded_azimuthal_angles, shape),
+                     np.broadcast_to(padded_detuning_rotations, shape)]
+
+    # the sequences of all the durations are usually padded alike, and then
+    # slicing is much faster than masking
+    if np.all(padded_start == padded_start[0]) and np.all(padded_end == padded_end[0]):
+        columns = slice(0 if padded_start[0] else 1, None if padded_end[0] else -1)
+        return tuple([np.reshape(array[..., columns], (-1,)) for array in padded_arrays]
+                     + [np.full(shape[0] * shape[1], number_of_offsets + padded_start[0]
+                                + padded_end[0], dtype=np.int64)])
+
+    return tuple([array[kept] for array in padded_arrays]
+                 + [np.sum(kept, axis=2).flatten()])
+
+
+def _map_chunks(function, tasks, executor, chunk_size):
+
+    """Private function to apply a function to chunks of tasks
+
+    Parameters
+    ----------
+    function : callable
+        The function, applied to a list of tasks and returning a list of results
+    tasks : list
+        The tasks
+    executor : concurrent.futures.Executor or None
+        The executor the chunks are submitted to; if None, the chunks are processed in
+        the current process
+    chunk_size : int
+        The number of tasks per chunk
+
+    Returns
+    -------
+    list
+        The result of each task
+    """
+
+    chunks = [tasks[start:start + chunk_size] for start in range(0, len(tasks), chunk_size)]
+    if executor is None:
+        results = [function(chunk) for chunk in chunks]
+    else:
+        results = executor.map(function, chunks)
+
+    return list(itertools.chain.from_iterable(results))
+
+
+def new_predefined_dds_grid(schemes=None, durations=1., pre_post_rotations=False,
+                            max_workers=None, chunk_size=16, **parameters):
+
+    """Creates the predefined sequences of a grid of schemes, order parameters,
+    durations and pre_post_rotations.
+
+    Parameters
+    ----------
+    schemes : str or list
+        The name or the names of the schemes, as accepted by `new_predefined_dds`
+    durations : float or numpy.ndarray, optional
+        The durations of the sequences; Defaults to 1
+    pre_post_rotations : bool or numpy.ndarray, optional
+        The pre_post_rotations of the sequences; Defaults to False
+    max_workers : int, optional
+        If supplied, the templates and the sequences of the schemes without a template
+        function are computed in chunks by a pool of this many processes; Defaults to
+        None, in which case they are computed in the current process.
+    chunk_size : int, optional
+        Number of templates or sequences computed per task; Defaults to 16
+    parameters : dict
+        The values of the order parameters, by name, as an integer or an array of
+        integers; each scheme uses the values of its own order parameters, and the
+        default value of the ones not supplied
+
+    Returns
+    -------
+    DynamicDecouplingSequenceBatch
+        The sequences, ordered by scheme, order parameters, duration and
+        pre_post_rotation; the order parameters of a scheme vary like the
+        nested loops of ``itertools.product``
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid or a sequence of the grid cannot be created.
+
+    Notes
+    -----
+    The relative template of each scheme and order parameters is computed once, or taken
+    from the template cache or store, and scaled to all the durations; the computed
+    templates are added to the template cache. The sequences are identical to the ones
+    returned by `new_predefined_dds`. With a process pool, the workers use the schemes
+    registered in the worker processes, which inherit the registry of the current process
+    when they are forked.
+    """
+
+    if schemes is None:
+        raise ArgumentsValueError('At least one scheme must be supplied.',
+                                  {'schemes': schemes})
+    schemes = [get_dds_scheme(scheme) for scheme in (
+        [schemes] if isinstance(schemes, str) else schemes)]
+    if not schemes:
+        raise ArgumentsValueError('At least one scheme must be supplied.',
+                                  {'schemes': schemes})
+
+    durations = np.asarray(durations, dtype=np.float).flatten()
+    if durations.shape[0] == 0 or np.any(durations <= 0.):
+        raise ArgumentsValueError('Sequence durations must be above zero.',
+                                  {'durations': durations})
+
+    pre_post_rotations = np.asarray(pre_post_rotations, dtype=bool).flatten()
+    if pre_post_rotations.shape[0] == 0:
+        raise ArgumentsValueError('At least one pre_post_rotation must be supplied.',
+                                  {'pre_post_rotations': pre_post_rotations})
+
+    parameters = {name: [int(value) for value in np.asarray(values).flatten()]
+                  for name, values in parameters.items()}
+    unknown_parameters = set(parameters).difference(
+        *[scheme.parameter_names for scheme in schemes])
+    if unknown_parameters:
+        raise ArgumentsValueError('Unknown order parameters of the schemes.',
+                                  {'parameters': sorted(unknown_parameters)},
+                                  extras={'schemes': [scheme.name for scheme in schemes]})
+
+    chunk_size = int(chunk_size)
+    if chunk_size <= 0:
+        raise ArgumentsValueError('Chunk size must be above zero.',
+                                  {'chunk_size': chunk_size})
+
+    grid = []
+    for scheme in schemes:
+        values = [parameters.get(name, [default]) for name, default, _, _ in scheme.parameters]
+        for combination in itertools.product(*values):
+            order_parameters = scheme.get_order_parameters(
+                **dict(zip(scheme.parameter_names, combination)))[0]
+            if scheme.number_of_offsets is not None:
+                number_of_offsets = int(scheme.number_of_offsets(*order_parameters))
+                if number_of_offsets > UPPER_BOUND_OFFSETS:
+                    raise ArgumentsValueError(
+                        'Number of offsets is above the allowed number of maximum offsets. ',
+                        {'number_of_offsets': number_of_offsets,
+                         'allowed_maximum_offsets': UPPER_BOUND_OFFSETS},
+                        extras={'scheme': scheme.name})
+            grid.append((scheme, order_parameters))
+
+    # templates are shared by all the durations, and by the grid points repeating them
+    templates = dict()
+    for scheme, order_parameters in grid:
+        if scheme.template_function is not None and (scheme.name,
+                                                     order_parameters) not in templates:
+            templates[(scheme.name, order_parameters)] = _lookup_relative_template(
+                scheme.name, order_parameters)
+    missing_templates = [key for key, template in templates.items() if template is None]
+
+    generator_tasks = [
+        (scheme.name, dict(zip(scheme.parameter_names, order_parameters)),
+         float(duration), bool(pre_post_rotation))
+        for scheme, order_parameters in grid if scheme.template_function is None
+        for duration in durations for pre_post_rotation in pre_post_rotations]
+
+    number_of_tasks = len(missing_templates) + len(generator_tasks)
+    if max_workers is None or number_of_tasks <= chunk_size:
+        computed_templates = _map_chunks(_compute_templates, missing_templates,
+                                         None, chunk_size)
+        generated_operations = _map_chunks(_generate_sequences, generator_tasks,
+                                           None, chunk_size)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            computed_templates = _map_chunks(_compute_templates, missing_templates,
+                                             executor, chunk_size)
+            generated_operations = _map_chunks(_generate_sequences, generator_tasks,
+                                               executor, chunk_size)
+
+    # the tasks that failed in the workers are repeated to raise their error here
+    for (scheme, order_parameters), template in zip(missing_templates, computed_templates):
+        if template is None:
+            template = get_dds_scheme(scheme).template_function(*order_parameters)
+        templates[(scheme, order_parameters)] = _cache_relative_template(
+            scheme, order_parameters, template)
+    for task, operations in zip(generator_tasks, generated_operations):
+        if operations is None:
+            _ = get_dds_scheme(task[0]).generator(duration=task[2],
+                                                  pre_post_rotation=task[3], **task[1])
+
+    operations = []
+    numbers_of_offsets = []
+    generated_operations = iter(generated_operations)
+    number_of_variants = durations.shape[0] * pre_post_rotations.shape[0]
+    for scheme, order_parameters in grid:
+        if scheme.template_function is not None:
+            scaled_operations = _scale_template(templates[(scheme.name, order_parameters)],
+                                                durations, pre_post_rotations)
+            operations.append(scaled_operations[0:4])
+            numbers_of_offsets.append(scaled_operations[4])
+        else:
+            for sequence_operations in itertools.islice(generated_operations,
+                                                        number_of_variants):
+                operations.append(sequence_operations)
+                numbers_of_offsets.append([sequence_operations[0].shape[0]])
+
+    return DynamicDecouplingSequenceBatch(
+        offsets=np.concatenate([operation[0] for operation in operations]),
+        rabi_rotations=np.concatenate([operation[1] for operation in operations]),
+        azimuthal_angles=np.concatenate([operation[2] for operation in operations]),
+        detuning_rotations=np.concatenate([operation[3] for operation in operations]),
+        offset_indices=np.concatenate(([0], np.cumsum(np.concatenate(numbers_of_offsets)))),
+        durations=np.tile(np.repeat(durations, pre_post_rotations.shape[0]), len(grid)),
+        pre_post_rotations=np.tile(pre_post_rotations, durations.shape[0] * len(grid)),
+        schemes=[scheme.name for scheme, _ in grid for _ in range(number_of_variants)],
+        order_parameters=[dict(zip(scheme.parameter_names, order_parameters))
+                          for scheme, order_parameters in grid
+                          for _ in range(number_of_variants)])
+
+
+def new_walsh_offsets_batch(maximum_paley_order, duration=None):
+
+    """Offsets of all the Walsh (single-axis) sequences up to a paley order.
+
+    Parameters
+    ----------
+    maximum_paley_order : int
+        The highest paley order of the sequences; the sequences of paley orders
+        1 to maximum_paley_order are generated
+    duration : float, optional
+        Total duration of the sequences. Defaults to 1.
+
+    Returns
+    -------
+    tuple
+        The offsets of all the sequences, concatenated in increasing paley order, and
+        the indices of the first offset of each sequence, with one extra index for the
+        end; the offsets of the sequence of paley order p are
+        offsets[offset_indices[p - 1]:offset_indices[p]]
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+
+    Notes
+    -----
+    The offsets are identical to the ones of the sequences created by
+    new_walsh_single_axis_sequence. The number of offsets is not bounded by
+    UPPER_BOUND_OFFSETS, so that the switching times of the high orders can be analysed;
+    there are about maximum_paley_order ** 2 offsets in total.
+    """
+
+    if duration is None:
+        duration = 1.
+    if duration <= 0.:
+        raise ArgumentsValueError(
+            'Sequence duration must be above zero:',
+            {'duration': duration})
+
+    maximum_paley_order = int(maximum_paley_order)
+    if maximum_paley_order < 1 or maximum_paley_order > _MAXIMUM_PALEY_ORDER:
+        raise ArgumentsValueError(
+            'Maximum paley order must be between 1 and {}.'.format(_MAXIMUM_PALEY_ORDER),
+            {'maximum_paley_order': maximum_paley_order})
+
+    offsets = []
+    numbers_of_offsets = []
+
+    # the paley orders with the same number of bits share the same samples
+    for hamming_weight in range(1, maximum_paley_order.bit_length() + 1):
+        samples = 2 ** hamming_weight
+        paley_orders = np.arange(2 ** (hamming_weight - 1),
+                                 min(samples, maximum_paley_order + 1), dtype=np.int64)
+        switching_masks = _walsh_switching_masks(paley_orders, hamming_weight)
+
+        steps = np.arange(1, samples, dtype=np.int64)
+        switches = (switching_masks[:, np.newaxis] & (steps & -steps)[np.newaxis, :]) != 0
+
+        offsets.append(duration * (steps[np.nonzero(switches)[1]] / samples))
+        numbers_of_offsets.append(np.count_nonzero(switches, axis=1))
+
+    offset_indices = np.concatenate(([0], np.cumsum(np.concatenate(numbers_of_offsets))))
+
+    return np.concatenate(offsets), offset_indices
+
+
+def new_quadratic_offsets_batch(number_inner_offsets, number_outer_offsets,
+                                duration=None):
+
+    """Offsets of a batch of Quadratic Decoupling Sequences.
+
+    Parameters
+    ----------
+    number_inner_offsets : int or numpy.ndarray
+        Numbers of inner Z-pi Pulses
+    number_outer_offsets : int or numpy.ndarray
+        Numbers of outer X-pi Pulses
+    duration : float or numpy.ndarray, optional
+        Total durations of the sequences. Defaults to 1.
+
+    Returns
+    -------
+    tuple
+        The offsets, rabi rotations and detuning rotations of all the sequences,
+        concatenated, and the indices of the first offset of each sequence, with one
+        extra index for the end; the sequence i is described by the slice
+        offset_indices[i]:offset_indices[i + 1] of the arrays
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+
+    Notes
+    -----
+    The numbers of pulses and the durations are broadcast against each other, and the
+    sequences are ordered as the flattened broadcast arrays. The offsets and rotations of
+    each sequence are the ones of the sequence created by new_quadratic_sequence.
+    """
+
+    if duration is None:
+        duration = 1.
+
+    number_inner_offsets, number_outer_offsets, duration = [
+        np.ravel(array) for array in np.broadcast_arrays(
+            np.asarray(number_inner_offsets, dtype=np.int64),
+            np.asarray(number_outer_offsets, dtype=np.int64),
+            np.asarray(duration, dtype=np.float))]
+
+    if np.any(duration <= 0.):
+        raise ArgumentsValueError(
+            'Sequence duration must be above zero:',
+            {'duration': duration})
+    if np.any(number_inner_offsets <= 0):
+        raise ArgumentsValueError(
+            'Number of offsets of inner pulses must be above zero:',
+            {'number_inner_offsets': number_inner_offsets})
+    if np.any(number_outer_offsets <= 0):
+        raise ArgumentsValueError(
+            'Number of offsets of outer pulses must be above zero:',
+            {'number_outer_offsets': number_outer_offsets})
+
+    # each outer interval holds the inner pulses followed by an outer pulse,
+    # except the last one which ends with the end of the sequence
+    offset_indices, sequence_indices, positions = _ragged_positions(
+        (number_outer_offsets + 1) * (number_inner_offsets + 1) - 1)
+
+    number_inner_offsets = number_inner_offsets[sequence_indices]
+    number_outer_offsets = number_outer_offsets[sequence_indices]
+    duration = duration[sequence_indices]
+
+    intervals = positions // (number_inner_offsets + 1)
+    inner_positions = positions % (number_inner_offsets + 1)
+    outer_pulses = inner_positions == number_inner_offsets
+
+    # relative start and end of the outer interval of each offset
+    outer_constants = 1. / (2 * number_outer_offsets + 2)
+    starts = np.where(
+        intervals == 0, 0.,
+        np.sin(np.pi * intervals * outer_constants) ** 2)
+    ends = np.where(
+        intervals == number_outer_offsets, 1.,
+        np.sin(np.pi * (intervals + 1) * outer_constants) ** 2)
+
+    inner_constants = 1. / (2 * number_inner_offsets + 2)
+    relative_inner_offsets = np.sin(np.pi * (inner_positions + 1) * inner_constants) ** 2
+
+    offsets = duration * np.where(outer_pulses, ends,
+                                  (ends - starts) * relative_inner_offsets + starts)
+    rabi_rotations = np.where(outer_pulses, np.pi, 0.)
+    detuning_rotations = np.where(outer_pulses, 0., np.pi)
+
+    return offsets, rabi_rotations, detuning_rotations, offset_indices
+
+
+def new_carr_purcell_meiboom_gill_offsets_batch(number_of_offsets,  # pylint: disable=invalid-name
+                                                duration=None):
+
+    """Offsets of a batch of Carr-Purcell-Meiboom-Gill sequences.
+
+    Parameters
+    ----------
+    number_of_offsets : int or numpy.ndarray
+        Numbers of offsets of the sequences
+    duration : float or numpy.ndarray, optional
+        Total durations of the sequences. Defaults to 1.
+
+    Returns
+    -------
+    tuple
+        The offsets of all the sequences, concatenated, and the indices of the first
+        offset of each sequence, with one extra index for the end; the offsets of the
+        sequence i are offsets[offset_indices[i]:offset_indices[i + 1]]
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+
+    Notes
+    -----
+    The numbers of offsets and the durations are broadcast against each other, and the
+    sequences are ordered as the flattened broadcast arrays. The offsets of each sequence
+    are the ones of the sequences created by new_carr_purcell_sequence and
+    new_carr_purcell_meiboom_gill_sequence.
+    """
+
+    number_of_offsets, duration = _check_offsets_batch_arguments(number_of_offsets, duration)
+    offset_indices, sequence_indices, positions = _ragged_positions(number_of_offsets)
+
+    spacing = 1. / number_of_offsets[sequence_indices]
+    offsets = duration[sequence_indices] * (spacing * positions + spacing * 0.5)
+
+    return offsets, offset_indices
+
+
+def new_uhrig_single_axis_offsets_batch(number_of_offsets,  # pylint: disable=invalid-name
+                                        duration=None):
+
+    """Offsets of a batch of Uhrig single-axis sequences.
+
+    Parameters
+    ----------
+    number_of_offsets : int or numpy.ndarray
+        Numbers of offsets of the sequences
+    duration : float or numpy.ndarray, optional
+        Total durations of the sequences. Defaults to 1.
+
+    Returns
+    -------
+    tuple
+        The offsets of all the sequences, concatenated, and the indices of the first
+        offset of each sequence, with one extra index for the end; the offsets of the
+        sequence i are offsets[offset_indices[i]:offset_indices[i + 1]]
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+
+    Notes
+    -----
+    The numbers of offsets and the durations are broadcast against each other, and the
+    sequences are ordered as the flattened broadcast arrays. The offsets of each sequence
+    are the ones of the sequence created by new_uhrig_single_axis_sequence.
+    """
+
+    number_of_offsets, duration = _check_offsets_batch_arguments(number_of_offsets, duration)
+    offset_indices, sequence_indices, positions = _ragged_positions(number_of_offsets)
+
+    constants = 1. / (2 * number_of_offsets[sequence_indices] + 2)
+    offsets = duration[sequence_indices] * (
+        np.sin(np.pi * (positions + 1) * constants) ** 2)
+
+    return offsets, offset_indices
+
+
+def _check_offsets_batch_arguments(number_of_offsets, duration):
+
+    """Private function to broadcast and check the arguments of the batches of
+    sequences parametrised by their number of offsets
+
+    Parameters
+    ----------
+    number_of_offsets : int or numpy.ndarray
+        Numbers of offsets of the sequences
+    duration : float or numpy.ndarray or None
+        Total durations of the sequences; None for sequences of unit duration
+
+    Returns
+    -------
+    tuple
+        The flattened broadcast numbers of offsets and durations
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+    """
+
+    if duration is None:
+        duration = 1.
+
+    number_of_offsets, duration = [
+        np.ravel(array) for array in np.broadcast_arrays(
+            np.asarray(number_of_offsets, dtype=np.int64),
+            np.asarray(duration, dtype=np.float))]
+
+    if np.any(duration <= 0.):
+        raise ArgumentsValueError(
+            'Sequence duration must be above zero:',
+            {'duration': duration})
+    if np.any(number_of_offsets <= 0):
+        raise ArgumentsValueError(
+            'Number of offsets must be above zero:',
+            {'number_of_offsets': number_of_offsets})
+
+    return number_of_offsets, duration
+
+
+def _ragged_positions(numbers_of_offsets):
+
+    """Private function to index the offsets of a batch of sequences stored
+    one after the other
+
+    Parameters
+    ----------
+    numbers_of_offsets : numpy.ndarray
+        The number of offsets of each sequence
+
+    Returns
+    -------
+    tuple
+        The indices of the first offset of each sequence, with one extra index for
+        the end, and for each offset, the index of its sequence and its position
+        in the sequence
+    """
+
+    offset_indices = np.concatenate(([0], np.cumsum(numbers_of_offsets)))
+    sequence_indices = np.repeat(np.arange(numbers_of_offsets.shape[0]), numbers_of_offsets)
+    positions = np.arange(offset_indices[-1]) - offset_indices[sequence_indices]
+
+    return offset_indices, sequence_indices, positions
+
+
+if __name__ == '__main__':
+    pass
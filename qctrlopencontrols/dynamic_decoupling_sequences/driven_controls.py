@@ -18,11 +18,70 @@ sequences.driven_controls
 =========================
 """
 
+import copy
+
 import numpy as np
 
+from qctrlopencontrols.base import LRUCache
 from qctrlopencontrols.exceptions import ArgumentsValueError
 from qctrlopencontrols.driven_controls import (
-    UPPER_BOUND_RABI_RATE, UPPER_BOUND_DETUNING_RATE, DrivenControls)
+    UPPER_BOUND_RABI_RATE, UPPER_BOUND_DETUNING_RATE, GAUSSIAN, COSINE, DrivenControls)
+
+# driven controls of previous conversions; disabled until sized
+_CONVERSION_CACHE = LRUCache(maximum_size=0)
+
+# discretized shaped pulses
+_PULSE_TEMPLATE_CACHE = LRUCache(maximum_size=256)
+
+
+def set_conversion_cache_size(maximum_size=128):
+
+    """Sets the maximum number of conversions remembered by
+    `convert_dds_to_driven_controls`.
+
+    Parameters
+    ----------
+    maximum_size : int, optional
+        Maximum number of conversions held in the cache; Defaults to 128.
+        0 disables the cache, which is the initial state.
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the maximum size is negative.
+
+    Notes
+    -----
+    The cache holds the driven control of each conversion, keyed on the
+    fingerprint of the sequence (see `DynamicDecouplingSequence.get_fingerprint`)
+    and the maximum rabi and detuning rates. Shrinking the cache discards the
+    least recently used conversions.
+    """
+
+    _CONVERSION_CACHE.resize(maximum_size)
+
+
+def clear_conversion_cache():
+
+    """Discards the conversions held in the cache of `convert_dds_to_driven_controls`
+    and resets its numbers of hits and misses.
+    """
+
+    _CONVERSION_CACHE.clear()
+
+
+def get_conversion_cache_info():
+
+    """Returns the statistics of the cache of `convert_dds_to_driven_controls`.
+
+    Returns
+    -------
+    dict
+        The numbers of 'hits' and 'misses', the 'hit_rate' (None before the first lookup),
+        the current 'size' and the 'maximum_size' of the cache
+    """
+
+    return _CONVERSION_CACHE.get_info()
 
 
 def _check_valid_operation(rabi_rotations, detuning_rotations):
@@ -44,15 +103,7 @@ def _check_valid_operation(rabi_rotations, detuning_rotations):
         at the same offset
     """
 
-    rabi_rotation_index = set(np.where(rabi_rotations > 0.)[0])
-    detuning_rotation_index = set(np.where(detuning_rotations > 0.)[0])
-
-    check_common_index = rabi_rotation_index.intersection(detuning_rotation_index)
-
-    if check_common_index:
-        return False
-
-    return True
+    return not np.any((rabi_rotations > 0.) & (detuning_rotations > 0.))
 
 
 def _check_maximum_rotation_rate(
@@ -63,9 +114,9 @@ def _check_maximum_rotation_rate(
 
     Parameters
     ----------
-    maximum_rabi_rate : float, optional
+    maximum_rabi_rate : float or numpy.ndarray, optional
         Maximum Rabi Rate; Defaults to 1.0
-    maximum_detuning_rate : float, optional
+    maximum_detuning_rate : float or numpy.ndarray, optional
         Maximum Detuning Rate; Defaults to None
 
     Raises
@@ -77,7 +128,7 @@ def _check_maximum_rotation_rate(
     """
 
     # check against global parameters
-    if maximum_rabi_rate < 0. or maximum_rabi_rate > UPPER_BOUND_RABI_RATE:
+    if np.any(maximum_rabi_rate < 0.) or np.any(maximum_rabi_rate > UPPER_BOUND_RABI_RATE):
         raise ArgumentsValueError(
             'Maximum rabi rate must be between 0. and maximum value of {0}'.format(
                 UPPER_BOUND_RABI_RATE),
@@ -85,7 +136,8 @@ def _check_maximum_rotation_rate(
             extras={'maximum_detuning_rate': maximum_detuning_rate,
                     'allowed_maximum_rabi_rate': UPPER_BOUND_RABI_RATE})
 
-    if maximum_detuning_rate < 0. or maximum_detuning_rate > UPPER_BOUND_DETUNING_RATE:
+    if (np.any(maximum_detuning_rate < 0.)
+            or np.any(maximum_detuning_rate > UPPER_BOUND_DETUNING_RATE)):
         raise ArgumentsValueError(
             'Maximum detuning rate must be between 0. and maximum value of {0}'.format(
                 UPPER_BOUND_DETUNING_RATE),
@@ -95,6 +147,219 @@ def _check_maximum_rotation_rate(
                     'allowed_maximum_detuning_rate': UPPER_BOUND_DETUNING_RATE})
 
 
+def _get_half_pulse_durations(offsets, rabi_rotations, azimuthal_angles,
+                              detuning_rotations, maximum_rabi_rate, maximum_detuning_rate):
+
+    """Private function to calculate the half durations of the pulses of a sequence
+
+    Parameters
+    ----------
+    offsets : numpy.ndarray
+        The offsets of the operations
+    rabi_rotations : numpy.ndarray
+        The rabi rotations of the operations
+    azimuthal_angles : numpy.ndarray
+        The azimuthal angles of the operations
+    detuning_rotations : numpy.ndarray
+        The detuning rotations of the operations
+    maximum_rabi_rate : float or numpy.ndarray
+        Maximum Rabi Rate, or an array of shape (number_of_rates, 1) of rates
+    maximum_detuning_rate : float or numpy.ndarray
+        Maximum Detuning Rate, or an array of shape (number_of_rates, 1) of rates
+
+    Returns
+    -------
+    tuple
+        The half duration of each pulse, of shape (number_of_offsets,) or
+        (number_of_rates, number_of_offsets), and a boolean array of shape
+        (number_of_offsets,) that is True for the operations that are skipped
+        (i.e. have no pulse at all)
+
+    Notes
+    -----
+    Operations with no detuning rotation are rabi pulses of duration
+    rabi_rotation/maximum_rabi_rate; if the rabi rotation is zero, the azimuthal angle is
+    used in its place. Operations with a detuning rotation are detuning pulses of duration
+    detuning_rotation/maximum_detuning_rate. Operations whose offset and rotations sum to
+    zero are skipped.
+    """
+
+    skipped = np.isclose(offsets + rabi_rotations + azimuthal_angles + detuning_rotations, 0.)
+    rabi_pulses = detuning_rotations == 0
+
+    half_pulse_durations = np.zeros(np.broadcast(
+        offsets, maximum_rabi_rate, maximum_detuning_rate).shape)
+
+    rabi_sizes = np.where(np.isclose(rabi_rotations, 0.), azimuthal_angles, rabi_rotations)
+    half_pulse_durations[..., rabi_pulses] = 0.5 * rabi_sizes[rabi_pulses] / maximum_rabi_rate
+    half_pulse_durations[..., ~rabi_pulses] = (
+        0.5 * detuning_rotations[~rabi_pulses] / maximum_detuning_rate)
+    half_pulse_durations[..., skipped] = 0.
+
+    return half_pulse_durations, skipped
+
+
+def _get_pulse_start_ends(sequence_duration, offsets, rabi_rotations, azimuthal_angles,
+                          detuning_rotations, maximum_rabi_rate, maximum_detuning_rate):
+
+    """Private function to calculate the start and end times of the pulses of a sequence
+
+    Parameters
+    ----------
+    sequence_duration : float
+        Duration of the sequence
+    offsets : numpy.ndarray
+        The offsets of the operations
+    rabi_rotations : numpy.ndarray
+        The rabi rotations of the operations
+    azimuthal_angles : numpy.ndarray
+        The azimuthal angles of the operations
+    detuning_rotations : numpy.ndarray
+        The detuning rotations of the operations
+    maximum_rabi_rate : float or numpy.ndarray
+        Maximum Rabi Rate, or an array of shape (number_of_rates, 1) of rates
+    maximum_detuning_rate : float or numpy.ndarray
+        Maximum Detuning Rate, or an array of shape (number_of_rates, 1) of rates
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (number_of_offsets, 2), or (number_of_rates, number_of_offsets, 2),
+        with the start and end time of each pulse; the pulses at either end are
+        shifted to fall within the sequence duration.
+    """
+
+    half_pulse_durations, skipped = _get_half_pulse_durations(
+        offsets, rabi_rotations, azimuthal_angles, detuning_rotations,
+        maximum_rabi_rate, maximum_detuning_rate)
+
+    pulse_mid_points = np.where(skipped, 0., offsets)
+
+    return _get_shifted_pulse_start_ends(sequence_duration, pulse_mid_points,
+                                         half_pulse_durations)
+
+
+def _get_shifted_pulse_start_ends(sequence_duration, pulse_mid_points, half_pulse_durations):
+
+    """Private function to calculate the start and end times of pulses from their
+    mid-points and half durations
+
+    Parameters
+    ----------
+    sequence_duration : float
+        Duration of the sequence
+    pulse_mid_points : numpy.ndarray
+        The mid-points of the pulses
+    half_pulse_durations : numpy.ndarray
+        The half durations of the pulses, of shape (number_of_offsets,) or
+        (number_of_rates, number_of_offsets)
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (number_of_offsets, 2), or (number_of_rates, number_of_offsets, 2),
+        with the start and end time of each pulse; the pulses at either end are
+        shifted to fall within the sequence duration.
+    """
+
+    pulse_start_ends = np.stack([pulse_mid_points - half_pulse_durations,
+                                 pulse_mid_points + half_pulse_durations], axis=-1)
+
+    # check if any of the pulses have gone outside the time limit [0, sequence_duration]
+    # if yes, adjust the segment timing
+    first_pulse = pulse_start_ends[..., 0, :].copy()
+    translation = 0. - first_pulse[..., 0]
+    pulse_start_ends[..., 0, :] = np.where(
+        ((first_pulse[..., 0] < 0.) & (np.sum(np.abs(first_pulse), axis=-1) != 0))[..., None],
+        first_pulse + translation[..., None], first_pulse)
+
+    last_pulse = pulse_start_ends[..., -1, :].copy()
+    outside = last_pulse[..., 1] > sequence_duration
+    clipped = np.sum(np.abs(pulse_start_ends[..., 0, :]), axis=-1) == 2 * sequence_duration
+    translation = last_pulse[..., 1] - sequence_duration
+    pulse_start_ends[..., -1, :] = np.where(
+        (outside & ~clipped)[..., None], last_pulse - translation[..., None], last_pulse)
+    pulse_start_ends[..., -1, 1] = np.where(
+        outside & clipped, sequence_duration, pulse_start_ends[..., -1, 1])
+
+    return pulse_start_ends
+
+
+def _check_pulse_start_ends(pulse_start_ends):
+
+    """Private function to check that the pulses of a sequence do not overlap
+
+    Parameters
+    ----------
+    pulse_start_ends : numpy.ndarray
+        Array of shape (number_of_offsets, 2), or (number_of_rates, number_of_offsets, 2),
+        with the start and end time of each pulse
+
+    Returns
+    -------
+    bool or numpy.ndarray
+        True if the pulse timing is valid; an array with one value per rate if the
+        start and end times are supplied for several rates
+    """
+
+    # four conditions to check
+    # 1. Control segment start times should be monotonically increasing
+    # 2. Control segment end times should be monotonically increasing
+    # 3. Control segment start time must be less than its end time
+    # 4. Adjacent segments should not be overlapping
+    starts = pulse_start_ends[..., 0]
+    ends = pulse_start_ends[..., 1]
+    return ~(np.any(starts[..., 0:-1] - starts[..., 1:] > 0., axis=-1) |
+             np.any(ends[..., 0:-1] - ends[..., 1:] > 0., axis=-1) |
+             np.any(starts - ends > 0., axis=-1) |
+             np.any(starts[..., 1:] - ends[..., 0:-1] < 0., axis=-1))
+
+
+def _get_control_segments(pulse_start_ends, azimuthal_angles, detuning_rotations,
+                          maximum_rabi_rate):
+
+    """Private function to prepare the control segments of a sequence
+
+    Parameters
+    ----------
+    pulse_start_ends : numpy.ndarray
+        Array of shape (number_of_offsets, 2), or (number_of_rates, number_of_offsets, 2),
+        with the start and end time of each pulse
+    azimuthal_angles : numpy.ndarray
+        The azimuthal angles of the operations
+    detuning_rotations : numpy.ndarray
+        The detuning rotations of the operations
+    maximum_rabi_rate : float or numpy.ndarray
+        Maximum Rabi Rate, or an array of shape (number_of_rates, 1) of rates
+
+    Returns
+    -------
+    numpy.ndarray
+        The control segments, of shape (2 * number_of_offsets, 4) or
+        (number_of_rates, 2 * number_of_offsets, 4); pulse segments interleaved
+        with the free evolution segments between them. The segments of zero
+        duration are kept and need to be removed by the caller.
+    """
+
+    rabi_pulses = detuning_rotations == 0.
+
+    control_segments = np.zeros(pulse_start_ends.shape[:-2]
+                                + (pulse_start_ends.shape[-2] * 2, 4))
+
+    pulse_segments = control_segments[..., 0::2, :]
+    pulse_segments[..., 0] = np.where(rabi_pulses,
+                                      maximum_rabi_rate * np.cos(azimuthal_angles), 0.)
+    pulse_segments[..., 1] = np.where(rabi_pulses,
+                                      maximum_rabi_rate * np.sin(azimuthal_angles), 0.)
+    pulse_segments[..., 2] = np.where(rabi_pulses, 0., detuning_rotations)
+    pulse_segments[..., 3] = pulse_start_ends[..., 1] - pulse_start_ends[..., 0]
+
+    control_segments[..., 1:-1:2, 3] = (pulse_start_ends[..., 1:, 0]
+                                        - pulse_start_ends[..., 0:-1, 1])
+
+    return control_segments
+
+
 def convert_dds_to_driven_controls(
         dynamic_decoupling_sequence=None,
         maximum_rabi_rate=2*np.pi,
@@ -150,6 +415,10 @@ def convert_dds_to_driven_controls(
 
     If appropriate control segments cannot be created, the conversion process raises
     an ArgumentsValueError.
+
+    If the conversion cache is enabled with `set_conversion_cache_size`, the driven
+    control of a sequence with the same content converted previously at the same rates
+    is copied instead of being calculated again.
     """
 
     if dynamic_decoupling_sequence is None:
@@ -160,6 +429,17 @@ def convert_dds_to_driven_controls(
 
     _check_maximum_rotation_rate(maximum_rabi_rate, maximum_detuning_rate)
 
+    cache_key = None
+    if _CONVERSION_CACHE.enabled and set(kwargs) <= {'name'}:
+        cache_key = (dynamic_decoupling_sequence.get_fingerprint(),
+                     float(maximum_rabi_rate), float(maximum_detuning_rate))
+        cached_driven_control = _CONVERSION_CACHE.get(cache_key)
+        if cached_driven_control is not None:
+            driven_control = copy.deepcopy(cached_driven_control)
+            if kwargs.get('name') is not None:
+                driven_control.name = str(kwargs['name'])
+            return driven_control
+
     sequence_duration = dynamic_decoupling_sequence.duration
     offsets = dynamic_decoupling_sequence.offsets
     rabi_rotations = dynamic_decoupling_sequence.rabi_rotations
@@ -185,67 +465,204 @@ def convert_dds_to_driven_controls(
              'maximum_detuning_rate': maximum_detuning_rate},
             extras={'maximum_rabi_rate': maximum_rabi_rate})
 
-    offsets = offsets[np.newaxis, :]
-    rabi_rotations = rabi_rotations[np.newaxis, :]
-    azimuthal_angles = azimuthal_angles[np.newaxis, :]
-    detuning_rotations = detuning_rotations[np.newaxis, :]
+    pulse_start_ends = _get_pulse_start_ends(
+        sequence_duration, offsets, rabi_rotations, azimuthal_angles, detuning_rotations,
+        maximum_rabi_rate, maximum_detuning_rate)
 
-    operations = np.concatenate((offsets, rabi_rotations,
-                                 azimuthal_angles, detuning_rotations),
-                                axis=0)
+    if not _check_pulse_start_ends(pulse_start_ends):
 
-    pulse_mid_points = operations[0, :]
+        raise ArgumentsValueError('Pulse timing could not be properly deduced from '
+                                  'the sequence operation offsets. Try increasing the '
+                                  'maximum rabi rate or maximum detuning rate.',
+                                  {'dynamic_decoupling_sequence': dynamic_decoupling_sequence,
+                                   'maximum_rabi_rate': maximum_rabi_rate,
+                                   'maximum_detuning_rate': maximum_detuning_rate},
+                                  extras={'deduced_pulse_start_timing': pulse_start_ends[:, 0],
+                                          'deduced_pulse_end_timing': pulse_start_ends[:, 1]})
 
-    pulse_start_ends = np.zeros((operations.shape[1], 2))
+    if np.allclose(pulse_start_ends, 0.0):
+        # the original sequence should be a free evolution
+        control_segments = np.reshape(
+            np.array([0., 0., 0., sequence_duration]), (1, 4))
+    else:
+        control_segments = _get_control_segments(
+            pulse_start_ends, azimuthal_angles, detuning_rotations, maximum_rabi_rate)
 
-    for op_idx in range(operations.shape[1]):
+        # almost there; let us check if there is any segments with durations = 0
+        control_segments = control_segments[control_segments[:, 3] != 0]
 
-        if np.isclose(np.sum(operations[:, op_idx]), 0.0):
-            continue
+    driven_control = DrivenControls(segments=control_segments, **kwargs)
 
-        if operations[3, op_idx] == 0: #no z_rotations
-            if not np.isclose(operations[1, op_idx], 0.):
-                half_pulse_duration = 0.5 * operations[1, op_idx] / maximum_rabi_rate
-            else:
-                half_pulse_duration = 0.5 * operations[2, op_idx] / maximum_rabi_rate
+    if cache_key is not None:
+        cached_driven_control = copy.deepcopy(driven_control)
+        cached_driven_control.name = None
+        _CONVERSION_CACHE.put(cache_key, cached_driven_control)
 
-            pulse_start_ends[op_idx, 0] = pulse_mid_points[op_idx] - half_pulse_duration
+    return driven_control
 
-            pulse_start_ends[op_idx, 1] = pulse_mid_points[op_idx] + half_pulse_duration
-        else:
-            pulse_start_ends[op_idx, 0] = pulse_mid_points[op_idx] - \
-                                          0.5 * operations[3, op_idx] / maximum_detuning_rate
 
-            pulse_start_ends[op_idx, 1] = pulse_mid_points[op_idx] + \
-                                          0.5 * operations[3, op_idx] / maximum_detuning_rate
+def _get_pulse_shape(pulse_shape, resolution):
 
-    # check if any of the pulses have gone outside the time limit [0, sequence_duration]
-    # if yes, adjust the segment timing
-    if pulse_start_ends[0, 0] < 0.:
+    """Private function to sample a pulse shape at the mid-points of its segments
 
-        if np.sum(np.abs(pulse_start_ends[0, :])) == 0:
-            pulse_start_ends[0, 0] = 0
-        else:
-            translation = 0. - (pulse_start_ends[0, 0])
-            pulse_start_ends[0, :] = pulse_start_ends[0, :] + translation
+    Parameters
+    ----------
+    pulse_shape : str
+        The pulse shape; one of 'gaussian' or 'cosine'
+    resolution : int
+        Number of segments of the pulse
 
-    if pulse_start_ends[-1, 1] > sequence_duration:
+    Returns
+    -------
+    numpy.ndarray
+        The amplitude of each segment, relative to the maximum amplitude
 
-        if np.sum(np.abs(pulse_start_ends[0, :])) == 2 * sequence_duration:
-            pulse_start_ends[-1, 1] = sequence_duration
-        else:
-            translation = pulse_start_ends[-1, 1] - sequence_duration
-            pulse_start_ends[-1, :] = pulse_start_ends[-1, :] - translation
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the pulse shape or resolution is invalid.
+    """
 
-    # four conditions to check
-    # 1. Control segment start times should be monotonically increasing
-    # 2. Control segment end times should be monotonically increasing
-    # 3. Control segment start time must be less than its end time
-    # 4. Adjacent segments should not be overlapping
-    if (np.any(pulse_start_ends[0:-1, 0] - pulse_start_ends[1:, 0] > 0.) or
-            np.any(pulse_start_ends[0:-1, 1] - pulse_start_ends[1:, 1] > 0.) or
-            np.any(pulse_start_ends[:, 0] - pulse_start_ends[:, 1] > 0.) or
-            np.any(pulse_start_ends[1:, 0]-pulse_start_ends[0:-1, 1] < 0.)):
+    if resolution <= 0:
+        raise ArgumentsValueError('Resolution of the pulses must be above zero.',
+                                  {'resolution': resolution})
+
+    times = (np.arange(resolution) + 0.5) / resolution
+
+    if pulse_shape == GAUSSIAN:
+        return np.exp(-0.5 * ((times - 0.5) * 6.) ** 2)
+    if pulse_shape == COSINE:
+        return 0.5 * (1. - np.cos(2 * np.pi * times))
+
+    raise ArgumentsValueError('Pulse shape is not supported. Please use one of '
+                              '{}'.format([GAUSSIAN, COSINE]),
+                              {'pulse_shape': pulse_shape})
+
+
+def _get_pulse_template(rabi_rotation, maximum_rabi_rate, pulse_shape, resolution):
+
+    """Private function to discretize a shaped pulse; the templates are cached
+
+    Parameters
+    ----------
+    rabi_rotation : float
+        The rotation performed by the pulse
+    maximum_rabi_rate : float
+        The peak rabi rate of the pulse
+    pulse_shape : str
+        The pulse shape
+    resolution : int
+        Number of segments of the pulse
+
+    Returns
+    -------
+    tuple
+        The rabi rate of each segment and the duration of the segments
+    """
+
+    key = (float(rabi_rotation), float(maximum_rabi_rate), pulse_shape, resolution)
+    template = _PULSE_TEMPLATE_CACHE.get(key)
+
+    if template is None:
+        rabi_rates = maximum_rabi_rate * _get_pulse_shape(pulse_shape, resolution)
+        # the segments of the pulse add up to the rotation
+        template = (rabi_rates, rabi_rotation / np.sum(rabi_rates))
+        _PULSE_TEMPLATE_CACHE.put(key, template)
+
+    return template
+
+
+def convert_dds_to_shaped_driven_controls(
+        dynamic_decoupling_sequence=None,
+        maximum_rabi_rate=2*np.pi,
+        maximum_detuning_rate=2*np.pi,
+        pulse_shape=GAUSSIAN,
+        resolution=16,
+        **kwargs):
+
+    """Creates a Driven Control with shaped rabi pulses based on the supplied DDS
+
+    Parameters
+    ----------
+    dynamic_decoupling_sequence : DynamicDecouplingSequence
+        The base DDS; Defaults to None
+    maximum_rabi_rate : float, optional
+        Maximum Rabi Rate, reached at the peak of the shaped pulses; Defaults to 2*pi
+    maximum_detuning_rate : float, optional
+        Maximum Detuning Rate; Defaults to 2*pi
+    pulse_shape : str, optional
+        Shape of the rabi pulses; one of 'gaussian' or 'cosine'. Defaults to 'gaussian'
+    resolution : int, optional
+        Number of segments of each shaped pulse; Defaults to 16
+    kwargs : dict, optional
+        options to make the corresponding filter type.
+        I.e. the options for primitive is described in doc for the PrimitivePulse class.
+
+    Returns
+    -------
+    DrivenControls
+        The Driven Control that contains the segments
+        corresponding to the Dynamic Decoupling Sequence operation
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid or a valid driven control cannot be
+        created from the sequence parameters, maximum rabi rate and maximum detuning
+        rate provided
+
+    Notes
+    -----
+    The conversion follows `convert_dds_to_driven_controls`, except that each rabi
+    rotation is performed by a pulse made of `resolution` segments of equal duration
+    whose rabi rates follow the pulse shape, peaking at the maximum rabi rate. The pulse
+    is centred on the offset of the operation and its duration is chosen such that the
+    segments add up to the rabi rotation; it is therefore longer than the flat-topped
+    pulse of the same rotation. Detuning rotations remain flat-topped segments.
+
+    The segments of each pulse are cached for each rotation, maximum rabi rate, pulse
+    shape and resolution, and copied into place for all the pulses at once.
+    """
+
+    if dynamic_decoupling_sequence is None:
+        raise ArgumentsValueError('Dynamic decoupling sequence must be of '
+                                  'DynamicDecoupling type.',
+                                  {'type(dynamic_decoupling_sequence':
+                                   type(dynamic_decoupling_sequence)})
+
+    _check_maximum_rotation_rate(maximum_rabi_rate, maximum_detuning_rate)
+
+    resolution = int(resolution)
+    shape_area = np.mean(_get_pulse_shape(pulse_shape, resolution))
+
+    sequence_duration = dynamic_decoupling_sequence.duration
+    offsets = dynamic_decoupling_sequence.offsets
+    rabi_rotations = dynamic_decoupling_sequence.rabi_rotations
+    azimuthal_angles = dynamic_decoupling_sequence.azimuthal_angles
+    detuning_rotations = dynamic_decoupling_sequence.detuning_rotations
+
+    # check for valid operation
+    if not _check_valid_operation(rabi_rotations=rabi_rotations,
+                                  detuning_rotations=detuning_rotations):
+        raise ArgumentsValueError(
+            'Sequence operation includes rabi rotation and '
+            'detuning rotation at the same instance.',
+            {'dynamic_decoupling_sequence': str(dynamic_decoupling_sequence)},
+            extras={'maximum_rabi_rate': maximum_rabi_rate,
+                    'maximum_detuning_rate': maximum_detuning_rate})
+
+    half_pulse_durations, skipped = _get_half_pulse_durations(
+        offsets, rabi_rotations, azimuthal_angles, detuning_rotations,
+        maximum_rabi_rate, maximum_detuning_rate)
+
+    shaped_pulses = ((detuning_rotations == 0) & ~np.isclose(rabi_rotations, 0.)
+                     & ~skipped)
+    half_pulse_durations[shaped_pulses] /= shape_area
+
+    pulse_start_ends = _get_shifted_pulse_start_ends(
+        sequence_duration, np.where(skipped, 0., offsets), half_pulse_durations)
+
+    if not _check_pulse_start_ends(pulse_start_ends):
 
         raise ArgumentsValueError('Pulse timing could not be properly deduced from '
                                   'the sequence operation offsets. Try increasing the '
@@ -262,33 +679,271 @@ def convert_dds_to_driven_controls(
             np.array([0., 0., 0., sequence_duration]), (1, 4))
         return DrivenControls(segments=control_segments, **kwargs)
 
-    control_segments = np.zeros((operations.shape[1]*2, 4))
-    pulse_segment_idx = 0
-    for op_idx in range(0, operations.shape[1]):
-
-        if operations[3, op_idx] == 0.0:
-            control_segments[pulse_segment_idx, 0:3] = [
-                maximum_rabi_rate * np.cos(operations[2, op_idx]),
-                maximum_rabi_rate * np.sin(operations[2, op_idx]),
-                0.]
-            control_segments[pulse_segment_idx, 3] = (pulse_start_ends[op_idx, 1] -
-                                                      pulse_start_ends[op_idx, 0])
-        else:
-            control_segments[pulse_segment_idx, 0:3] = [0., 0., operations[3, op_idx]]
-            control_segments[pulse_segment_idx, 3] = (pulse_start_ends[op_idx, 1] -
-                                                      pulse_start_ends[op_idx, 0])
-
-        if op_idx != (operations.shape[1]-1):
-            control_segments[pulse_segment_idx+1, 0:3] = np.array([0, 0, 0])
-            control_segments[pulse_segment_idx+1, 3] = (pulse_start_ends[op_idx+1, 0] -
-                                                        pulse_start_ends[op_idx, 1])
-        pulse_segment_idx += 2
+    # each operation is followed by the free evolution until the next operation
+    numbers_of_pulse_segments = np.where(shaped_pulses, resolution, 1)
+    first_segments = np.cumsum(numbers_of_pulse_segments + 1) - numbers_of_pulse_segments - 1
+    control_segments = np.zeros((np.sum(numbers_of_pulse_segments + 1), 4))
+
+    flat_pulses = ~shaped_pulses
+    flat_segments = control_segments[first_segments[flat_pulses]]
+    rabi_pulses = detuning_rotations[flat_pulses] == 0.
+    flat_segments[:, 0] = np.where(
+        rabi_pulses, maximum_rabi_rate * np.cos(azimuthal_angles[flat_pulses]), 0.)
+    flat_segments[:, 1] = np.where(
+        rabi_pulses, maximum_rabi_rate * np.sin(azimuthal_angles[flat_pulses]), 0.)
+    flat_segments[:, 2] = np.where(rabi_pulses, 0., detuning_rotations[flat_pulses])
+    flat_segments[:, 3] = (pulse_start_ends[flat_pulses, 1]
+                           - pulse_start_ends[flat_pulses, 0])
+    control_segments[first_segments[flat_pulses]] = flat_segments
+
+    shaped_rotations, template_indices = np.unique(rabi_rotations[shaped_pulses],
+                                                   return_inverse=True)
+    templates = [_get_pulse_template(rotation, maximum_rabi_rate, pulse_shape, resolution)
+                 for rotation in shaped_rotations]
+    if templates:
+        template_rabi_rates = np.stack([template[0] for template in templates])[template_indices]
+        template_durations = np.array([template[1] for template in templates])[template_indices]
+        shaped_azimuthal_angles = azimuthal_angles[shaped_pulses][:, None]
+
+        shaped_segments = first_segments[shaped_pulses][:, None] + np.arange(resolution)
+        control_segments[shaped_segments, 0] = (template_rabi_rates
+                                                * np.cos(shaped_azimuthal_angles))
+        control_segments[shaped_segments, 1] = (template_rabi_rates
+                                                * np.sin(shaped_azimuthal_angles))
+        control_segments[shaped_segments, 3] = template_durations[:, None]
+
+    control_segments[first_segments[1:] - 1, 3] = (pulse_start_ends[1:, 0]
+                                                   - pulse_start_ends[0:-1, 1])
 
     # almost there; let us check if there is any segments with durations = 0
-    segment_durations = control_segments[:, 3]
-    control_segments = control_segments[segment_durations != 0]
+    control_segments = control_segments[control_segments[:, 3] != 0]
+
     return DrivenControls(segments=control_segments, **kwargs)
 
 
+def _block_control_segments(sequence_duration, offsets, rabi_rotations, azimuthal_angles,
+                            detuning_rotations, maximum_rabi_rate, maximum_detuning_rate,
+                            block, end_pulses):
+
+    """Private function to prepare the control segments of a block of operations
+
+    Parameters
+    ----------
+    sequence_duration : float
+        Duration of the sequence
+    offsets : numpy.ndarray
+        The offsets of all the operations
+    rabi_rotations : numpy.ndarray
+        The rabi rotations of all the operations
+    azimuthal_angles : numpy.ndarray
+        The azimuthal angles of all the operations
+    detuning_rotations : numpy.ndarray
+        The detuning rotations of all the operations
+    maximum_rabi_rate : float
+        Maximum Rabi Rate
+    maximum_detuning_rate : float
+        Maximum Detuning Rate
+    block : slice
+        The operations of the block
+    end_pulses : numpy.ndarray
+        The start and end times of the first and last pulses of the sequence
+
+    Returns
+    -------
+    tuple
+        The start and end times of the pulses of the block and the next pulse, and the
+        control segments of the block, including the free evolution after its last pulse,
+        with the segments of zero duration removed
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when the pulse timing of the block is invalid.
+    """
+
+    number_of_offsets = offsets.shape[0]
+    operations = slice(block.start, min(block.stop + 1, number_of_offsets))
+
+    block_rabi_rotations = np.asarray(rabi_rotations[operations], dtype=np.float)
+    block_azimuthal_angles = np.asarray(azimuthal_angles[operations], dtype=np.float)
+    block_detuning_rotations = np.asarray(detuning_rotations[operations], dtype=np.float)
+
+    if not _check_valid_operation(rabi_rotations=block_rabi_rotations,
+                                  detuning_rotations=block_detuning_rotations):
+        raise ArgumentsValueError(
+            'Sequence operation includes rabi rotation and '
+            'detuning rotation at the same instance.',
+            {'maximum_rabi_rate': maximum_rabi_rate,
+             'maximum_detuning_rate': maximum_detuning_rate},
+            extras={'block_start': block.start})
+
+    half_pulse_durations, skipped = _get_half_pulse_durations(
+        np.asarray(offsets[operations], dtype=np.float), block_rabi_rotations,
+        block_azimuthal_angles, block_detuning_rotations,
+        maximum_rabi_rate, maximum_detuning_rate)
+
+    pulse_mid_points = np.where(skipped, 0., offsets[operations])
+    pulse_start_ends = np.stack([pulse_mid_points - half_pulse_durations,
+                                 pulse_mid_points + half_pulse_durations], axis=-1)
+
+    if operations.start == 0:
+        pulse_start_ends[0] = end_pulses[0]
+    if operations.stop == number_of_offsets:
+        pulse_start_ends[-1] = end_pulses[-1]
+
+    if not _check_pulse_start_ends(pulse_start_ends):
+        raise ArgumentsValueError('Pulse timing could not be properly deduced from '
+                                  'the sequence operation offsets. Try increasing the '
+                                  'maximum rabi rate or maximum detuning rate.',
+                                  {'maximum_rabi_rate': maximum_rabi_rate,
+                                   'maximum_detuning_rate': maximum_detuning_rate},
+                                  extras={'block_start': block.start,
+                                          'deduced_pulse_start_timing': pulse_start_ends[:, 0],
+                                          'deduced_pulse_end_timing': pulse_start_ends[:, 1],
+                                          'sequence_duration': sequence_duration})
+
+    control_segments = _get_control_segments(
+        pulse_start_ends, block_azimuthal_angles, block_detuning_rotations,
+        maximum_rabi_rate)[0:2 * (block.stop - block.start)]
+
+    return pulse_start_ends, control_segments[control_segments[:, 3] != 0]
+
+
+def iterate_driven_control_segments(dynamic_decoupling_sequence=None,
+                                    maximum_rabi_rate=2*np.pi,
+                                    maximum_detuning_rate=2*np.pi,
+                                    block_size=4096,
+                                    duration=None,
+                                    offsets=None,
+                                    rabi_rotations=None,
+                                    azimuthal_angles=None,
+                                    detuning_rotations=None):
+
+    """Converts a sequence to the segments of a driven control, block by block.
+
+    The operations are converted in blocks, so that the memory used does not grow with
+    the number of offsets. The operations can be supplied as a DynamicDecouplingSequence
+    or, for sequences above the bounds of DynamicDecouplingSequence, as arrays (for
+    example, ``numpy.memmap`` arrays of operations stored on disk).
+
+    Parameters
+    ----------
+    dynamic_decoupling_sequence : DynamicDecouplingSequence, optional
+        The sequence; Defaults to None, in which case the duration and operations
+        must be supplied instead
+    maximum_rabi_rate : float, optional
+        Maximum Rabi Rate; Defaults to 2*pi
+    maximum_detuning_rate : float, optional
+        Maximum Detuning Rate; Defaults to 2*pi
+    block_size : int, optional
+        Number of operations converted per block; Defaults to 4096
+    duration : float, optional
+        Duration of the sequence; Defaults to None
+    offsets : numpy.ndarray, optional
+        The offsets of the operations, sorted in increasing order; Defaults to None
+    rabi_rotations : numpy.ndarray, optional
+        The rabi rotations of the operations; Defaults to None
+    azimuthal_angles : numpy.ndarray, optional
+        The azimuthal angles of the operations; Defaults to None
+    detuning_rotations : numpy.ndarray, optional
+        The detuning rotations of the operations; Defaults to None
+
+    Yields
+    ------
+    numpy.ndarray
+        The next control segments, at most 2 * block_size of them, each formatted as
+        [amplitude_x, amplitude_y, amplitude_z, duration]
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid or a valid driven control cannot be
+        created from the sequence parameters, maximum rabi rate and maximum detuning
+        rate provided.
+
+    Notes
+    -----
+    The segments are the same as the segments of the driven control returned by
+    `convert_dds_to_driven_controls`, including the shifts of the pulses at either
+    end of the sequence. The operations supplied as arrays are converted as they
+    are; no operations are added at the start and end of the sequence as is done
+    by DynamicDecouplingSequence.
+
+    The pulse timing is checked block by block, so an invalid pulse timing is only
+    reported once the segments before it have been yielded. The segments can be
+    written to a file as they are generated, e.g.
+    ``for segments in iterate_driven_control_segments(...): numpy.savetxt(handle, segments)``.
+    """
+
+    if dynamic_decoupling_sequence is not None:
+        duration = dynamic_decoupling_sequence.duration
+        offsets = dynamic_decoupling_sequence.offsets
+        rabi_rotations = dynamic_decoupling_sequence.rabi_rotations
+        azimuthal_angles = dynamic_decoupling_sequence.azimuthal_angles
+        detuning_rotations = dynamic_decoupling_sequence.detuning_rotations
+
+    if duration is None or duration <= 0.:
+        raise ArgumentsValueError('Sequence duration must be above zero.',
+                                  {'duration': duration})
+
+    operations = {'offsets': offsets,
+                  'rabi_rotations': rabi_rotations,
+                  'azimuthal_angles': azimuthal_angles,
+                  'detuning_rotations': detuning_rotations}
+    if any(values is None or np.ndim(values) != 1 or len(values) != len(offsets)
+           or len(values) == 0 for values in operations.values()):
+        raise ArgumentsValueError('Offsets, rabi rotations, azimuthal angles and detuning '
+                                  'rotations must be supplied as non-empty arrays of '
+                                  'the same length.',
+                                  {key: None if values is None else np.shape(values)
+                                   for key, values in operations.items()})
+
+    _check_maximum_rotation_rate(maximum_rabi_rate, maximum_detuning_rate)
+
+    block_size = int(block_size)
+    if block_size <= 0:
+        raise ArgumentsValueError('Block size must be above zero.',
+                                  {'block_size': block_size})
+
+    number_of_offsets = len(offsets)
+
+    # the first and last pulses are shifted to fall within the sequence duration
+    end_operations = np.unique([0, number_of_offsets - 1])
+    end_pulses = _get_pulse_start_ends(
+        duration, *[np.asarray(values[end_operations], dtype=np.float)
+                    for values in operations.values()],
+        maximum_rabi_rate=maximum_rabi_rate, maximum_detuning_rate=maximum_detuning_rate)
+
+    # the blocks are not yielded while the sequence could still be a free evolution;
+    # rather than holding their segments back, they are converted again once a pulse
+    # is found, so that at most one block of segments is held at a time
+    free_evolution = True
+
+    for start in range(0, number_of_offsets, block_size):
+        block = slice(start, min(start + block_size, number_of_offsets))
+        pulse_start_ends, control_segments = _block_control_segments(
+            duration, offsets, rabi_rotations, azimuthal_angles, detuning_rotations,
+            maximum_rabi_rate, maximum_detuning_rate, block, end_pulses)
+
+        if free_evolution:
+            free_evolution = np.allclose(pulse_start_ends, 0.0)
+            if free_evolution:
+                continue
+            for pending_start in range(0, start, block_size):
+                _, pending_segments = _block_control_segments(
+                    duration, offsets, rabi_rotations, azimuthal_angles, detuning_rotations,
+                    maximum_rabi_rate, maximum_detuning_rate,
+                    slice(pending_start, pending_start + block_size), end_pulses)
+                if pending_segments.shape[0] > 0:
+                    yield pending_segments
+
+        if control_segments.shape[0] > 0:
+            yield control_segments
+
+    if free_evolution:
+        # the original sequence should be a free evolution
+        yield np.reshape(np.array([0., 0., 0., duration]), (1, 4))
+
+
 if __name__ == '__main__':
     pass
@@ -18,6 +18,8 @@ sequences.sequences
 ===================
 """
 
+import hashlib
+
 import numpy as np
 
 from qctrlopencontrols.base import QctrlObject
@@ -30,6 +32,39 @@ from .constants import (UPPER_BOUND_OFFSETS, MATPLOTLIB)
 from .driven_controls import convert_dds_to_driven_controls
 
 
+_SEQUENCE_ATTRIBUTES = ['duration', 'offsets', 'rabi_rotations', 'azimuthal_angles',
+                        'detuning_rotations', 'pre_post_rotation', 'name']
+
+
+def _pretty_values(values, scale, summarize, edge_items):
+    """Private function to format the scaled values of a sequence array.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The values to be formatted
+    scale : float
+        The values are divided by the scale before formatting
+    summarize : bool
+        If True, only the first and last `edge_items` values are formatted
+    edge_items : int
+        Number of values formatted at either end of a summarised array
+
+    Returns
+    -------
+    str
+        The comma separated values
+    """
+
+    if not summarize:
+        return ','.join(str(value) for value in values / scale)
+
+    head = [str(value) for value in values[:edge_items] / scale]
+    tail = [str(value) for value in values[-edge_items:] / scale]
+
+    return ','.join(head + ['...'] + tail)
+
+
 class DynamicDecouplingSequence(QctrlObject):   #pylint: disable=too-few-public-methods
     """
     Create a dynamic decoupling sequence.
@@ -81,14 +116,7 @@ class DynamicDecouplingSequence(QctrlObject):   #pylint: disable=too-few-public-
                  name=None
                  ):
 
-        super(DynamicDecouplingSequence, self).__init__([
-            'duration',
-            'offsets',
-            'rabi_rotations',
-            'azimuthal_angles',
-            'detuning_rotations',
-            'pre_post_rotation',
-            'name'])
+        super(DynamicDecouplingSequence, self).__init__(list(_SEQUENCE_ATTRIBUTES))
 
         self.duration = duration
         if self.duration <= 0.:
@@ -180,6 +208,33 @@ class DynamicDecouplingSequence(QctrlObject):   #pylint: disable=too-few-public-
         if self.name is not None:
             self.name = str(self.name)
 
+    def get_fingerprint(self):
+
+        """Gets a fingerprint of the content of the sequence.
+
+        Returns
+        -------
+        str
+            Hexadecimal SHA-1 digest of the duration, the pre-post rotation flag and the
+            offsets, rabi rotations, azimuthal angles and detuning rotations.
+
+        Notes
+        -----
+        The name of the sequence is not part of the fingerprint; sequences
+        with identical operations share a fingerprint regardless of their names.
+        """
+
+        digest = hashlib.sha1()
+        digest.update(np.array([self.duration], dtype='<f8').tobytes())
+        digest.update(b'\x01' if self.pre_post_rotation else b'\x00')
+        for values in [self.offsets, self.rabi_rotations,
+                       self.azimuthal_angles, self.detuning_rotations]:
+            values = np.ascontiguousarray(values, dtype='<f8')
+            digest.update(np.array([values.shape[0]], dtype='<u8').tobytes())
+            digest.update(values.tobytes())
+
+        return digest.hexdigest()
+
     def get_plot_formatted_arrays(self, plot_format=MATPLOTLIB):
 
         """Gets arrays for plotting a pulse.
@@ -245,8 +300,19 @@ class DynamicDecouplingSequence(QctrlObject):   #pylint: disable=too-few-public-
 
     def __str__(self):
         """Prepares a friendly string format for a Dynamic Decoupling Sequence
+
+        Notes
+        -----
+        If the sequence has more offsets than the numpy print threshold, only the
+        leading and trailing values of each array are formatted and the number of offsets
+        is reported. The full string can be obtained by raising the threshold, e.g. within
+        ``numpy.printoptions(threshold=sys.maxsize)``.
         """
 
+        print_options = np.get_printoptions()
+        summarize = self.number_of_offsets > print_options['threshold']
+        edge_items = print_options['edgeitems']
+
         dd_sequence_string = list()
 
         if self.name is not None:
@@ -254,26 +320,25 @@ class DynamicDecouplingSequence(QctrlObject):   #pylint: disable=too-few-public-
 
         dd_sequence_string.append('Duration = {}'.format(self.duration))
 
-        pretty_offset = [str(offset/self.duration) for offset in list(self.offsets)]
-        pretty_offset = ','.join(pretty_offset)
+        if summarize:
+            dd_sequence_string.append('Number of offsets = {}'.format(self.number_of_offsets))
+
+        pretty_offset = _pretty_values(self.offsets, self.duration, summarize, edge_items)
 
         dd_sequence_string.append('Offsets = [{}] x {}'.format(pretty_offset, self.duration))
 
-        pretty_rabi_rotations = [
-            str(rabi_rotation/np.pi) for rabi_rotation in list(self.rabi_rotations)]
-        pretty_rabi_rotations = ','.join(pretty_rabi_rotations)
+        pretty_rabi_rotations = _pretty_values(
+            self.rabi_rotations, np.pi, summarize, edge_items)
 
         dd_sequence_string.append('Rabi Rotations = [{}] x pi'.format(pretty_rabi_rotations))
 
-        pretty_azimuthal_angles = [
-            str(azimuthal_angle/np.pi) for azimuthal_angle in list(self.azimuthal_angles)]
-        pretty_azimuthal_angles = ','.join(pretty_azimuthal_angles)
+        pretty_azimuthal_angles = _pretty_values(
+            self.azimuthal_angles, np.pi, summarize, edge_items)
 
         dd_sequence_string.append('Azimuthal Angles = [{}] x pi'.format(pretty_azimuthal_angles))
 
-        pretty_detuning_rotations = [
-            str(detuning_rotation/np.pi) for detuning_rotation in list(self.detuning_rotations)]
-        pretty_detuning_rotations = ','.join(pretty_detuning_rotations)
+        pretty_detuning_rotations = _pretty_values(
+            self.detuning_rotations, np.pi, summarize, edge_items)
 
         dd_sequence_string.append(
             'Detuning Rotations = [{}] x pi'.format(pretty_detuning_rotations))
@@ -341,5 +406,91 @@ class DynamicDecouplingSequence(QctrlObject):   #pylint: disable=too-few-public-
                                       coordinates=coordinates)
 
 
+def _new_padded_sequence(duration, offsets, rabi_rotations, azimuthal_angles,
+                         detuning_rotations, pre_post_rotation=False, name=None):
+
+    """Private function to create a sequence from arrays that are already valid and
+    padded, without checking or copying them
+
+    Parameters
+    ----------
+    duration : float
+        The duration of the sequence
+    offsets : numpy.ndarray
+        The offsets, starting at 0 and ending at the duration
+    rabi_rotations : numpy.ndarray
+        The rabi rotations at each offset
+    azimuthal_angles : numpy.ndarray
+        The azimuthal angles at each offset
+    detuning_rotations : numpy.ndarray
+        The detuning rotations at each offset
+    pre_post_rotation : bool, optional
+        The pre_post_rotation of the sequence, already applied to the rabi rotations
+        at its start and end; Defaults to False
+    name : str, optional
+        Name of the sequence; Defaults to None
+
+    Returns
+    -------
+    DynamicDecouplingSequence
+        The sequence, owning the arrays
+    """
+
+    sequence = DynamicDecouplingSequence.__new__(DynamicDecouplingSequence)
+    QctrlObject.__init__(sequence, list(_SEQUENCE_ATTRIBUTES))
+
+    sequence.duration = duration
+    sequence.offsets = offsets
+    sequence.rabi_rotations = rabi_rotations
+    sequence.azimuthal_angles = azimuthal_angles
+    sequence.detuning_rotations = detuning_rotations
+    sequence.pre_post_rotation = pre_post_rotation
+    sequence.number_of_offsets = len(offsets)
+    sequence.name = None if name is None else str(name)
+
+    return sequence
+
+
+def _as_sequence_list(dynamic_decoupling_sequences):
+
+    """Private function to prepare a list of sequences from a sequence
+    or a collection of sequences
+
+    Parameters
+    ----------
+    dynamic_decoupling_sequences : DynamicDecouplingSequence or list
+        A sequence or a list of sequences
+
+    Returns
+    -------
+    tuple
+        The list of sequences and a bool that is True if a single sequence was supplied
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if any of the sequences is not a DynamicDecouplingSequence
+    """
+
+    if isinstance(dynamic_decoupling_sequences, DynamicDecouplingSequence):
+        return [dynamic_decoupling_sequences], True
+
+    if dynamic_decoupling_sequences is None:
+        dynamic_decoupling_sequences = []
+    sequences = list(dynamic_decoupling_sequences)
+
+    if not sequences:
+        raise ArgumentsValueError('At least one dynamic decoupling sequence must be supplied.',
+                                  {'dynamic_decoupling_sequences': dynamic_decoupling_sequences})
+
+    for sequence in sequences:
+        if not isinstance(sequence, DynamicDecouplingSequence):
+            raise ArgumentsValueError('Dynamic decoupling sequence must be of '
+                                      'DynamicDecouplingSequence type.',
+                                      {'type(dynamic_decoupling_sequence)': type(sequence)})
+
+    return sequences, False
+
+
 if __name__ == '__main__':
     pass
@@ -0,0 +1,717 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+==========================
+sequences.filter_functions
+==========================
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+
+import numpy as np
+
+from qctrlopencontrols.exceptions import ArgumentsValueError
+
+from .dynamic_decoupling_sequence import DynamicDecouplingSequence, _as_sequence_list
+from .predefined import new_predefined_dds
+
+# maximum number of phase factors evaluated at once
+_MAXIMUM_CHUNK_ELEMENTS = 2 ** 22
+
+
+def _pi_pulse_mask(rabi_rotations):
+
+    """Private function to find the operations that flip the toggling frame
+
+    Parameters
+    ----------
+    rabi_rotations : numpy.ndarray
+        The rabi rotations of a sequence
+
+    Returns
+    -------
+    numpy.ndarray
+        Boolean array; True for the rabi rotations that are odd multiples of pi
+    """
+
+    return np.isclose(np.mod(rabi_rotations, 2 * np.pi), np.pi)
+
+
+def _switching_times(sequences):
+
+    """Private function to collect the switching times of the toggling frame
+    for a batch of sequences
+
+    Parameters
+    ----------
+    sequences : list
+        List of DynamicDecouplingSequence
+
+    Returns
+    -------
+    tuple
+        The switching times of all the sequences, including the start and end of each
+        sequence, as a flat array, and the array of indices at which the times of
+        each sequence start (with the total number of times appended).
+    """
+
+    pulse_times = [sequence.offsets[_pi_pulse_mask(sequence.rabi_rotations)]
+                   for sequence in sequences]
+    counts = np.array([times.shape[0] + 2 for times in pulse_times], dtype=np.int64)
+    indices = np.concatenate(([0], np.cumsum(counts)))
+
+    times = np.zeros((indices[-1],))
+    times[indices[1:] - 1] = [sequence.duration for sequence in sequences]
+    if indices[-1] > 2 * len(sequences):
+        interior = np.ones((indices[-1],), dtype=bool)
+        interior[indices[:-1]] = False
+        interior[indices[1:] - 1] = False
+        times[interior] = np.concatenate(pulse_times)
+
+    return times, indices
+
+
+def _switching_coefficients(indices):
+
+    """Private function to calculate the coefficients of the phase factors
+    at the switching times
+
+    Parameters
+    ----------
+    indices : numpy.ndarray
+        The indices at which the switching times of each sequence start
+        (with the total number of times appended)
+
+    Returns
+    -------
+    numpy.ndarray
+        The coefficient of the phase factor at each switching time
+
+    Notes
+    -----
+    With switching times :math:`t_0=0, t_1, \\ldots, t_m=\\tau` and the switching function
+    :math:`y_k=(-1)^k` on :math:`[t_k, t_{k+1}]`, the sum
+    :math:`\\sum_k y_k (e^{i\\omega t_{k+1}} - e^{i\\omega t_k})` has the coefficient
+    :math:`-1` at :math:`t_0`, :math:`2(-1)^{j-1}` at :math:`t_j` and :math:`(-1)^{m-1}`
+    at :math:`t_m`.
+    """
+
+    local_index = np.arange(indices[-1]) - np.repeat(indices[:-1], np.diff(indices))
+    coefficients = 2. * (-1.) ** (local_index - 1)
+
+    coefficients[indices[:-1]] = -1.
+    coefficients[indices[1:] - 1] *= 0.5
+
+    return coefficients
+
+
+def calculate_filter_function(dynamic_decoupling_sequences=None,
+                              angular_frequencies=None,
+                              frequency_chunk_size=None):
+
+    """Calculates the dephasing filter function of ideal dynamic decoupling sequences.
+
+    Parameters
+    ----------
+    dynamic_decoupling_sequences : DynamicDecouplingSequence or list
+        A sequence or a list of sequences; the sequences can have different
+        numbers of offsets and different durations. Defaults to None
+    angular_frequencies : numpy.ndarray
+        The angular frequencies at which the filter function is evaluated;
+        Defaults to None
+    frequency_chunk_size : int, optional
+        Number of frequencies evaluated at once; Defaults to None, in which case the
+        chunk size is chosen to bound the size of the intermediate arrays.
+
+    Returns
+    -------
+    numpy.ndarray
+        The filter function at each frequency. If a single sequence is supplied, the shape
+        is (number_of_frequencies,); otherwise (number_of_sequences, number_of_frequencies).
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+
+    Notes
+    -----
+    The operations are treated as instantaneous. Every rabi rotation that is an
+    odd multiple of :math:`\\pi` flips the sign of the toggling-frame switching function
+    :math:`y(t)`; all other operations (including the :math:`\\pi/2` pre-post rotations and
+    detuning rotations) leave it unchanged. With switching times
+    :math:`t_0=0 < t_1 < \\ldots < t_m=\\tau` the filter function is
+
+    .. math::
+
+        F(\\omega) = \\left|\\sum_{k=0}^{m-1} (-1)^k
+        \\left(e^{i\\omega t_{k+1}} - e^{i\\omega t_k}\\right)\\right|^2
+        = \\omega^2 \\left|\\int_0^\\tau y(t) e^{i\\omega t} dt\\right|^2
+
+    so that the coherence of a qubit subject to dephasing noise with power spectral
+    density :math:`S(\\omega)` decays as :math:`\\exp(-\\chi)`, with
+    :math:`\\chi = \\frac{1}{\\pi}\\int_0^\\infty S(\\omega) F(\\omega)/\\omega^2 d\\omega`.
+    """
+
+    sequences, single_sequence = _as_sequence_list(dynamic_decoupling_sequences)
+    angular_frequencies = _check_angular_frequencies(angular_frequencies)
+
+    filter_function = _filter_function_overlap(sequences, angular_frequencies,
+                                               frequency_chunk_size=frequency_chunk_size)
+
+    if single_sequence:
+        return filter_function[0]
+
+    return filter_function
+
+
+def _check_angular_frequencies(angular_frequencies):
+
+    """Private function to check the angular frequencies
+
+    Parameters
+    ----------
+    angular_frequencies : numpy.ndarray
+        The angular frequencies
+
+    Returns
+    -------
+    numpy.ndarray
+        The angular frequencies as a 1D float array
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the angular frequencies are not supplied as a 1D array
+    """
+
+    if angular_frequencies is None:
+        raise ArgumentsValueError('Angular frequencies must be supplied.',
+                                  {'angular_frequencies': angular_frequencies})
+    angular_frequencies = np.asarray(angular_frequencies, dtype=np.float)
+    if angular_frequencies.ndim != 1:
+        raise ArgumentsValueError('Angular frequencies must be a 1D array.',
+                                  {'angular_frequencies': angular_frequencies},
+                                  extras={'shape': angular_frequencies.shape})
+
+    return angular_frequencies
+
+
+def _filter_function_overlap(sequences, angular_frequencies,
+                             noise_power_densities=None, frequency_chunk_size=None):
+
+    """Private function to calculate the filter function of a batch of sequences
+    or its overlap with a noise power spectral density
+
+    Parameters
+    ----------
+    sequences : list
+        List of DynamicDecouplingSequence
+    angular_frequencies : numpy.ndarray
+        The angular frequencies
+    noise_power_densities : numpy.ndarray, optional
+        The noise power spectral density at each angular frequency. If None, the filter
+        function is returned; otherwise the decay exponent :math:`\\chi`. Defaults to None
+    frequency_chunk_size : int, optional
+        Number of frequencies evaluated at once; Defaults to None
+
+    Returns
+    -------
+    numpy.ndarray
+        The filter functions, of shape (number_of_sequences, number_of_frequencies),
+        or the decay exponents, of shape (number_of_sequences,)
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the frequency chunk size is invalid
+    """
+
+    times, indices = _switching_times(sequences)
+    coefficients = _switching_coefficients(indices)
+
+    if frequency_chunk_size is None:
+        frequency_chunk_size = max(1, _MAXIMUM_CHUNK_ELEMENTS // times.shape[0])
+    frequency_chunk_size = int(frequency_chunk_size)
+    if frequency_chunk_size <= 0:
+        raise ArgumentsValueError('Frequency chunk size must be above zero.',
+                                  {'frequency_chunk_size': frequency_chunk_size})
+
+    filter_function = np.zeros((len(sequences), angular_frequencies.shape[0]))
+    for start in range(0, angular_frequencies.shape[0], frequency_chunk_size):
+        chunk = slice(start, start + frequency_chunk_size)
+        phases = np.outer(times, angular_frequencies[chunk])
+        real_part = np.add.reduceat(coefficients[:, np.newaxis] * np.cos(phases),
+                                    indices[:-1], axis=0)
+        imaginary_part = np.add.reduceat(coefficients[:, np.newaxis] * np.sin(phases),
+                                         indices[:-1], axis=0)
+        filter_function[:, chunk] = real_part ** 2 + imaginary_part ** 2
+
+    if noise_power_densities is None:
+        return filter_function
+
+    # F(w)/w^2 tends to the squared area of the switching function at w=0
+    zero_frequencies = angular_frequencies == 0.
+    squared_frequencies = np.where(zero_frequencies, 1., angular_frequencies ** 2)
+    filter_function = filter_function / squared_frequencies
+    if np.any(zero_frequencies):
+        areas = np.add.reduceat(coefficients * times, indices[:-1])
+        filter_function[:, zero_frequencies] = areas[:, np.newaxis] ** 2
+
+    return np.trapz(noise_power_densities * filter_function,
+                    angular_frequencies, axis=1) / np.pi
+
+
+def _decay_exponents(items, angular_frequencies, noise_power_densities):
+
+    """Private function to calculate the decay exponents of a chunk of sequences
+
+    Parameters
+    ----------
+    items : list
+        List of DynamicDecouplingSequence or of dicts of keyword arguments
+        of `new_predefined_dds`
+    angular_frequencies : numpy.ndarray
+        The angular frequencies
+    noise_power_densities : numpy.ndarray
+        The noise power spectral density at each angular frequency
+
+    Returns
+    -------
+    numpy.ndarray
+        The decay exponent of each sequence
+    """
+
+    sequences = [item if isinstance(item, DynamicDecouplingSequence)
+                 else new_predefined_dds(**item) for item in items]
+
+    return _filter_function_overlap(sequences, angular_frequencies,
+                                    noise_power_densities=noise_power_densities)
+
+
+def _noise_power_densities(noise_power_density, angular_frequencies):
+
+    """Private function to sample a noise power spectral density
+
+    Parameters
+    ----------
+    noise_power_density : numpy.ndarray or callable
+        The noise power spectral density sampled at the angular frequencies,
+        or a function of the angular frequencies
+    angular_frequencies : numpy.ndarray
+        The angular frequencies
+
+    Returns
+    -------
+    numpy.ndarray
+        The noise power spectral density at each angular frequency
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the noise power spectral density is invalid
+    """
+
+    if callable(noise_power_density):
+        noise_power_density = noise_power_density(angular_frequencies)
+
+    if noise_power_density is None:
+        raise ArgumentsValueError('Noise power spectral density must be supplied.',
+                                  {'noise_power_density': noise_power_density})
+
+    noise_power_density = np.asarray(noise_power_density, dtype=np.float)
+    if noise_power_density.shape != angular_frequencies.shape:
+        raise ArgumentsValueError('Noise power spectral density must be sampled at '
+                                  'the angular frequencies.',
+                                  {'noise_power_density': noise_power_density},
+                                  extras={'angular_frequencies': angular_frequencies})
+
+    return noise_power_density
+
+
+def estimate_dephasing_infidelity(dynamic_decoupling_sequences=None,
+                                  noise_power_density=None,
+                                  angular_frequencies=None):
+
+    """Estimates the infidelity of dynamic decoupling sequences subject to dephasing noise.
+
+    Parameters
+    ----------
+    dynamic_decoupling_sequences : DynamicDecouplingSequence or list
+        A sequence or a list of sequences; Defaults to None
+    noise_power_density : numpy.ndarray or callable
+        The noise power spectral density sampled at the angular frequencies, or a function
+        returning the power spectral density at an array of angular frequencies;
+        Defaults to None
+    angular_frequencies : numpy.ndarray
+        The angular frequencies over which the overlap with the filter function
+        is integrated; Defaults to None
+
+    Returns
+    -------
+    numpy.ndarray or float
+        The infidelity of each sequence; a float if a single sequence is supplied
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+
+    Notes
+    -----
+    The decay exponent :math:`\\chi = \\frac{1}{\\pi}\\int S(\\omega)F(\\omega)/\\omega^2
+    d\\omega` is integrated with the trapezoidal rule over the supplied frequencies, where
+    :math:`F` is the filter function calculated by `calculate_filter_function`. The
+    infidelity of a superposition state is then :math:`(1 - e^{-\\chi})/2`.
+    """
+
+    sequences, single_sequence = _as_sequence_list(dynamic_decoupling_sequences)
+    angular_frequencies = _check_angular_frequencies(angular_frequencies)
+    noise_power_densities = _noise_power_densities(noise_power_density, angular_frequencies)
+
+    decay_exponents = _filter_function_overlap(sequences, angular_frequencies,
+                                               noise_power_densities=noise_power_densities)
+    infidelities = 0.5 * (1. - np.exp(-decay_exponents))
+
+    if single_sequence:
+        return infidelities[0]
+
+    return infidelities
+
+
+def _expand_parameter_grid(parameter_grid):
+
+    """Private function to expand parameter grids into lists of keyword arguments
+
+    Parameters
+    ----------
+    parameter_grid : dict or list
+        A dict or a list of dicts of keyword arguments of `new_predefined_dds`.
+        List or tuple values are expanded into all their combinations.
+
+    Returns
+    -------
+    list
+        List of dicts of keyword arguments
+    """
+
+    if isinstance(parameter_grid, dict):
+        parameter_grid = [parameter_grid]
+
+    expanded_parameters = []
+    for grid in parameter_grid:
+        keys = list(grid.keys())
+        values = [grid[key] if isinstance(grid[key], (list, tuple, np.ndarray))
+                  else [grid[key]] for key in keys]
+        for combination in itertools.product(*values):
+            expanded_parameters.append(dict(zip(keys, combination)))
+
+    return expanded_parameters
+
+
+def rank_dds_by_dephasing_infidelity(noise_power_density=None,
+                                     angular_frequencies=None,
+                                     dynamic_decoupling_sequences=None,
+                                     parameter_grid=None,
+                                     max_workers=None,
+                                     chunk_size=64):
+
+    """Ranks dynamic decoupling sequences by their estimated infidelity
+    under a dephasing noise spectrum.
+
+    Parameters
+    ----------
+    noise_power_density : numpy.ndarray or callable
+        The noise power spectral density sampled at the angular frequencies, or a function
+        returning the power spectral density at an array of angular frequencies;
+        Defaults to None
+    angular_frequencies : numpy.ndarray
+        The angular frequencies over which the overlap with the filter function
+        is integrated; Defaults to None
+    dynamic_decoupling_sequences : list, optional
+        List of DynamicDecouplingSequence to be ranked; Defaults to None
+    parameter_grid : dict or list, optional
+        A dict or a list of dicts of keyword arguments of `new_predefined_dds`
+        (including 'scheme'). List or tuple values are expanded into all their combinations,
+        e.g. ``{'scheme': 'Uhrig single-axis', 'duration': 1e-3,
+        'number_of_offsets': [1, 2, 4, 8]}``. Defaults to None
+    max_workers : int, optional
+        If supplied, the sequences are distributed in chunks to a pool of this many
+        processes; Defaults to None, in which case the sequences are evaluated in
+        the current process.
+    chunk_size : int, optional
+        Number of sequences generated and evaluated per task; Defaults to 64
+
+    Returns
+    -------
+    list
+        One dict per sequence, in increasing order of infidelity, with keys
+        'rank', 'index' (position in `dynamic_decoupling_sequences` followed by the
+        expanded `parameter_grid`), 'name', 'parameters' (the keyword arguments
+        for sequences from the grid, None otherwise), 'decay_exponent' and 'infidelity'.
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+
+    Notes
+    -----
+    The infidelity is estimated as described in `estimate_dephasing_infidelity`.
+    The noise power spectral density is sampled once in the current process, so the
+    callable does not need to be picklable when a process pool is used.
+    """
+
+    angular_frequencies = _check_angular_frequencies(angular_frequencies)
+    noise_power_densities = _noise_power_densities(noise_power_density, angular_frequencies)
+
+    items = []
+    if dynamic_decoupling_sequences is not None:
+        items.extend(_as_sequence_list(dynamic_decoupling_sequences)[0])
+    if parameter_grid is not None:
+        items.extend(_expand_parameter_grid(parameter_grid))
+
+    if not items:
+        raise ArgumentsValueError('Sequences or a parameter grid must be supplied.',
+                                  {'dynamic_decoupling_sequences': dynamic_decoupling_sequences,
+                                   'parameter_grid': parameter_grid})
+
+    chunk_size = int(chunk_size)
+    if chunk_size <= 0:
+        raise ArgumentsValueError('Chunk size must be above zero.',
+                                  {'chunk_size': chunk_size})
+
+    chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+
+    if max_workers is None or len(chunks) == 1:
+        decay_exponents = [_decay_exponents(chunk, angular_frequencies, noise_power_densities)
+                           for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            decay_exponents = list(executor.map(
+                _decay_exponents, chunks,
+                itertools.repeat(angular_frequencies),
+                itertools.repeat(noise_power_densities)))
+
+    decay_exponents = np.concatenate(decay_exponents)
+    infidelities = 0.5 * (1. - np.exp(-decay_exponents))
+
+    ranking = []
+    for rank, index in enumerate(np.argsort(infidelities, kind='stable')):
+        item = items[index]
+        is_sequence = isinstance(item, DynamicDecouplingSequence)
+        ranking.append({
+            'rank': rank,
+            'index': int(index),
+            'name': item.name if is_sequence else item.get('name'),
+            'parameters': None if is_sequence else item,
+            'decay_exponent': decay_exponents[index],
+            'infidelity': infidelities[index]})
+
+    return ranking
+
+
+def _cumulative_signs(sequence):
+
+    """Private function to calculate the value of the switching function
+    after each operation of a sequence
+
+    Parameters
+    ----------
+    sequence : DynamicDecouplingSequence
+        The sequence
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of length number_of_offsets + 1; the first value is the switching function
+        before the first operation and entry k+1 the value after operation k.
+    """
+
+    signs = np.where(_pi_pulse_mask(sequence.rabi_rotations), -1., 1.)
+
+    return np.concatenate(([1.], np.cumprod(signs)))
+
+
+def _switching_function_values(sequence, cumulative_signs, times):
+
+    """Private function to evaluate the switching function of a sequence
+
+    Parameters
+    ----------
+    sequence : DynamicDecouplingSequence
+        The sequence
+    cumulative_signs : numpy.ndarray
+        The switching function after each operation, as returned by `_cumulative_signs`
+    times : numpy.ndarray
+        The times at which the switching function is evaluated
+
+    Returns
+    -------
+    numpy.ndarray
+        The switching function at the times; zero outside the sequence duration
+    """
+
+    values = cumulative_signs[np.searchsorted(sequence.offsets, times, side='right')]
+    values[(times < 0.) | (times > sequence.duration)] = 0.
+
+    return values
+
+
+def sample_switching_function(dynamic_decoupling_sequences=None, sample_times=None):
+
+    """Samples the toggling-frame switching function of ideal dynamic decoupling sequences.
+
+    Parameters
+    ----------
+    dynamic_decoupling_sequences : DynamicDecouplingSequence or list
+        A sequence or a list of sequences; Defaults to None
+    sample_times : numpy.ndarray
+        The times at which the switching function is sampled; Defaults to None
+
+    Returns
+    -------
+    numpy.ndarray
+        The switching function at the sample times. If a single sequence is supplied,
+        the shape is (number_of_times,); otherwise (number_of_sequences, number_of_times).
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+
+    Notes
+    -----
+    The switching function :math:`y(t)` starts at +1 and changes sign at every rabi
+    rotation that is an odd multiple of :math:`\\pi`, as described in
+    `calculate_filter_function`. At the offset of a pulse it takes the value after
+    the pulse. It is zero outside :math:`[0, \\tau]`.
+    """
+
+    sequences, single_sequence = _as_sequence_list(dynamic_decoupling_sequences)
+
+    if sample_times is None:
+        raise ArgumentsValueError('Sample times must be supplied.',
+                                  {'sample_times': sample_times})
+    sample_times = np.asarray(sample_times, dtype=np.float)
+    if sample_times.ndim != 1:
+        raise ArgumentsValueError('Sample times must be a 1D array.',
+                                  {'sample_times': sample_times},
+                                  extras={'shape': sample_times.shape})
+
+    # ragged layout of the offsets of all the sequences; the offsets and sample times are
+    # replaced by their ranks so that each sequence can be shifted exactly by its index
+    counts = np.array([sequence.offsets.shape[0] for sequence in sequences], dtype=np.int64)
+    indices = np.concatenate(([0], np.cumsum(counts)))
+    offsets = np.concatenate([sequence.offsets for sequence in sequences])
+    unique_values, ranks = np.unique(np.concatenate((offsets, sample_times)),
+                                     return_inverse=True)
+    shifts = unique_values.shape[0] * np.arange(len(sequences), dtype=np.int64)
+
+    offset_keys = np.repeat(shifts, counts) + ranks[:indices[-1]]
+    sample_keys = shifts[:, np.newaxis] + ranks[np.newaxis, indices[-1]:]
+    positions = np.searchsorted(offset_keys, sample_keys, side='right')
+
+    # number of sign flips before each position, reset at the start of every sequence
+    flips = np.concatenate(([0], np.cumsum(np.concatenate(
+        [_pi_pulse_mask(sequence.rabi_rotations) for sequence in sequences]))))
+    flip_counts = flips[positions] - flips[indices[:-1], np.newaxis]
+    switching_function = np.where(flip_counts % 2 == 0, 1., -1.)
+
+    durations = np.array([sequence.duration for sequence in sequences])
+    switching_function[(sample_times[np.newaxis, :] < 0.)
+                       | (sample_times[np.newaxis, :] > durations[:, np.newaxis])] = 0.
+
+    if single_sequence:
+        return switching_function[0]
+
+    return switching_function
+
+
+def iterate_switching_function(dynamic_decoupling_sequence=None,
+                               sample_times=None,
+                               time_step=None,
+                               chunk_size=2 ** 16):
+
+    """Samples the switching function of a sequence in chunks.
+
+    Exactly one of `sample_times` and `time_step` must be supplied. With `time_step`
+    the sample times are generated chunk by chunk, so that the memory used does not
+    depend on the number of samples.
+
+    Parameters
+    ----------
+    dynamic_decoupling_sequence : DynamicDecouplingSequence
+        The sequence; Defaults to None
+    sample_times : numpy.ndarray, optional
+        The times at which the switching function is sampled; Defaults to None
+    time_step : float, optional
+        If supplied, the switching function is sampled at the times
+        0, time_step, 2*time_step, ... up to the duration of the sequence;
+        Defaults to None
+    chunk_size : int, optional
+        Number of samples in each chunk; Defaults to 65536
+
+    Yields
+    ------
+    tuple
+        The sample times of the chunk and the switching function at those times
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+    """
+
+    if not isinstance(dynamic_decoupling_sequence, DynamicDecouplingSequence):
+        raise ArgumentsValueError('Dynamic decoupling sequence must be of '
+                                  'DynamicDecouplingSequence type.',
+                                  {'type(dynamic_decoupling_sequence)':
+                                   type(dynamic_decoupling_sequence)})
+    sequence = dynamic_decoupling_sequence
+
+    if (sample_times is None) == (time_step is None):
+        raise ArgumentsValueError('Exactly one of sample times or time step must be supplied.',
+                                  {'sample_times': sample_times, 'time_step': time_step})
+
+    chunk_size = int(chunk_size)
+    if chunk_size <= 0:
+        raise ArgumentsValueError('Chunk size must be above zero.',
+                                  {'chunk_size': chunk_size})
+
+    if time_step is not None:
+        if time_step <= 0.:
+            raise ArgumentsValueError('Time step must be above zero.',
+                                      {'time_step': time_step})
+        # the tolerance keeps the final sample when the duration is a multiple of the
+        # time step that is not exactly representable
+        number_of_samples = int(np.floor(sequence.duration / time_step * (1 + 1e-12))) + 1
+    else:
+        sample_times = np.asarray(sample_times, dtype=np.float)
+        number_of_samples = sample_times.shape[0]
+
+    cumulative_signs = _cumulative_signs(sequence)
+    for start in range(0, number_of_samples, chunk_size):
+        stop = min(start + chunk_size, number_of_samples)
+        if time_step is not None:
+            times = np.minimum(time_step * np.arange(start, stop), sequence.duration)
+        else:
+            times = sample_times[start:stop]
+        yield times, _switching_function_values(sequence, cumulative_signs, times)
+
+
+if __name__ == '__main__':
+    pass
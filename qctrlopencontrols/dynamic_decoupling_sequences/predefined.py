@@ -22,7 +22,6 @@ import numpy as np
 
 from qctrlopencontrols.exceptions import ArgumentsValueError
 
-
 from .constants import (RAMSEY, SPIN_ECHO, CARR_PURCELL,
                         CARR_PURCELL_MEIBOOM_GILL,
                         UHRIG_SINGLE_AXIS,
@@ -30,9 +29,37 @@ from .constants import (RAMSEY, SPIN_ECHO, CARR_PURCELL,
                         WALSH_SINGLE_AXIS,
                         QUADRATIC,
                         X_CONCATENATED,
-                        XY_CONCATENATED)
+                        XY_CONCATENATED,
+                        UPPER_BOUND_OFFSETS)
 
 from .dynamic_decoupling_sequence import DynamicDecouplingSequence
+from .scheme_registry import get_dds_scheme, register_dds_scheme
+from .templates import (_MAXIMUM_PALEY_ORDER,
+                        _get_relative_template,
+                        _carr_purcell_template,
+                        _carr_purcell_meiboom_gill_template,
+                        _uhrig_single_axis_template,
+                        _periodic_single_axis_template,
+                        _walsh_single_axis_template,
+                        _quadratic_template,
+                        _x_concatenated_template,
+                        _xy_concatenated_template)
+from .scheme_counts import (_number_of_ramsey_offsets,
+                            _number_of_spin_echo_offsets,
+                            _number_of_single_axis_offsets,
+                            _number_of_walsh_single_axis_offsets,
+                            _number_of_quadratic_offsets,
+                            _number_of_x_concatenated_offsets,
+                            _number_of_xy_concatenated_offsets,
+                            _number_of_ramsey_pulses,
+                            _number_of_spin_echo_pulses,
+                            _number_of_x_pulses,
+                            _number_of_y_pulses,
+                            _number_of_walsh_single_axis_pulses,
+                            _number_of_quadratic_pulses,
+                            _number_of_x_concatenated_pulses,
+                            _number_of_xy_concatenated_pulses,
+                            _maximum_order)
 
 
 def new_predefined_dds(scheme=SPIN_ECHO, **kwargs):
@@ -55,6 +82,7 @@ def new_predefined_dds(scheme=SPIN_ECHO, **kwargs):
         - 'Quadratic'
         - 'X concatenated'
         - 'XY concatenated'
+        and the schemes added with `register_dds_scheme`
     kwargs : dict, optional
         Additional keyword argument to create the sequence
 
@@ -69,43 +97,62 @@ def new_predefined_dds(scheme=SPIN_ECHO, **kwargs):
         Raised when an argument is invalid.
     """
 
-    if scheme == RAMSEY:
-        sequence = new_ramsey_sequence(**kwargs)
-    elif scheme == SPIN_ECHO:
-        sequence = new_spin_echo_sequence(**kwargs)
-    elif scheme == CARR_PURCELL:
-        sequence = new_carr_purcell_sequence(**kwargs)
-    elif scheme == CARR_PURCELL_MEIBOOM_GILL:
-        sequence = new_carr_purcell_meiboom_gill_sequence(**kwargs)
-    elif scheme == UHRIG_SINGLE_AXIS:
-        sequence = new_uhrig_single_axis_sequence(**kwargs)
-    elif scheme == PERIODIC_SINGLE_AXIS:
-        sequence = new_periodic_single_axis_sequence(**kwargs)
-    elif scheme == WALSH_SINGLE_AXIS:
-        sequence = new_walsh_single_axis_sequence(**kwargs)
-    elif scheme == QUADRATIC:
-        sequence = new_quadratic_sequence(**kwargs)
-    elif scheme == X_CONCATENATED:
-        sequence = new_x_concatenated_sequence(**kwargs)
-    elif scheme == XY_CONCATENATED:
-        sequence = new_xy_concatenated_sequence(**kwargs)
-    # Raise an error if the input sequence is not known
+    scheme = get_dds_scheme(scheme)
+    if scheme.generator is not None:
+        sequence = scheme.generator(**kwargs)
     else:
-        raise ArgumentsValueError(
-            'Unknown predefined sequence scheme. Allowed schemes are: '
-            + ', '.join([RAMSEY, SPIN_ECHO, CARR_PURCELL,
-                         CARR_PURCELL_MEIBOOM_GILL,
-                         UHRIG_SINGLE_AXIS,
-                         PERIODIC_SINGLE_AXIS,
-                         WALSH_SINGLE_AXIS,
-                         QUADRATIC,
-                         X_CONCATENATED,
-                         XY_CONCATENATED]) + '.',
-            {'sequence_name': scheme})
+        sequence = _new_sequence_from_template(scheme, **kwargs)
 
     return sequence
 
 
+def _new_sequence_from_template(scheme, duration=None, **kwargs):
+
+    """Private function to create a sequence of a registered scheme from its
+    relative template
+
+    Parameters
+    ----------
+    scheme : DynamicDecouplingScheme
+        The scheme, with a template function
+    duration : float, optional
+        Total duration of the sequence. Defaults to None
+    kwargs : dict
+        The order parameters of the scheme and additional keywords required by
+        qctrlopencontrols.sequences.DynamicDecouplingSequence
+
+    Returns
+    -------
+    qctrlopencontrols.sequences.DynamicDecouplingSequence
+        The sequence
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+    """
+
+    if duration is None:
+        duration = 1.
+    if duration <= 0.:
+        raise ArgumentsValueError(
+            'Sequence duration must be above zero:',
+            {'duration': duration})
+
+    parameters, kwargs = scheme.get_order_parameters(**kwargs)
+
+    offsets, rabi_rotations, azimuthal_angles, detuning_rotations = _get_relative_template(
+        scheme.name, scheme.template_function, *parameters)
+    offsets = duration * offsets
+
+    return DynamicDecouplingSequence(
+        duration=duration, offsets=offsets,
+        rabi_rotations=rabi_rotations,
+        azimuthal_angles=azimuthal_angles,
+        detuning_rotations=detuning_rotations,
+        **kwargs)
+
+
 def new_ramsey_sequence(duration=None, **kwargs):
 
     """Ramsey sequence
@@ -231,13 +278,9 @@ def new_carr_purcell_sequence(duration=None, number_of_offsets=None, **kwargs):
             'Number of offsets must be above zero:',
             {'number_of_offsets': number_of_offsets})
 
-    offsets = _carr_purcell_meiboom_gill_offsets(duration, number_of_offsets)
-    rabi_rotations = np.zeros(offsets.shape)
-    azimuthal_angles = np.zeros(offsets.shape)
-    detuning_rotations = np.zeros(offsets.shape)
-
-    # set all as X_pi
-    rabi_rotations[0:] = np.pi
+    offsets, rabi_rotations, azimuthal_angles, detuning_rotations = _get_relative_template(
+        CARR_PURCELL, _carr_purcell_template, number_of_offsets)
+    offsets = duration * offsets
 
     return DynamicDecouplingSequence(
         duration=duration, offsets=offsets,
@@ -285,15 +328,9 @@ def new_carr_purcell_meiboom_gill_sequence(duration=None,  # pylint: disable=inv
             'Number of offsets must be above zero:',
             {'number_of_offsets': number_of_offsets})
 
-    offsets = _carr_purcell_meiboom_gill_offsets(duration, number_of_offsets)
-
-    rabi_rotations = np.zeros(offsets.shape)
-    azimuthal_angles = np.zeros(offsets.shape)
-    detuning_rotations = np.zeros(offsets.shape)
-
-    # set all azimuthal_angles=pi/2, rabi_rotations = pi
-    rabi_rotations[0:] = np.pi
-    azimuthal_angles[0:] = np.pi/2
+    offsets, rabi_rotations, azimuthal_angles, detuning_rotations = _get_relative_template(
+        CARR_PURCELL_MEIBOOM_GILL, _carr_purcell_meiboom_gill_template, number_of_offsets)
+    offsets = duration * offsets
 
     return DynamicDecouplingSequence(
         duration=duration, offsets=offsets,
@@ -342,15 +379,9 @@ def new_uhrig_single_axis_sequence(duration=None, number_of_offsets=None, **kwar
             'Number of offsets must be above zero:',
             {'number_of_offsets': number_of_offsets})
 
-    offsets = _uhrig_single_axis_offsets(duration, number_of_offsets)
-
-    rabi_rotations = np.zeros(offsets.shape)
-    azimuthal_angles = np.zeros(offsets.shape)
-    detuning_rotations = np.zeros(offsets.shape)
-
-    # set all the azimuthal_angles as pi/2, rabi_rotations = pi
-    rabi_rotations[0:] = np.pi
-    azimuthal_angles[0:] = np.pi/2
+    offsets, rabi_rotations, azimuthal_angles, detuning_rotations = _get_relative_template(
+        UHRIG_SINGLE_AXIS, _uhrig_single_axis_template, number_of_offsets)
+    offsets = duration * offsets
 
     return DynamicDecouplingSequence(
         duration=duration, offsets=offsets,
@@ -400,18 +431,9 @@ def new_periodic_single_axis_sequence(duration=None,    # pylint: disable=invali
             'Number of offsets must be above zero:',
             {'number_of_offsets': number_of_offsets})
 
-    spacing = 1./(number_of_offsets+1)
-    # prepare the offsets for delta comb
-    deltas = [k*spacing for k in range(1, number_of_offsets+1)]
-    deltas = np.array(deltas)
-    offsets = duration * deltas
-
-    rabi_rotations = np.zeros(offsets.shape)
-    azimuthal_angles = np.zeros(offsets.shape)
-    detuning_rotations = np.zeros(offsets.shape)
-
-    # set all the rabi_rotations to X_pi
-    rabi_rotations[0:] = np.pi
+    offsets, rabi_rotations, azimuthal_angles, detuning_rotations = _get_relative_template(
+        PERIODIC_SINGLE_AXIS, _periodic_single_axis_template, number_of_offsets)
+    offsets = duration * offsets
 
     return DynamicDecouplingSequence(
         duration=duration, offsets=offsets,
@@ -457,37 +479,14 @@ def new_walsh_single_axis_sequence(duration=None,
     if paley_order is None:
         paley_order = 1
     paley_order = int(paley_order)
-    if paley_order < 1 or paley_order > 2000:
+    if paley_order < 1 or paley_order > _MAXIMUM_PALEY_ORDER:
         raise ArgumentsValueError(
-            'Paley order must be between 1 and 2000.',
+            'Paley order must be between 1 and {}.'.format(_MAXIMUM_PALEY_ORDER),
             {'paley_order': paley_order})
 
-    hamming_weight = int(np.floor(np.log2(paley_order))) + 1
-
-    samples = 2 ** hamming_weight
-
-    relative_offset = np.arange(1. / (2 * samples), 1., 1. / samples)
-
-    binary_string = np.binary_repr(paley_order)
-    binary_order = [int(binary_string[i]) for i in range(hamming_weight)]
-    walsh_array = np.ones([samples])
-    for i in range(hamming_weight):
-        walsh_array *= np.sign(np.sin(2 ** (i + 1) * np.pi
-                                      * relative_offset)) ** binary_order[hamming_weight - 1 - i]
-
-    walsh_relative_offsets = []
-    for i in range(samples - 1):
-        if walsh_array[i] != walsh_array[i + 1]:
-            walsh_relative_offsets.append((i + 1) * (1. / samples))
-    walsh_relative_offsets = np.array(walsh_relative_offsets, dtype=np.float)
-    offsets = duration * walsh_relative_offsets
-
-    rabi_rotations = np.zeros(offsets.shape)
-    azimuthal_angles = np.zeros(offsets.shape)
-    detuning_rotations = np.zeros(offsets.shape)
-
-    # set the rabi_rotations to X_pi
-    rabi_rotations[0:] = np.pi
+    offsets, rabi_rotations, azimuthal_angles, detuning_rotations = _get_relative_template(
+        WALSH_SINGLE_AXIS, _walsh_single_axis_template, paley_order)
+    offsets = duration * offsets
 
     return DynamicDecouplingSequence(
         duration=duration, offsets=offsets,
@@ -554,39 +553,9 @@ def new_quadratic_sequence(duration=None,
             {'number_inner_offsets': number_outer_offsets},
             extras={'duration': duration, 'number_inner_offsets': number_inner_offsets})
 
-    outer_offsets = _uhrig_single_axis_offsets(duration, number_outer_offsets)
-    outer_offsets = np.insert(outer_offsets, [0, outer_offsets.shape[0]], [0, duration])
-    starts = outer_offsets[0:-1]
-    ends = outer_offsets[1:]
-    inner_durations = ends - starts
-
-    # inner_offsets = np.zeros((number_outer_offsets + 1, number_inner_offsets))
-    offsets = np.zeros((inner_durations.shape[0], number_inner_offsets + 1))
-    for inner_duration_idx in range(inner_durations.shape[0]):
-        inn_off = _uhrig_single_axis_offsets(inner_durations[inner_duration_idx],
-                                             number_inner_offsets)
-        inn_off = inn_off + starts[inner_duration_idx]
-        offsets[inner_duration_idx, 0:number_inner_offsets] = inn_off
-    offsets[0:number_outer_offsets, -1] = outer_offsets[1:-1]
-
-    rabi_rotations = np.zeros(offsets.shape)
-    detuning_rotations = np.zeros(offsets.shape)
-
-    rabi_rotations[0:number_outer_offsets, -1] = np.pi
-    detuning_rotations[0:(number_outer_offsets + 1), 0:number_inner_offsets] = np.pi
-
-    # make all the arrays 1D;
-    offsets = np.reshape(offsets, (-1,))
-    rabi_rotations = np.reshape(rabi_rotations, (-1,))
-    detuning_rotations = np.reshape(detuning_rotations, (-1,))
-
-    # remove the last entry corresponding to the duration
-    offsets = offsets[0:-1]
-    rabi_rotations = rabi_rotations[0:-1]
-    detuning_rotations = detuning_rotations[0:-1]
-
-    # finally create the azimuthal angles as all zeros
-    azimuthal_angles = np.zeros(offsets.shape)
+    offsets, rabi_rotations, azimuthal_angles, detuning_rotations = _get_relative_template(
+        QUADRATIC, _quadratic_template, number_inner_offsets, number_outer_offsets)
+    offsets = duration * offsets
 
     return DynamicDecouplingSequence(
         duration=duration, offsets=offsets,
@@ -639,24 +608,9 @@ def new_x_concatenated_sequence(duration=1.0, concatenation_order=None, **kwargs
             {'concatenation_order': concatenation_order},
             extras={'duration': duration})
 
-    unit_spacing = duration / (2 ** concatenation_order)
-    cumulations = _concatenation_x(concatenation_order)
-
-    pos_cum = cumulations * unit_spacing
-    pos_cum_sum = np.cumsum(pos_cum)
-
-    values, counts = np.unique(pos_cum_sum, return_counts=True)
-
-    offsets = [values[i] for i in range(counts.shape[0]) if counts[i] % 2 == 0]
-
-    if concatenation_order % 2 == 1:
-        offsets = offsets[0:-1]
-
-    offsets = np.array(offsets)
-
-    rabi_rotations = np.pi * np.ones(offsets.shape)
-    azimuthal_angles = np.zeros(offsets.shape)
-    detuning_rotations = np.zeros(offsets.shape)
+    offsets, rabi_rotations, azimuthal_angles, detuning_rotations = _get_relative_template(
+        X_CONCATENATED, _x_concatenated_template, concatenation_order)
+    offsets = duration * offsets
 
     return DynamicDecouplingSequence(
         duration=duration, offsets=offsets,
@@ -709,96 +663,9 @@ def new_xy_concatenated_sequence(duration=1.0, concatenation_order=None, **kwarg
             {'concatenation_order': concatenation_order},
             extras={'duration': duration})
 
-    unit_spacing = duration / (2 ** (concatenation_order*2))
-    cumulations = _concatenation_xy(concatenation_order)
-
-    rabi_operations = cumulations[cumulations != -2]
-    rabi_operations = rabi_operations[rabi_operations != -3]
-    rabi_positions = np.zeros(rabi_operations.shape)
-    rabi_positions[rabi_operations != -1] = 1
-    rabi_positions = rabi_positions * unit_spacing
-    rabi_positions = np.cumsum(rabi_positions)
-
-    values, counts = np.unique(rabi_positions, return_counts=True)
-    rabi_offsets = [values[i] for i in range(counts.shape[0]) if counts[i] % 2 == 0]
-
-    azimuthal_operations = cumulations[cumulations != -1]
-    azimuthal_operations = azimuthal_operations[azimuthal_operations != -3]
-    azimuthal_positions = np.zeros(azimuthal_operations.shape)
-    azimuthal_positions[azimuthal_operations != -2] = 1
-    azimuthal_positions = azimuthal_positions * unit_spacing
-    azimuthal_positions = np.cumsum(azimuthal_positions)
-
-    values, counts = np.unique(azimuthal_positions, return_counts=True)
-    azimuthal_offsets = [values[i] for i in range(counts.shape[0]) if counts[i] % 2 == 0]
-
-    detuning_operations = cumulations[cumulations != -2]
-    detuning_operations = detuning_operations[detuning_operations != -1]
-    detuning_positions = np.zeros(detuning_operations.shape)
-    detuning_positions[detuning_operations != -3] = 1
-    detuning_positions = detuning_positions * unit_spacing
-    detuning_positions = np.cumsum(detuning_positions)
-
-    values, counts = np.unique(detuning_positions, return_counts=True)
-    detuning_offsets = [values[i] for i in range(counts.shape[0]) if counts[i] % 2 == 0]
-
-    # right now we have got all the offset positions separately; now have
-    # put then all together
-
-    offsets = np.zeros((len(rabi_offsets) + len(azimuthal_offsets) + len(detuning_offsets),))
-
-    rabi_rotations = np.zeros(offsets.shape)
-    azimuthal_angles = np.zeros(offsets.shape)
-    detuning_rotations = np.zeros(offsets.shape)
-
-    rabi_idx = 0
-    azimuthal_idx = 0
-
-    carr_idx = 0
-    while (rabi_idx < len(rabi_offsets) and
-           azimuthal_idx < len(azimuthal_offsets)):
-
-        if rabi_offsets[rabi_idx] < azimuthal_offsets[azimuthal_idx]:
-            rabi_rotations[carr_idx] = np.pi
-            offsets[carr_idx] = rabi_offsets[rabi_idx]
-            rabi_idx += 1
-        else:
-            azimuthal_angles[carr_idx] = np.pi / 2
-            rabi_rotations[carr_idx] = np.pi
-            offsets[carr_idx] = azimuthal_offsets[azimuthal_idx]
-            azimuthal_idx += 1
-        carr_idx += 1
-
-    if rabi_idx < len(rabi_offsets):
-
-        while rabi_idx < len(rabi_offsets):
-            rabi_rotations[carr_idx] = np.pi
-            offsets[carr_idx] = rabi_offsets[rabi_idx]
-            carr_idx += 1
-            rabi_idx += 1
-    if azimuthal_idx < len(azimuthal_offsets):
-        while azimuthal_idx < len(azimuthal_offsets):
-            azimuthal_angles[carr_idx] = np.pi / 2
-            rabi_rotations[carr_idx] = np.pi
-            offsets[carr_idx] = azimuthal_offsets[azimuthal_idx]
-            carr_idx += 1
-            azimuthal_idx += 1
-
-    # if there is any z-offset, add those too !!!
-    if detuning_offsets:
-        z_idx = 0
-        for carr_idx, offset in enumerate(offsets):
-            if offset > detuning_offsets[z_idx]:
-                offsets[carr_idx + 1:] = offsets[carr_idx:-1]
-                rabi_rotations[carr_idx + 1:] = rabi_rotations[carr_idx:-1]
-                azimuthal_angles[carr_idx + 1:] = azimuthal_angles[carr_idx:-1]
-                detuning_rotations[carr_idx] = np.pi
-                rabi_rotations[carr_idx] = 0
-                azimuthal_angles[carr_idx] = 0
-                offsets[carr_idx] = detuning_offsets[z_idx]
-                z_idx += 1
-            if z_idx >= len(detuning_offsets):
-                break
+    offsets, rabi_rotations, azimuthal_angles, detuning_rotations = _get_relative_template(
+        XY_CONCATENATED, _xy_concatenated_template, concatenation_order)
+    offsets = duration * offsets
 
     return DynamicDecouplingSequence(
         duration=duration, offsets=offsets,
@@ -808,121 +675,55 @@ def new_xy_concatenated_sequence(duration=1.0, concatenation_order=None, **kwarg
         **kwargs)
 
 
-def _carr_purcell_meiboom_gill_offsets(duration=1.0, number_of_offsets=1):
-
-    """Offset values for Carr-Purcell_Meiboom-Gill sequence.
-
-    Parameters
-    ----------
-    duration : float, optional
-        Duration of the total sequence; defaults to 1.0
-    number_of_offsets : int, optional
-        The number of offsets; defaults to 1
-
-    Returns
-    ------
-    numpy.ndarray
-        The offset values
-    """
-
-    spacing = 1./number_of_offsets
-    start = spacing * 0.5
-
-    # prepare the offsets for delta comb
-    deltas = spacing * np.arange(number_of_offsets)
-    deltas += start
-
-    offsets = deltas * duration
-
-    return offsets
-
-
-def _uhrig_single_axis_offsets(duration=1.0, number_of_offsets=1):
-
-    """Offset values for Uhrig Single Axis Sequence.
-
-    Parameters
-    ----------
-    duration : float, optional
-        Duration of the total sequence; defaults to 1.0
-    number_of_offsets : int, optional
-        The number of offsets; defaults to 1
-
-    Returns
-    ------
-    numpy.ndarray
-        The offset values
-    """
-
-    # prepare the offsets for delta comb
-    constant = 1./(2*number_of_offsets+2)
-    deltas = [(np.sin(np.pi * k * constant)) ** 2 for k in range(1, number_of_offsets+1)]
-    deltas = np.array(deltas)
-
-    offsets = duration * deltas
-
-    return offsets
-
-
-def _concatenation_x(concatenation_sequence=1):
-
-    """Private function to prepare the sequence of operations for x-concatenated
-    dynamical decoupling sequence
-
-    Parameters
-    ----------
-    concatenation_sequence : int, optional
-        Duration of the total sequence; defaults to 1
-
-    Returns
-    ------
-    numpy.ndarray
-        The offset values
-    """
-
-    if concatenation_sequence == 1:
-        return np.array([1, 0, 1, 0])
-
-    cumulated_operations = np.concatenate(
-        (_concatenation_x(concatenation_sequence - 1), np.array([0]),
-         _concatenation_x(concatenation_sequence - 1), np.array([0])), axis=0)
-    return cumulated_operations
-
-
-def _concatenation_xy(concatenation_sequence=1):
-
-    """Private function to prepare the sequence of operations for x-concatenated
-    dynamical decoupling sequence
-
-    Parameters
-    ----------
-    concatenation_sequence : int, optional
-        Duration of the total sequence; defaults to 1
-
-    Returns
-    ------
-    numpy.ndarray
-        The offset values
-    """
-
-    if concatenation_sequence == 1:
-        return np.array([1, -1, 1, -2, 1, -1, 1, -2])
-    cumulations = np.concatenate((_concatenation_xy(concatenation_sequence - 1),
-                                  np.array([-1])), axis=0)
-    cumulations = cumulations[0:-1]
-    cumulations[-1] = -3
-    cumulations = np.concatenate((cumulations, _concatenation_xy(concatenation_sequence - 1),
-                                  np.array([-2])), axis=0)
-    cumulations = cumulations[0:-2]
-    cumulations = np.concatenate((cumulations, _concatenation_xy(concatenation_sequence - 1),
-                                  np.array([-1])), axis=0)
-    cumulations = cumulations[0:-1]
-    cumulations[-1] = -3
-    cumulations = np.concatenate((cumulations, _concatenation_xy(concatenation_sequence - 1),
-                                  np.array([-2])), axis=0)
-    if cumulations[-1] == -2 and cumulations[-2] == -2:
-        cumulations = cumulations[0:-2]
-    return cumulations
+register_dds_scheme(RAMSEY, generator=new_ramsey_sequence,
+                    number_of_offsets=_number_of_ramsey_offsets,
+                    number_of_pulses=_number_of_ramsey_pulses)
+register_dds_scheme(SPIN_ECHO, generator=new_spin_echo_sequence,
+                    number_of_offsets=_number_of_spin_echo_offsets,
+                    number_of_pulses=_number_of_spin_echo_pulses)
+register_dds_scheme(CARR_PURCELL, generator=new_carr_purcell_sequence,
+                    template_function=_carr_purcell_template,
+                    parameters=[('number_of_offsets', 1, 1, UPPER_BOUND_OFFSETS)],
+                    number_of_offsets=_number_of_single_axis_offsets,
+                    number_of_pulses=_number_of_x_pulses)
+register_dds_scheme(CARR_PURCELL_MEIBOOM_GILL, generator=new_carr_purcell_meiboom_gill_sequence,
+                    template_function=_carr_purcell_meiboom_gill_template,
+                    parameters=[('number_of_offsets', 1, 1, UPPER_BOUND_OFFSETS)],
+                    number_of_offsets=_number_of_single_axis_offsets,
+                    number_of_pulses=_number_of_y_pulses)
+register_dds_scheme(UHRIG_SINGLE_AXIS, generator=new_uhrig_single_axis_sequence,
+                    template_function=_uhrig_single_axis_template,
+                    parameters=[('number_of_offsets', 1, 1, UPPER_BOUND_OFFSETS)],
+                    number_of_offsets=_number_of_single_axis_offsets,
+                    number_of_pulses=_number_of_y_pulses)
+register_dds_scheme(PERIODIC_SINGLE_AXIS, generator=new_periodic_single_axis_sequence,
+                    template_function=_periodic_single_axis_template,
+                    parameters=[('number_of_offsets', 1, 1, UPPER_BOUND_OFFSETS)],
+                    number_of_offsets=_number_of_single_axis_offsets,
+                    number_of_pulses=_number_of_x_pulses)
+register_dds_scheme(WALSH_SINGLE_AXIS, generator=new_walsh_single_axis_sequence,
+                    template_function=_walsh_single_axis_template,
+                    parameters=[('paley_order', 1, 1, _MAXIMUM_PALEY_ORDER)],
+                    number_of_offsets=_number_of_walsh_single_axis_offsets,
+                    number_of_pulses=_number_of_walsh_single_axis_pulses)
+register_dds_scheme(QUADRATIC, generator=new_quadratic_sequence,
+                    template_function=_quadratic_template,
+                    parameters=[('number_inner_offsets', 1, 1, (UPPER_BOUND_OFFSETS + 1) // 2 - 1),
+                                ('number_outer_offsets', 1, 1, (UPPER_BOUND_OFFSETS + 1) // 2 - 1)],
+                    number_of_offsets=_number_of_quadratic_offsets,
+                    number_of_pulses=_number_of_quadratic_pulses)
+register_dds_scheme(X_CONCATENATED, generator=new_x_concatenated_sequence,
+                    template_function=_x_concatenated_template,
+                    parameters=[('concatenation_order', 1, 1,
+                                 _maximum_order(_number_of_x_concatenated_offsets))],
+                    number_of_offsets=_number_of_x_concatenated_offsets,
+                    number_of_pulses=_number_of_x_concatenated_pulses)
+register_dds_scheme(XY_CONCATENATED, generator=new_xy_concatenated_sequence,
+                    template_function=_xy_concatenated_template,
+                    parameters=[('concatenation_order', 1, 1,
+                                 _maximum_order(_number_of_xy_concatenated_offsets))],
+                    number_of_offsets=_number_of_xy_concatenated_offsets,
+                    number_of_pulses=_number_of_xy_concatenated_pulses)
 
 
 if __name__ == '__main__':
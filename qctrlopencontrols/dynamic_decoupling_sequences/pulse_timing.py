@@ -0,0 +1,433 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+======================
+sequences.pulse_timing
+======================
+"""
+
+import numpy as np
+
+from qctrlopencontrols.exceptions import ArgumentsValueError
+
+from .driven_controls import _check_maximum_rotation_rate, _get_pulse_start_ends
+from .dynamic_decoupling_sequence import DynamicDecouplingSequence, _as_sequence_list
+
+# maximum number of pulse pairs compared at once
+_MAXIMUM_CHUNK_ELEMENTS = 2 ** 22
+
+
+def _pulse_parameters(sequences):
+
+    """Private function to gather the pulse parameters of a list of sequences
+
+    Parameters
+    ----------
+    sequences : list
+        List of DynamicDecouplingSequence
+
+    Returns
+    -------
+    dict
+        Flat arrays over the operations of all the sequences with the 'sequence_indices',
+        the pulse 'mid_points', the pulse 'sizes' (the half duration of each pulse is its
+        size divided by the maximum rabi or detuning rate) and a 'rabi_pulses' mask; the
+        arrays 'first' and 'last' with the flat index of the first and last operation of
+        each sequence, the 'durations' of the sequences and a 'valid' mask that is False
+        for the sequences that cannot be converted at any rate.
+
+    Notes
+    -----
+    The pulses are defined as in `convert_dds_to_driven_controls`.
+    """
+
+    numbers_of_offsets = np.array([sequence.number_of_offsets for sequence in sequences])
+    offsets = np.concatenate([sequence.offsets for sequence in sequences])
+    rabi_rotations = np.concatenate([sequence.rabi_rotations for sequence in sequences])
+    azimuthal_angles = np.concatenate([sequence.azimuthal_angles for sequence in sequences])
+    detuning_rotations = np.concatenate([sequence.detuning_rotations
+                                         for sequence in sequences])
+    sequence_indices = np.repeat(np.arange(len(sequences)), numbers_of_offsets)
+
+    skipped = np.isclose(offsets + rabi_rotations + azimuthal_angles + detuning_rotations, 0.)
+    rabi_pulses = detuning_rotations == 0
+    sizes = np.where(rabi_pulses,
+                     np.where(np.isclose(rabi_rotations, 0.), azimuthal_angles, rabi_rotations),
+                     detuning_rotations)
+    sizes = np.where(skipped, 0., 0.5 * sizes)
+
+    last = np.cumsum(numbers_of_offsets) - 1
+    first = last - numbers_of_offsets + 1
+
+    # simultaneous rabi and detuning rotations or pulses of negative duration
+    invalid_operations = ((rabi_rotations > 0.) & (detuning_rotations > 0.)) | (sizes < 0.)
+    valid = np.bincount(sequence_indices, weights=invalid_operations,
+                        minlength=len(sequences)) == 0
+
+    return {'sequence_indices': sequence_indices,
+            'mid_points': np.where(skipped, 0., offsets),
+            'sizes': sizes,
+            'rabi_pulses': rabi_pulses,
+            'first': first,
+            'last': last,
+            'durations': np.array([sequence.duration for sequence in sequences], dtype=np.float),
+            'valid': valid}
+
+
+def _timing_constraints(pulse_parameters):
+
+    """Private function to prepare the linear constraints on the inverse rates
+    that the pulses of the sequences do not overlap
+
+    Parameters
+    ----------
+    pulse_parameters : dict
+        The pulse parameters, as returned by `_pulse_parameters`
+
+    Returns
+    -------
+    tuple
+        The sequence index, the coefficient of the inverse maximum rabi rate, the
+        coefficient of the inverse maximum detuning rate and the bound of each
+        constraint. A pair of rates satisfies a constraint if the sum of the inverse
+        rates multiplied by their coefficients does not exceed the bound.
+
+    Notes
+    -----
+    Adjacent pulses with mid-points :math:`m_i < m_{i+1}` and half durations
+    :math:`h_i, h_{i+1}` do not overlap if :math:`h_i + h_{i+1} \\leq m_{i+1} - m_i`.
+    Since the first pulse is shifted to start at 0, and the last pulse to finish at the
+    sequence duration :math:`\\tau`, the pairs at either end of the sequence are also
+    constrained by :math:`2h_0 + h_1 \\leq m_1` and :math:`h_{n-1} + 2h_n \\leq \\tau - m_{n-1}`
+    respectively, and by :math:`2h_0 + 2h_1 \\leq \\tau` if the sequence has two pulses.
+    """
+
+    sequence_indices = pulse_parameters['sequence_indices']
+    mid_points = pulse_parameters['mid_points']
+    sizes = pulse_parameters['sizes']
+    rabi_pulses = pulse_parameters['rabi_pulses']
+    durations = pulse_parameters['durations']
+
+    pair_starts = np.ones(mid_points.shape[0], dtype=bool)
+    pair_starts[pulse_parameters['last']] = False
+    left = np.flatnonzero(pair_starts)
+    right = left + 1
+    is_first = np.zeros(mid_points.shape[0], dtype=bool)
+    is_first[pulse_parameters['first']] = True
+    is_last = np.zeros(mid_points.shape[0], dtype=bool)
+    is_last[pulse_parameters['last']] = True
+
+    pair_durations = durations[sequence_indices[left]]
+    first_pairs = is_first[left]
+    last_pairs = is_last[right]
+    end_pairs = first_pairs & last_pairs
+
+    # pairs of pulses, with the multiplier of the half duration of each pulse
+    lefts = np.concatenate([left, left[first_pairs], left[last_pairs], left[end_pairs]])
+    rights = np.concatenate([right, right[first_pairs], right[last_pairs], right[end_pairs]])
+    left_multipliers = np.concatenate([np.ones(left.shape[0]),
+                                       2 * np.ones(np.count_nonzero(first_pairs)),
+                                       np.ones(np.count_nonzero(last_pairs)),
+                                       2 * np.ones(np.count_nonzero(end_pairs))])
+    right_multipliers = np.concatenate([np.ones(left.shape[0]),
+                                        np.ones(np.count_nonzero(first_pairs)),
+                                        2 * np.ones(np.count_nonzero(last_pairs)),
+                                        2 * np.ones(np.count_nonzero(end_pairs))])
+    bounds = np.concatenate([mid_points[right] - mid_points[left],
+                             mid_points[right][first_pairs],
+                             pair_durations[last_pairs] - mid_points[left][last_pairs],
+                             pair_durations[end_pairs]])
+
+    left_sizes = left_multipliers * sizes[lefts]
+    right_sizes = right_multipliers * sizes[rights]
+    rabi_coefficients = (np.where(rabi_pulses[lefts], left_sizes, 0.)
+                         + np.where(rabi_pulses[rights], right_sizes, 0.))
+    detuning_coefficients = (np.where(rabi_pulses[lefts], 0., left_sizes)
+                             + np.where(rabi_pulses[rights], 0., right_sizes))
+
+    return sequence_indices[lefts], rabi_coefficients, detuning_coefficients, bounds
+
+
+def _minimum_rates(dynamic_decoupling_sequences, other_rate, rabi_rate):
+
+    """Private function to calculate the minimum maximum rabi or detuning rates
+
+    Parameters
+    ----------
+    dynamic_decoupling_sequences : DynamicDecouplingSequence or list
+        The sequence or list of sequences
+    other_rate : float or numpy.ndarray
+        The fixed maximum detuning (rabi) rate, for each sequence, when solving for the
+        maximum rabi (detuning) rate; None if both rates are equal
+    rabi_rate : bool
+        True to solve for the maximum rabi rate, False for the maximum detuning rate
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The minimum rate for each sequence; a float if a single sequence is supplied
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+    """
+
+    sequences, single_sequence = _as_sequence_list(dynamic_decoupling_sequences)
+
+    pulse_parameters = _pulse_parameters(sequences)
+    (sequence_indices, rabi_coefficients,
+     detuning_coefficients, bounds) = _timing_constraints(pulse_parameters)
+
+    if rabi_rate:
+        coefficients, other_coefficients = rabi_coefficients, detuning_coefficients
+    else:
+        coefficients, other_coefficients = detuning_coefficients, rabi_coefficients
+
+    if other_rate is None:
+        coefficients = coefficients + other_coefficients
+        available = bounds
+    else:
+        other_rate = np.broadcast_to(np.asarray(other_rate, dtype=np.float), (len(sequences),))
+        if np.any(other_rate <= 0.):
+            raise ArgumentsValueError('Maximum rates must be above zero.',
+                                      {'maximum_rabi_rate' if not rabi_rate
+                                       else 'maximum_detuning_rate': other_rate})
+        available = bounds - other_coefficients / other_rate[sequence_indices]
+
+    required = np.full(bounds.shape, np.inf)
+    constrained = coefficients > 0.
+    feasible = constrained & (available > 0.)
+    required[feasible] = coefficients[feasible] / available[feasible]
+    required[~constrained & (available >= 0.)] = 0.
+
+    minimum_rates = np.zeros(len(sequences))
+    np.maximum.at(minimum_rates, sequence_indices, required)
+    minimum_rates[~pulse_parameters['valid']] = np.inf
+
+    if single_sequence:
+        return minimum_rates[0]
+
+    return minimum_rates
+
+
+def compute_minimum_rabi_rate(dynamic_decoupling_sequences=None, maximum_detuning_rate=None):
+
+    """Computes the smallest maximum rabi rate at which sequences can be converted
+    to driven controls.
+
+    Parameters
+    ----------
+    dynamic_decoupling_sequences : DynamicDecouplingSequence or list
+        The sequence or list of sequences; Defaults to None
+    maximum_detuning_rate : float or numpy.ndarray, optional
+        The maximum detuning rate used for the conversion, or one for each sequence;
+        Defaults to None, in which case the maximum rabi and detuning rates are
+        taken to be equal.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The minimum maximum rabi rate for each sequence; a float if a single sequence
+        is supplied. 0 if the pulse timing does not depend on the maximum rabi rate, and
+        ``numpy.inf`` if the sequence cannot be converted at any maximum rabi rate.
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+
+    Notes
+    -----
+    The rate is calculated in closed form: the duration of each pulse is inversely
+    proportional to the rates, so the condition that adjacent pulses, shifted to fall
+    within the sequence duration as in `convert_dds_to_driven_controls`, do not overlap
+    is a linear inequality in the inverse rates. The conversion succeeds at any maximum
+    rabi rate above the returned rate (within the bounds on the rates). At the returned
+    rate two pulses touch, and the conversion may fail due to rounding.
+    """
+
+    return _minimum_rates(dynamic_decoupling_sequences, maximum_detuning_rate,
+                          rabi_rate=True)
+
+
+def compute_minimum_detuning_rate(dynamic_decoupling_sequences=None, maximum_rabi_rate=None):
+
+    """Computes the smallest maximum detuning rate at which sequences can be converted
+    to driven controls.
+
+    Parameters
+    ----------
+    dynamic_decoupling_sequences : DynamicDecouplingSequence or list
+        The sequence or list of sequences; Defaults to None
+    maximum_rabi_rate : float or numpy.ndarray, optional
+        The maximum rabi rate used for the conversion, or one for each sequence;
+        Defaults to None, in which case the maximum rabi and detuning rates are
+        taken to be equal.
+
+    Returns
+    -------
+    float or numpy.ndarray
+        The minimum maximum detuning rate for each sequence; a float if a single sequence
+        is supplied. 0 if the pulse timing does not depend on the maximum detuning rate,
+        and ``numpy.inf`` if the sequence cannot be converted at any maximum detuning rate.
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+
+    Notes
+    -----
+    The rate is calculated in closed form as described in `compute_minimum_rabi_rate`.
+    """
+
+    return _minimum_rates(dynamic_decoupling_sequences, maximum_rabi_rate,
+                          rabi_rate=False)
+
+
+def _overlapping_pulses(pulse_start_ends):
+
+    """Private function to find the pairs of pulses that overlap
+
+    Parameters
+    ----------
+    pulse_start_ends : numpy.ndarray
+        Array of shape (number_of_offsets, 2) with the start and end time of each pulse
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (number_of_pairs, 2) with the indices i < j of the pulses
+        for which pulse j starts before pulse i ends
+    """
+
+    starts = pulse_start_ends[:, 0]
+    ends = pulse_start_ends[:, 1]
+    number_of_pulses = starts.shape[0]
+    indices = np.arange(number_of_pulses)
+
+    if np.all(starts[1:] >= starts[0:-1]):
+        # the pulses starting before pulse i ends follow it directly
+        stops = np.searchsorted(starts, ends, side='left')
+        numbers_of_pairs = np.maximum(stops - indices - 1, 0)
+        first_pulses = np.repeat(indices, numbers_of_pairs)
+        pair_positions = (np.arange(first_pulses.shape[0])
+                          - np.repeat(np.cumsum(numbers_of_pairs) - numbers_of_pairs,
+                                      numbers_of_pairs))
+        return np.stack([first_pulses, first_pulses + 1 + pair_positions], axis=1)
+
+    pairs = []
+    chunk_size = max(1, _MAXIMUM_CHUNK_ELEMENTS // max(number_of_pulses, 1))
+    for start in range(0, number_of_pulses, chunk_size):
+        chunk = indices[start:start + chunk_size]
+        overlapping = ((starts[None, :] < ends[chunk, None])
+                       & (indices[None, :] > chunk[:, None]))
+        first_pulses, second_pulses = np.nonzero(overlapping)
+        pairs.append(np.stack([chunk[first_pulses], second_pulses], axis=1))
+
+    return np.concatenate(pairs)
+
+
+def diagnose_dds_conversion(dynamic_decoupling_sequence=None,
+                            maximum_rabi_rate=2*np.pi,
+                            maximum_detuning_rate=2*np.pi):
+
+    """Finds all the reasons why a sequence cannot be converted to a driven control.
+
+    Parameters
+    ----------
+    dynamic_decoupling_sequence : DynamicDecouplingSequence
+        The sequence; Defaults to None
+    maximum_rabi_rate : float, optional
+        Maximum Rabi Rate; Defaults to 2*pi
+    maximum_detuning_rate : float, optional
+        Maximum Detuning Rate; Defaults to 2*pi
+
+    Returns
+    -------
+    dict
+        The diagnostics, with keys
+
+        - 'valid' : True if `convert_dds_to_driven_controls` can deduce the pulse timing
+        - 'pulse_start_ends' : array of shape (number_of_offsets, 2) with the start and
+          end time of each pulse, after shifting the pulses at either end
+        - 'simultaneous_rotations' : indices of the operations with both a rabi and a
+          detuning rotation
+        - 'inverted_pulses' : indices of the pulses that end before they start
+        - 'overlapping_pulses' : array of shape (number_of_pairs, 2) with the indices
+          i < j of every pair of operations for which pulse j starts before pulse i ends
+        - 'overlaps' : for each overlapping pair, the time by which pulse i ends after
+          pulse j starts
+        - 'boundary_violations' : indices of the pulses that start before 0 or end after
+          the sequence duration
+        - 'boundary_overlaps' : for each boundary violation, the time by which the pulse
+          extends outside of the sequence
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+
+    Notes
+    -----
+    The pulses are defined as in `convert_dds_to_driven_controls`, which succeeds in
+    deducing the pulse timing if there are no simultaneous rotations, inverted pulses or
+    overlapping pulses. Overlapping pulses can be separated by moving their offsets apart
+    by the overlap, or by increasing the rates; see `compute_minimum_rabi_rate`.
+    """
+
+    if not isinstance(dynamic_decoupling_sequence, DynamicDecouplingSequence):
+        raise ArgumentsValueError('Dynamic decoupling sequence must be of '
+                                  'DynamicDecouplingSequence type.',
+                                  {'type(dynamic_decoupling_sequence)':
+                                   type(dynamic_decoupling_sequence)})
+
+    _check_maximum_rotation_rate(maximum_rabi_rate, maximum_detuning_rate)
+
+    duration = dynamic_decoupling_sequence.duration
+    rabi_rotations = dynamic_decoupling_sequence.rabi_rotations
+    detuning_rotations = dynamic_decoupling_sequence.detuning_rotations
+
+    pulse_start_ends = _get_pulse_start_ends(
+        duration, dynamic_decoupling_sequence.offsets, rabi_rotations,
+        dynamic_decoupling_sequence.azimuthal_angles, detuning_rotations,
+        maximum_rabi_rate, maximum_detuning_rate)
+    starts = pulse_start_ends[:, 0]
+    ends = pulse_start_ends[:, 1]
+
+    simultaneous_rotations = np.flatnonzero((rabi_rotations > 0.) & (detuning_rotations > 0.))
+    inverted_pulses = np.flatnonzero(starts > ends)
+
+    overlapping_pulses = _overlapping_pulses(pulse_start_ends)
+    overlaps = ends[overlapping_pulses[:, 0]] - starts[overlapping_pulses[:, 1]]
+
+    boundary_overlaps = np.maximum(0. - starts, ends - duration)
+    boundary_violations = np.flatnonzero(boundary_overlaps > 0.)
+
+    return {'valid': (simultaneous_rotations.shape[0] == 0
+                      and inverted_pulses.shape[0] == 0
+                      and overlapping_pulses.shape[0] == 0),
+            'pulse_start_ends': pulse_start_ends,
+            'simultaneous_rotations': simultaneous_rotations,
+            'inverted_pulses': inverted_pulses,
+            'overlapping_pulses': overlapping_pulses,
+            'overlaps': overlaps,
+            'boundary_violations': boundary_violations,
+            'boundary_overlaps': boundary_overlaps[boundary_violations]}
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,385 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+=======================
+sequences.scheme_counts
+=======================
+"""
+
+import numpy as np
+
+from qctrlopencontrols.exceptions import ArgumentsValueError
+
+from .constants import SPIN_ECHO, UPPER_BOUND_OFFSETS
+from .scheme_registry import get_dds_scheme
+from .templates import _inverse_gray_codes
+
+
+def count_predefined_dds_offsets(scheme=SPIN_ECHO, **kwargs):
+
+    """Counts the offsets and pulses of predefined sequences without creating them.
+
+    Parameters
+    ----------
+    scheme : string
+        The name of the sequence; Defaults to 'Spin echo'. Available options are the
+        ones of `new_predefined_dds`
+    kwargs : dict, optional
+        The order parameters of the scheme, as integers or arrays of integers broadcast
+        against each other; the ones not supplied take their default value
+
+    Returns
+    -------
+    dict
+        The number_of_offsets, number_of_x_pulses, number_of_y_pulses and
+        number_of_z_pulses of the sequences, as integers or arrays of the broadcast
+        shape of the order parameters; the numbers of pulses are None if the scheme
+        does not know them
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the scheme does not know its number of offsets, or if an order
+        parameter is unknown or out of its range.
+
+    Notes
+    -----
+    The number of offsets is the one checked against UPPER_BOUND_OFFSETS, before the
+    sequences are padded with the offsets at their start and end. Once padded, the
+    predefined sequences have two more offsets, except Ramsey sequence, which is not
+    padded, and the XY-concatenated sequence of order 1, which has a pulse at its end
+    and one more offset. The pulses do not include the rotations added by
+    pre_post_rotation. Each count is a closed form of
+    the order parameters, computed in O(log n) operations at most.
+    """
+
+    scheme = get_dds_scheme(scheme)
+    parameters, kwargs = scheme.get_order_parameter_arrays(**kwargs)
+    if kwargs:
+        raise ArgumentsValueError('Unknown order parameters of the scheme.',
+                                  {'parameters': list(kwargs)},
+                                  extras={'scheme': scheme.name})
+
+    if scheme.number_of_offsets is None:
+        raise ArgumentsValueError('Number of offsets of the scheme is not known.',
+                                  {'scheme': scheme.name})
+
+    names = ['number_of_offsets']
+    counts = [scheme.number_of_offsets(*parameters)]
+    if scheme.number_of_pulses is not None:
+        names += ['number_of_x_pulses', 'number_of_y_pulses', 'number_of_z_pulses']
+        counts += list(scheme.number_of_pulses(*parameters))
+
+    # the counts of schemes without order parameters, or that do not depend on some
+    # of them, are broadcast to the shape of the order parameters
+    shape = parameters[0].shape if parameters else ()
+    counts = {name: np.array(np.broadcast_to(np.asarray(count, dtype=np.int64), shape))[()]
+              for name, count in zip(names, counts)}
+    for name in ['number_of_x_pulses', 'number_of_y_pulses', 'number_of_z_pulses']:
+        counts.setdefault(name, None)
+
+    return counts
+
+
+def _number_of_ramsey_offsets():
+
+    """Private function to count the offsets of Ramsey sequence
+
+    Returns
+    -------
+    int
+        The number of offsets; the offsets at the start and end of the sequence
+    """
+
+    return 2
+
+
+def _number_of_spin_echo_offsets():
+
+    """Private function to count the offsets of spin echo sequence
+
+    Returns
+    -------
+    int
+        The number of offsets
+    """
+
+    return 1
+
+
+def _number_of_single_axis_offsets(number_of_offsets):
+
+    """Private function to count the offsets of the sequences parametrised by their
+    number of offsets
+
+    Parameters
+    ----------
+    number_of_offsets : int
+        The number of offsets
+
+    Returns
+    -------
+    int
+        The number of offsets
+    """
+
+    return number_of_offsets
+
+
+def _number_of_walsh_single_axis_offsets(paley_order):
+
+    """Private function to count the offsets of Walsh single-axis sequence
+
+    Parameters
+    ----------
+    paley_order : int or numpy.ndarray
+        The paley order of the walsh sequence
+
+    Returns
+    -------
+    int or numpy.ndarray
+        The number of offsets
+    """
+
+    # the number of offsets is the inverse Gray code of the paley order
+    return _inverse_gray_codes(paley_order, 64)
+
+
+def _number_of_quadratic_offsets(number_inner_offsets, number_outer_offsets):
+
+    """Private function to count the offsets of quadratic sequence
+
+    Parameters
+    ----------
+    number_inner_offsets : int
+        Number of inner Z-pi Pulses
+    number_outer_offsets : int
+        Number of outer X-pi Pulses
+
+    Returns
+    -------
+    int
+        The number of offsets
+    """
+
+    return (number_inner_offsets + 1) * (number_outer_offsets + 1) - 1
+
+
+def _number_of_x_concatenated_offsets(concatenation_order):
+
+    """Private function to count the offsets of X-concatenated sequence
+
+    Parameters
+    ----------
+    concatenation_order : int or numpy.ndarray
+        The number of concatenation of base sequence
+
+    Returns
+    -------
+    int or numpy.ndarray
+        The number of offsets; there are 2 ** (n - 1 - k) steps below 2 ** n with
+        k trailing zero bits, and the sum of these over the even k below the order n
+        is (2 ** (n + 1) - 2 ** ((n - 1) % 2)) / 3
+    """
+
+    return ((1 << (concatenation_order + 1)) - (1 << ((concatenation_order - 1) % 2))) // 3
+
+
+def _number_of_xy_concatenated_offsets(concatenation_order):
+
+    """Private function to count the offsets of XY-concatenated sequence
+
+    Parameters
+    ----------
+    concatenation_order : int or numpy.ndarray
+        The number of concatenation of base sequence
+
+    Returns
+    -------
+    int or numpy.ndarray
+        The number of offsets
+    """
+
+    return sum(_number_of_xy_concatenated_pulses(concatenation_order))
+
+
+def _number_of_ramsey_pulses():
+
+    """Private function to count the pulses of Ramsey sequence
+
+    Returns
+    -------
+    tuple
+        The numbers of X, Y and Z pulses
+    """
+
+    return 0, 0, 0
+
+
+def _number_of_spin_echo_pulses():
+
+    """Private function to count the pulses of spin echo sequence
+
+    Returns
+    -------
+    tuple
+        The numbers of X, Y and Z pulses
+    """
+
+    return 1, 0, 0
+
+
+def _number_of_x_pulses(number_of_offsets):
+
+    """Private function to count the pulses of the sequences of X pulses
+    parametrised by their number of offsets
+
+    Parameters
+    ----------
+    number_of_offsets : int or numpy.ndarray
+        The number of offsets
+
+    Returns
+    -------
+    tuple
+        The numbers of X, Y and Z pulses
+    """
+
+    return number_of_offsets, 0, 0
+
+
+def _number_of_y_pulses(number_of_offsets):
+
+    """Private function to count the pulses of the sequences of Y pulses
+    parametrised by their number of offsets
+
+    Parameters
+    ----------
+    number_of_offsets : int or numpy.ndarray
+        The number of offsets
+
+    Returns
+    -------
+    tuple
+        The numbers of X, Y and Z pulses
+    """
+
+    return 0, number_of_offsets, 0
+
+
+def _number_of_walsh_single_axis_pulses(paley_order):
+
+    """Private function to count the pulses of Walsh single-axis sequence
+
+    Parameters
+    ----------
+    paley_order : int or numpy.ndarray
+        The paley order of the walsh sequence
+
+    Returns
+    -------
+    tuple
+        The numbers of X, Y and Z pulses
+    """
+
+    return _number_of_walsh_single_axis_offsets(paley_order), 0, 0
+
+
+def _number_of_quadratic_pulses(number_inner_offsets, number_outer_offsets):
+
+    """Private function to count the pulses of quadratic sequence
+
+    Parameters
+    ----------
+    number_inner_offsets : int or numpy.ndarray
+        Number of inner Z-pi Pulses
+    number_outer_offsets : int or numpy.ndarray
+        Number of outer X-pi Pulses
+
+    Returns
+    -------
+    tuple
+        The numbers of X, Y and Z pulses; the inner pulses are repeated in each
+        of the number_outer_offsets + 1 outer intervals
+    """
+
+    return number_outer_offsets, 0, number_inner_offsets * (number_outer_offsets + 1)
+
+
+def _number_of_x_concatenated_pulses(concatenation_order):
+
+    """Private function to count the pulses of X-concatenated sequence
+
+    Parameters
+    ----------
+    concatenation_order : int or numpy.ndarray
+        The number of concatenation of base sequence
+
+    Returns
+    -------
+    tuple
+        The numbers of X, Y and Z pulses
+    """
+
+    return _number_of_x_concatenated_offsets(concatenation_order), 0, 0
+
+
+def _number_of_xy_concatenated_pulses(concatenation_order):
+
+    """Private function to count the pulses of XY-concatenated sequence
+
+    Parameters
+    ----------
+    concatenation_order : int or numpy.ndarray
+        The number of concatenation of base sequence
+
+    Returns
+    -------
+    tuple
+        The numbers of X, Y and Z pulses; there are 2 * 4 ** (n - 1) X pulses,
+        4 ** (n - 1) Y pulses plus one if the order n is odd, and
+        2 * (4 ** (n - 1) - 1) / 3 Z pulses
+    """
+
+    quarter = 4 ** (concatenation_order - 1)
+
+    return 2 * quarter, quarter + concatenation_order % 2, 2 * (quarter - 1) // 3
+
+
+def _maximum_order(number_of_offsets):
+
+    """Private function to find the highest concatenation order of a scheme with at most
+    UPPER_BOUND_OFFSETS offsets
+
+    Parameters
+    ----------
+    number_of_offsets : callable
+        The number of offsets as a function of the order, increasing with the order
+
+    Returns
+    -------
+    int
+        The highest order
+    """
+
+    order = 1
+    while number_of_offsets(order + 1) <= UPPER_BOUND_OFFSETS:
+        order += 1
+
+    return order
+
+
+if __name__ == '__main__':
+    pass
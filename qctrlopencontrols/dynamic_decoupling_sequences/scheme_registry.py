@@ -0,0 +1,366 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+=========================
+sequences.scheme_registry
+=========================
+"""
+
+import numpy as np
+
+from qctrlopencontrols.base import QctrlObject
+from qctrlopencontrols.exceptions import ArgumentsValueError
+
+# registered schemes, by name, in the order they were registered
+_SCHEMES = dict()
+
+
+class DynamicDecouplingScheme(QctrlObject):
+    """Description of a scheme of dynamic decoupling sequences.
+
+    A scheme creates its sequences either with a generator, or by scaling the relative
+    template computed by its template function to the duration of the sequence. In the
+    latter case, the templates are shared with the template cache and the template store
+    of the predefined sequences.
+
+    Parameters
+    ----------
+    name : str
+        The name of the scheme
+    generator : callable, optional
+        Function creating a sequence of the scheme from keyword arguments: the duration,
+        the order parameters and the keywords of DynamicDecouplingSequence;
+        Defaults to None, in which case the sequences are created from the templates
+    template_function : callable, optional
+        Function computing the relative template of the scheme from the order parameters,
+        in the order they are listed in `parameters`; it returns the offsets of the
+        sequence of unit duration, its rabi rotations, azimuthal angles and detuning
+        rotations. Defaults to None
+    parameters : list, optional
+        The order parameters of the scheme, as (name, default, minimum, maximum) tuples;
+        the parameters are integers and a maximum of None is unbounded.
+        Defaults to None, for a scheme without order parameters
+    number_of_offsets : callable, optional
+        Function computing the number of offsets of the sequences from the order
+        parameters, in the order they are listed in `parameters`; Defaults to None,
+        if the number of offsets is not known without generating the sequences
+    number_of_pulses : callable, optional
+        Function computing the numbers of X, Y and Z pulses of the sequences from
+        the order parameters, in the order they are listed in `parameters`;
+        Defaults to None, if they are not known without generating the sequences
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+
+    Notes
+    -----
+    The number of offsets counts the offsets supplied to DynamicDecouplingSequence,
+    before the sequence is padded with the offsets at its start and end; it is the
+    number checked against UPPER_BOUND_OFFSETS. The counting functions are called
+    with integers or with arrays of integers broadcast against each other.
+    """
+
+    def __init__(self, name=None, generator=None, template_function=None,
+                 parameters=None, number_of_offsets=None, number_of_pulses=None):
+
+        super(DynamicDecouplingScheme, self).__init__(
+            base_attributes=['name', 'parameters'])
+
+        if not isinstance(name, str) or not name:
+            raise ArgumentsValueError('Scheme name must be a non-empty string.',
+                                      {'name': name})
+
+        if generator is None and template_function is None:
+            raise ArgumentsValueError('Scheme must have a generator or a template function.',
+                                      {'name': name})
+
+        if parameters is None:
+            parameters = []
+        parameters = [tuple(parameter) for parameter in parameters]
+        for parameter in parameters:
+            if len(parameter) != 4:
+                raise ArgumentsValueError(
+                    'Parameters must be given as (name, default, minimum, maximum).',
+                    {'name': name, 'parameter': parameter})
+            parameter_name, default, minimum, maximum = parameter
+            if default < minimum or (maximum is not None and default > maximum):
+                raise ArgumentsValueError(
+                    'Default value of parameter must be within its range.',
+                    {'name': name, 'parameter': parameter_name},
+                    extras={'default': default, 'minimum': minimum, 'maximum': maximum})
+
+        self.name = name
+        self.generator = generator
+        self.template_function = template_function
+        self.parameters = parameters
+        self.number_of_offsets = number_of_offsets
+        self.number_of_pulses = number_of_pulses
+
+    @property
+    def parameter_names(self):
+        """Names of the order parameters
+
+        Returns
+        -------
+        list
+            The names, in the order of the arguments of the template function
+        """
+        return [parameter[0] for parameter in self.parameters]
+
+    def get_parameter_ranges(self):
+
+        """Returns the ranges of the order parameters.
+
+        Returns
+        -------
+        dict
+            The (minimum, maximum) of each order parameter, by name; a maximum
+            of None is unbounded
+        """
+
+        return {parameter_name: (minimum, maximum)
+                for parameter_name, _, minimum, maximum in self.parameters}
+
+    def get_order_parameters(self, **kwargs):
+
+        """Extracts the order parameters from keyword arguments.
+
+        Parameters
+        ----------
+        kwargs : dict
+            Keyword arguments, holding some of the order parameters
+
+        Returns
+        -------
+        tuple
+            The order parameters, in the order of the arguments of the template function,
+            with the default value of the ones not supplied, and the remaining keyword
+            arguments
+
+        Raises
+        ------
+        ArgumentsValueError
+            Raised if an order parameter is out of its range.
+        """
+
+        order_parameters = []
+        for parameter_name, default, minimum, maximum in self.parameters:
+            value = kwargs.pop(parameter_name, None)
+            value = default if value is None else int(value)
+            if value < minimum or (maximum is not None and value > maximum):
+                raise ArgumentsValueError(
+                    'Parameter is out of the range of the scheme.',
+                    {parameter_name: value},
+                    extras={'scheme': self.name, 'minimum': minimum, 'maximum': maximum})
+            order_parameters.append(value)
+
+        return tuple(order_parameters), kwargs
+
+    def get_order_parameter_arrays(self, **kwargs):
+
+        """Extracts arrays of order parameters from keyword arguments.
+
+        Parameters
+        ----------
+        kwargs : dict
+            Keyword arguments, holding some of the order parameters as integers
+            or arrays of integers
+
+        Returns
+        -------
+        tuple
+            The order parameters as arrays broadcast against each other, in the order
+            of the arguments of the template function, with the default value of the
+            ones not supplied, and the remaining keyword arguments
+
+        Raises
+        ------
+        ArgumentsValueError
+            Raised if a value of an order parameter is out of its range.
+        """
+
+        order_parameters = []
+        for parameter_name, default, minimum, maximum in self.parameters:
+            value = kwargs.pop(parameter_name, None)
+            values = np.asarray(default if value is None else value, dtype=np.int64)
+            if np.any(values < minimum) or (maximum is not None and np.any(values > maximum)):
+                raise ArgumentsValueError(
+                    'Parameter is out of the range of the scheme.',
+                    {parameter_name: values},
+                    extras={'scheme': self.name, 'minimum': minimum, 'maximum': maximum})
+            order_parameters.append(values)
+
+        return tuple(np.broadcast_arrays(*order_parameters)), kwargs
+
+    def get_number_of_offsets(self, **kwargs):
+
+        """Returns the number of offsets of the sequences, without generating them.
+
+        Parameters
+        ----------
+        kwargs : dict
+            The order parameters; the ones not supplied take their default value
+
+        Returns
+        -------
+        int or None
+            The number of offsets; None if the scheme does not know it
+
+        Raises
+        ------
+        ArgumentsValueError
+            Raised if an order parameter is unknown or out of its range.
+        """
+
+        order_parameters, kwargs = self.get_order_parameters(**kwargs)
+        if kwargs:
+            raise ArgumentsValueError('Unknown order parameters of the scheme.',
+                                      {'parameters': list(kwargs)},
+                                      extras={'scheme': self.name})
+
+        if self.number_of_offsets is None:
+            return None
+
+        return int(self.number_of_offsets(*order_parameters))
+
+
+def register_dds_scheme(name=None, generator=None, template_function=None,
+                        parameters=None, number_of_offsets=None, number_of_pulses=None,
+                        replace=False):
+
+    """Registers a scheme of dynamic decoupling sequences, so that `new_predefined_dds`
+    creates its sequences.
+
+    Parameters
+    ----------
+    name : str
+        The name of the scheme
+    generator : callable, optional
+        Function creating a sequence of the scheme from keyword arguments;
+        Defaults to None
+    template_function : callable, optional
+        Function computing the relative template of the scheme from the order
+        parameters; Defaults to None
+    parameters : list, optional
+        The order parameters, as (name, default, minimum, maximum) tuples;
+        Defaults to None
+    number_of_offsets : callable, optional
+        Function computing the number of offsets from the order parameters;
+        Defaults to None
+    number_of_pulses : callable, optional
+        Function computing the numbers of X, Y and Z pulses from the order
+        parameters; Defaults to None
+    replace : bool, optional
+        If True, the scheme replaces a registered scheme of the same name;
+        Defaults to False
+
+    Returns
+    -------
+    DynamicDecouplingScheme
+        The registered scheme
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if an argument is invalid or if a scheme of the same name is
+        registered and replace is False.
+
+    Notes
+    -----
+    See `DynamicDecouplingScheme` for the description of the arguments.
+    """
+
+    scheme = DynamicDecouplingScheme(name=name, generator=generator,
+                                     template_function=template_function,
+                                     parameters=parameters,
+                                     number_of_offsets=number_of_offsets,
+                                     number_of_pulses=number_of_pulses)
+
+    if name in _SCHEMES and not replace:
+        raise ArgumentsValueError('A scheme with the same name is already registered.',
+                                  {'name': name})
+
+    _SCHEMES[name] = scheme
+
+    return scheme
+
+
+def unregister_dds_scheme(name=None):
+
+    """Removes a scheme from the registry.
+
+    Parameters
+    ----------
+    name : str
+        The name of the scheme
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the scheme is not registered.
+    """
+
+    get_dds_scheme(name)
+    del _SCHEMES[name]
+
+
+def get_dds_scheme(name=None):
+
+    """Returns a registered scheme.
+
+    Parameters
+    ----------
+    name : str
+        The name of the scheme
+
+    Returns
+    -------
+    DynamicDecouplingScheme
+        The scheme
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the scheme is not registered.
+    """
+
+    # the names of the schemes are strings; other names, including the unhashable
+    # ones, are unknown
+    if not isinstance(name, str) or name not in _SCHEMES:
+        raise ArgumentsValueError(
+            'Unknown predefined sequence scheme. Allowed schemes are: '
+            + ', '.join(_SCHEMES) + '.',
+            {'sequence_name': name})
+
+    return _SCHEMES[name]
+
+
+def get_dds_scheme_names():
+
+    """Returns the names of the registered schemes.
+
+    Returns
+    -------
+    list
+        The names, in the order the schemes were registered
+    """
+
+    return list(_SCHEMES)
+
+
+if __name__ == '__main__':
+    pass
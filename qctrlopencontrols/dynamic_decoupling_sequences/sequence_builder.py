@@ -0,0 +1,257 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+==========================
+sequences.sequence_builder
+==========================
+"""
+
+import numpy as np
+
+from qctrlopencontrols.base import QctrlObject
+from qctrlopencontrols.exceptions import ArgumentsValueError
+
+from .constants import UPPER_BOUND_OFFSETS
+from .dynamic_decoupling_sequence import _new_padded_sequence
+
+
+class DynamicDecouplingSequenceBuilder(QctrlObject):
+    """Builds a dynamic decoupling sequence one operation at a time.
+
+    The operations are checked as they are appended and stored in a buffer that grows
+    geometrically, so that appending an operation takes constant amortized time; the
+    sequence is created once, by `freeze`, without checking the operations again.
+
+    Parameters
+    ----------
+    duration : float, optional
+        The total time in seconds for the sequence; Defaults to 1
+    pre_post_rotation : bool, optional
+        The pre_post_rotation of the sequence, as in DynamicDecouplingSequence;
+        Defaults to False
+    name : str, optional
+        Name of the sequence; Defaults to None
+    capacity : int, optional
+        Number of operations the buffer holds before it first grows; Defaults to 16
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+    """
+
+    def __init__(self, duration=1., pre_post_rotation=False, name=None, capacity=16):
+
+        super(DynamicDecouplingSequenceBuilder, self).__init__(
+            base_attributes=['duration', 'pre_post_rotation', 'name', 'number_of_offsets'])
+
+        self.duration = float(duration)
+        if not self.duration > 0.:
+            raise ArgumentsValueError(
+                'Sequence duration must be above zero:',
+                {'duration': duration})
+
+        capacity = int(capacity)
+        if capacity <= 0:
+            raise ArgumentsValueError('Capacity must be above zero.',
+                                      {'capacity': capacity})
+
+        self.pre_post_rotation = pre_post_rotation
+        self.name = name
+
+        # offsets, rabi rotations, azimuthal angles and detuning rotations; the first
+        # and last columns are kept for the offsets at the start and end of the sequence
+        self._operations = np.zeros((4, capacity + 2))
+        self._number_of_offsets = 0
+        self._last_offset = 0.
+
+    @property
+    def number_of_offsets(self):
+        """Number of operations appended
+
+        Returns
+        -------
+        int
+            The number of operations, without the offsets that pad the sequence
+            at its start and end
+        """
+        return self._number_of_offsets
+
+    def __len__(self):
+        return self._number_of_offsets
+
+    def _reserve(self, number_of_offsets):
+
+        """Private method to grow the buffer to hold a number of operations
+
+        Parameters
+        ----------
+        number_of_offsets : int
+            The number of operations the buffer must hold
+        """
+
+        capacity = self._operations.shape[1] - 2
+        if number_of_offsets <= capacity:
+            return
+
+        operations = np.zeros((4, max(number_of_offsets, 2 * capacity) + 2))
+        operations[:, 0:self._number_of_offsets + 1] = \
+            self._operations[:, 0:self._number_of_offsets + 1]
+        self._operations = operations
+
+    def append(self, offset, rabi_rotation=np.pi, azimuthal_angle=0., detuning_rotation=0.):
+
+        """Appends an operation to the sequence.
+
+        Parameters
+        ----------
+        offset : float
+            The offset of the operation, not before the offset of the previous
+            operation and between 0 and the duration (inclusive)
+        rabi_rotation : float, optional
+            The rabi rotation of the operation; Defaults to pi
+        azimuthal_angle : float, optional
+            The azimuthal angle of the operation; Defaults to 0
+        detuning_rotation : float, optional
+            The detuning rotation of the operation; Defaults to 0
+
+        Raises
+        ------
+        ArgumentsValueError
+            Raised if the operation cannot be appended.
+        """
+
+        offset = float(offset)
+        if not self._last_offset <= offset <= self.duration:
+            raise ArgumentsValueError(
+                'Offsets for dynamic decoupling sequence must be between 0 and sequence '
+                'duration (inclusive), in increasing order. ',
+                {'offset': offset},
+                extras={'previous_offset': self._last_offset, 'duration': self.duration})
+
+        if self._number_of_offsets >= UPPER_BOUND_OFFSETS:
+            raise ArgumentsValueError(
+                'Number of offsets is above the allowed number of maximum offsets. ',
+                {'number_of_offsets': self._number_of_offsets + 1,
+                 'allowed_maximum_offsets': UPPER_BOUND_OFFSETS})
+
+        self._reserve(self._number_of_offsets + 1)
+        self._number_of_offsets += 1
+        self._operations[:, self._number_of_offsets] = (
+            offset, rabi_rotation, azimuthal_angle, detuning_rotation)
+        self._last_offset = offset
+
+    def extend(self, offsets, rabi_rotations=None, azimuthal_angles=None,
+               detuning_rotations=None):
+
+        """Appends a number of operations to the sequence.
+
+        Parameters
+        ----------
+        offsets : numpy.ndarray
+            The offsets of the operations, in increasing order, not before the offset
+            of the previous operation and between 0 and the duration (inclusive)
+        rabi_rotations : numpy.ndarray, optional
+            The rabi rotations of the operations; Defaults to pi for each operation
+        azimuthal_angles : numpy.ndarray, optional
+            The azimuthal angles of the operations; Defaults to 0 for each operation
+        detuning_rotations : numpy.ndarray, optional
+            The detuning rotations of the operations; Defaults to 0 for each operation
+
+        Raises
+        ------
+        ArgumentsValueError
+            Raised if the operations cannot be appended; none of them is appended.
+        """
+
+        offsets = np.asarray(offsets, dtype=np.float).flatten()
+        number_of_offsets = offsets.shape[0]
+        if number_of_offsets == 0:
+            return
+
+        operations = [offsets]
+        for name, values, default in [('rabi_rotations', rabi_rotations, np.pi),
+                                      ('azimuthal_angles', azimuthal_angles, 0.),
+                                      ('detuning_rotations', detuning_rotations, 0.)]:
+            values = np.full(offsets.shape, default) if values is None else np.asarray(
+                values, dtype=np.float).flatten()
+            if values.shape != offsets.shape:
+                raise ArgumentsValueError(
+                    '{} must have the same length as offsets. '.format(name),
+                    {'offsets': offsets, name: values})
+            operations.append(values)
+
+        if (not self._last_offset <= offsets[0] or not offsets[-1] <= self.duration
+                or np.any(np.diff(offsets) < 0.) or np.any(np.isnan(offsets))):
+            raise ArgumentsValueError(
+                'Offsets for dynamic decoupling sequence must be between 0 and sequence '
+                'duration (inclusive), in increasing order. ',
+                {'offsets': offsets},
+                extras={'previous_offset': self._last_offset, 'duration': self.duration})
+
+        if self._number_of_offsets + number_of_offsets > UPPER_BOUND_OFFSETS:
+            raise ArgumentsValueError(
+                'Number of offsets is above the allowed number of maximum offsets. ',
+                {'number_of_offsets': self._number_of_offsets + number_of_offsets,
+                 'allowed_maximum_offsets': UPPER_BOUND_OFFSETS})
+
+        self._reserve(self._number_of_offsets + number_of_offsets)
+        self._operations[:, self._number_of_offsets + 1:
+                         self._number_of_offsets + number_of_offsets + 1] = operations
+        self._number_of_offsets += number_of_offsets
+        self._last_offset = offsets[-1]
+
+    def freeze(self):
+
+        """Creates the sequence of the operations appended so far.
+
+        Returns
+        -------
+        DynamicDecouplingSequence
+            The sequence, identical to the one created by DynamicDecouplingSequence
+            from the operations; the builder can keep appending operations to
+            create longer sequences
+
+        Notes
+        -----
+        The sequence is padded with the offsets at its start and end, and the
+        pre_post_rotation is applied, as in DynamicDecouplingSequence. Its arrays
+        are copied once from the buffer.
+        """
+
+        end = self._number_of_offsets + 1
+        operations = self._operations
+
+        # the operations were checked when appended, so the padding only depends on
+        # the first and last offsets
+        start = 1 if self._number_of_offsets and operations[0, 1] == 0. else 0
+        if self._number_of_offsets == 0 or operations[0, end - 1] != self.duration:
+            operations[:, end] = (self.duration, 0., 0., 0.)
+            end += 1
+        if start == 0:
+            operations[:, 0] = 0.
+
+        operations = operations[:, start:end].copy()
+        if self.pre_post_rotation:
+            operations[1, [0, -1]] = np.pi / 2
+
+        return _new_padded_sequence(self.duration, operations[0], operations[1],
+                                    operations[2], operations[3],
+                                    pre_post_rotation=self.pre_post_rotation,
+                                    name=self.name)
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,429 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+=======================
+sequences.serialization
+=======================
+"""
+
+import os
+import struct
+
+import numpy as np
+
+from qctrlopencontrols.base import QctrlObject
+from qctrlopencontrols.exceptions import ArgumentsValueError
+
+from .dynamic_decoupling_sequence import DynamicDecouplingSequence
+
+_BINARY_SEQUENCE_MAGIC = b'QDDS'
+
+_BINARY_SEQUENCE_VERSION = 1
+
+# magic, version, flags, number of offsets, duration, fingerprint, name length
+_RECORD_HEADER = struct.Struct('<4sHHQd20sI')
+
+_PRE_POST_ROTATION_FLAG = 1
+
+_ARRAY_DTYPE = np.dtype('<f8')
+
+
+def _write_record(handle, dynamic_decoupling_sequence):
+
+    """Private function to write a sequence as a binary record
+
+    Parameters
+    ----------
+    handle : file
+        File object opened for binary writing
+    dynamic_decoupling_sequence : DynamicDecouplingSequence
+        The sequence to be written
+    """
+
+    name = dynamic_decoupling_sequence.name
+    name = b'' if name is None else name.encode('utf-8')
+    flags = _PRE_POST_ROTATION_FLAG if dynamic_decoupling_sequence.pre_post_rotation else 0
+
+    handle.write(_RECORD_HEADER.pack(
+        _BINARY_SEQUENCE_MAGIC, _BINARY_SEQUENCE_VERSION, flags,
+        dynamic_decoupling_sequence.number_of_offsets,
+        dynamic_decoupling_sequence.duration,
+        bytes.fromhex(dynamic_decoupling_sequence.get_fingerprint()),
+        len(name)))
+    handle.write(name)
+
+    operations = np.stack([dynamic_decoupling_sequence.offsets,
+                           dynamic_decoupling_sequence.rabi_rotations,
+                           dynamic_decoupling_sequence.azimuthal_angles,
+                           dynamic_decoupling_sequence.detuning_rotations])
+    handle.write(np.ascontiguousarray(operations, dtype=_ARRAY_DTYPE).tobytes())
+
+
+def _read_record_header(handle, filename):
+
+    """Private function to read the header of the binary record at the current position
+
+    Parameters
+    ----------
+    handle : file
+        File object opened for binary reading
+    filename : str
+        Name of the file; used to report errors
+
+    Returns
+    -------
+    dict or None
+        The header fields, or None at the end of the file
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the file does not contain a valid sequence record
+    """
+
+    header = handle.read(_RECORD_HEADER.size)
+    if not header:
+        return None
+
+    if len(header) != _RECORD_HEADER.size:
+        raise ArgumentsValueError('Truncated sequence record found in file.',
+                                  {'filename': filename},
+                                  extras={'position': handle.tell() - len(header)})
+
+    (magic, version, flags, number_of_offsets,
+     duration, fingerprint, name_length) = _RECORD_HEADER.unpack(header)
+
+    if magic != _BINARY_SEQUENCE_MAGIC or version != _BINARY_SEQUENCE_VERSION:
+        raise ArgumentsValueError('File does not contain a supported binary sequence record.',
+                                  {'filename': filename},
+                                  extras={'magic': magic, 'version': version})
+
+    name = handle.read(name_length).decode('utf-8') if name_length else None
+
+    return {'pre_post_rotation': bool(flags & _PRE_POST_ROTATION_FLAG),
+            'number_of_offsets': number_of_offsets,
+            'duration': duration,
+            'fingerprint': fingerprint.hex(),
+            'name': name}
+
+
+def _read_record(handle, filename):
+
+    """Private function to read the binary record at the current position
+
+    Parameters
+    ----------
+    handle : file
+        File object opened for binary reading
+    filename : str
+        Name of the file; used to report errors
+
+    Returns
+    -------
+    DynamicDecouplingSequence
+        The sequence stored in the record
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the file does not contain a valid sequence record
+    """
+
+    header = _read_record_header(handle, filename)
+    if header is None:
+        raise ArgumentsValueError('No sequence record found in file.',
+                                  {'filename': filename})
+
+    number_of_offsets = header['number_of_offsets']
+    operations = np.frombuffer(handle.read(4 * number_of_offsets * _ARRAY_DTYPE.itemsize),
+                               dtype=_ARRAY_DTYPE)
+    if operations.shape[0] != 4 * number_of_offsets:
+        raise ArgumentsValueError('Truncated sequence record found in file.',
+                                  {'filename': filename},
+                                  extras={'number_of_offsets': number_of_offsets})
+    operations = np.reshape(operations, (4, number_of_offsets))
+
+    return DynamicDecouplingSequence(duration=header['duration'],
+                                     offsets=operations[0],
+                                     rabi_rotations=operations[1],
+                                     azimuthal_angles=operations[2],
+                                     detuning_rotations=operations[3],
+                                     pre_post_rotation=header['pre_post_rotation'],
+                                     name=header['name'])
+
+
+def save_dds(dynamic_decoupling_sequence=None, filename=None):
+
+    """Saves a dynamic decoupling sequence in a compact binary file.
+
+    Parameters
+    ----------
+    dynamic_decoupling_sequence : DynamicDecouplingSequence
+        The sequence to be saved; Defaults to None
+    filename : str
+        Name and path of the file to save the sequence into; Defaults to None
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if some of the parameters are invalid.
+
+    Notes
+    -----
+    The file stores the duration, name and pre-post rotation flag of the sequence
+    followed by the offsets, rabi rotations, azimuthal angles and detuning rotations
+    as little-endian 64-bit floats. The sequence is stored directly; no conversion
+    to a driven control takes place.
+    """
+
+    if not isinstance(dynamic_decoupling_sequence, DynamicDecouplingSequence):
+        raise ArgumentsValueError('Dynamic decoupling sequence must be of '
+                                  'DynamicDecouplingSequence type.',
+                                  {'type(dynamic_decoupling_sequence)':
+                                   type(dynamic_decoupling_sequence)})
+
+    if filename is None:
+        raise ArgumentsValueError('Invalid filename provided.',
+                                  {'filename': filename})
+
+    with open(filename, 'wb') as handle:
+        _write_record(handle, dynamic_decoupling_sequence)
+
+
+def load_dds(filename=None):
+
+    """Loads a dynamic decoupling sequence saved by `save_dds`.
+
+    Parameters
+    ----------
+    filename : str
+        Name and path of the file; Defaults to None
+
+    Returns
+    -------
+    DynamicDecouplingSequence
+        The loaded sequence
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the file does not contain a valid sequence.
+    """
+
+    if filename is None:
+        raise ArgumentsValueError('Invalid filename provided.',
+                                  {'filename': filename})
+
+    with open(filename, 'rb') as handle:
+        return _read_record(handle, filename)
+
+
+class DynamicDecouplingSequenceArchive(QctrlObject):
+    """Append-only archive file of dynamic decoupling sequences.
+
+    Each sequence is stored as a binary record in the format written by `save_dds`.
+    An index of the position of every record is built from the record headers
+    when the archive is opened, so that sequences can be loaded by name or by
+    fingerprint without reading the other records.
+
+    Parameters
+    ----------
+    filename : str
+        Name and path of the archive file. The file is created
+        when the first sequence is appended, if it does not exist.
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the file exists but is not a valid archive.
+
+    Notes
+    -----
+    If several sequences share a name or a fingerprint, the one appended
+    last is returned when loading by that name or fingerprint.
+    """
+
+    def __init__(self, filename=None):
+
+        if filename is None:
+            raise ArgumentsValueError('Invalid filename provided.',
+                                      {'filename': filename})
+
+        super(DynamicDecouplingSequenceArchive, self).__init__(
+            base_attributes=['filename'])
+
+        self.filename = filename
+        self._positions = []
+        self._names = []
+        self._fingerprints = []
+        self._name_index = dict()
+        self._fingerprint_index = dict()
+
+        if os.path.exists(self.filename):
+            self._build_index()
+
+    def _add_to_index(self, position, name, fingerprint):
+
+        """Private method to add a record to the index
+
+        Parameters
+        ----------
+        position : int
+            Position of the record in the file
+        name : str
+            Name of the sequence in the record
+        fingerprint : str
+            Fingerprint of the sequence in the record
+        """
+
+        record_index = len(self._positions)
+        self._positions.append(position)
+        self._names.append(name)
+        self._fingerprints.append(fingerprint)
+        if name is not None:
+            self._name_index[name] = record_index
+        self._fingerprint_index[fingerprint] = record_index
+
+    def _build_index(self):
+
+        """Private method to index the records by reading their headers
+        """
+
+        with open(self.filename, 'rb') as handle:
+            while True:
+                position = handle.tell()
+                header = _read_record_header(handle, self.filename)
+                if header is None:
+                    break
+                handle.seek(4 * header['number_of_offsets'] * _ARRAY_DTYPE.itemsize,
+                            os.SEEK_CUR)
+                self._add_to_index(position, header['name'], header['fingerprint'])
+
+    def __len__(self):
+        return len(self._positions)
+
+    @property
+    def names(self):
+        """Names of the archived sequences, in the order they were appended
+
+        Returns
+        -------
+        list
+            The names; None for sequences without a name
+        """
+        return list(self._names)
+
+    @property
+    def fingerprints(self):
+        """Fingerprints of the archived sequences, in the order they were appended
+
+        Returns
+        -------
+        list
+            The fingerprints as hexadecimal strings
+        """
+        return list(self._fingerprints)
+
+    def append(self, dynamic_decoupling_sequence=None):
+
+        """Appends a sequence to the archive.
+
+        Parameters
+        ----------
+        dynamic_decoupling_sequence : DynamicDecouplingSequence
+            The sequence to be appended; Defaults to None
+
+        Returns
+        -------
+        int
+            Index of the record of the sequence in the archive
+
+        Raises
+        ------
+        ArgumentsValueError
+            Raised if the sequence is invalid.
+        """
+
+        if not isinstance(dynamic_decoupling_sequence, DynamicDecouplingSequence):
+            raise ArgumentsValueError('Dynamic decoupling sequence must be of '
+                                      'DynamicDecouplingSequence type.',
+                                      {'type(dynamic_decoupling_sequence)':
+                                       type(dynamic_decoupling_sequence)})
+
+        with open(self.filename, 'ab') as handle:
+            handle.seek(0, os.SEEK_END)
+            position = handle.tell()
+            _write_record(handle, dynamic_decoupling_sequence)
+
+        self._add_to_index(position, dynamic_decoupling_sequence.name,
+                           dynamic_decoupling_sequence.get_fingerprint())
+
+        return len(self._positions) - 1
+
+    def load(self, name=None, fingerprint=None, index=None):
+
+        """Loads a sequence from the archive.
+
+        Exactly one of `name`, `fingerprint` and `index` must be supplied.
+
+        Parameters
+        ----------
+        name : str, optional
+            Name of the sequence; Defaults to None
+        fingerprint : str, optional
+            Fingerprint of the sequence; Defaults to None
+        index : int, optional
+            Index of the record in the archive; Defaults to None
+
+        Returns
+        -------
+        DynamicDecouplingSequence
+            The archived sequence
+
+        Raises
+        ------
+        ArgumentsValueError
+            Raised if the arguments are invalid or no matching sequence is found.
+        """
+
+        arguments = {'name': name, 'fingerprint': fingerprint, 'index': index}
+        if sum(value is not None for value in arguments.values()) != 1:
+            raise ArgumentsValueError('Exactly one of name, fingerprint or index '
+                                      'must be supplied.', arguments)
+
+        if name is not None:
+            record_index = self._name_index.get(name)
+        elif fingerprint is not None:
+            record_index = self._fingerprint_index.get(fingerprint)
+        else:
+            record_index = int(index)
+            if record_index < 0:
+                record_index += len(self._positions)
+            if record_index < 0 or record_index >= len(self._positions):
+                record_index = None
+
+        if record_index is None:
+            raise ArgumentsValueError('No matching sequence found in archive.',
+                                      arguments,
+                                      extras={'filename': self.filename,
+                                              'number_of_sequences': len(self)})
+
+        with open(self.filename, 'rb') as handle:
+            handle.seek(self._positions[record_index])
+            return _read_record(handle, self.filename)
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,167 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+========================
+sequences.simplification
+========================
+"""
+
+import numpy as np
+
+from qctrlopencontrols.exceptions import ArgumentsValueError
+
+from .dynamic_decoupling_sequence import DynamicDecouplingSequence
+
+
+def _reduce_angles(angles):
+
+    """Private function to reduce rotation angles to the interval [-pi, pi]
+
+    Parameters
+    ----------
+    angles : numpy.ndarray
+        The rotation angles
+
+    Returns
+    -------
+    numpy.ndarray
+        The angles minus the nearest multiple of 2 pi; the angles already in the
+        interval are unchanged
+    """
+
+    return angles - 2 * np.pi * np.round(angles / (2 * np.pi))
+
+
+def simplify_dds(dynamic_decoupling_sequence, tolerance=1e-10):
+
+    """Simplifies a dynamic decoupling sequence by merging its coincident operations
+    and removing its identity operations.
+
+    Parameters
+    ----------
+    dynamic_decoupling_sequence : DynamicDecouplingSequence
+        The sequence to be simplified
+    tolerance : float, optional
+        Operations whose offsets differ by at most tolerance times the duration of the
+        sequence coincide, and rotations within tolerance (in radians) of a multiple of
+        2 pi are identities; Defaults to 1e-10
+
+    Returns
+    -------
+    tuple
+        The simplified sequence and the number of operations removed
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised when an argument is invalid.
+
+    Notes
+    -----
+    Each operation is the rotation of angle (rabi_rotation ** 2 + detuning_rotation ** 2)
+    ** 0.5 about its axis. The coincident operations rotating about the same axis, or
+    about opposite axes, are merged into one rotation, which cancels inverse pairs;
+    coincident operations about other axes do not commute and are kept as they are.
+    Rotations by multiples of 2 pi, including the merged ones, are identities up to
+    a global phase and are removed. The merged rabi rotations are reduced to at most pi,
+    and the merged detuning rotations to [0, 2 pi), so that no rotation is negative.
+    The operations separated by a free evolution are not merged, as the pulses of a
+    sequence only refocus the dephasing over the evolution between them.
+
+    The operations at the start and the end of the sequence are set by its
+    pre_post_rotation and kept as they are; the simplified sequence is padded again
+    with the offsets at its start and end if needed.
+    """
+
+    if not isinstance(dynamic_decoupling_sequence, DynamicDecouplingSequence):
+        raise ArgumentsValueError('Expected a DynamicDecouplingSequence instance.',
+                                  {'type(dynamic_decoupling_sequence)':
+                                       type(dynamic_decoupling_sequence)})
+
+    if tolerance < 0.:
+        raise ArgumentsValueError('Tolerance must not be negative.',
+                                  {'tolerance': tolerance})
+
+    order = np.argsort(dynamic_decoupling_sequence.offsets, kind='stable')
+    offsets = dynamic_decoupling_sequence.offsets[order]
+    rabi_rotations = dynamic_decoupling_sequence.rabi_rotations[order]
+    azimuthal_angles = dynamic_decoupling_sequence.azimuthal_angles[order]
+    detuning_rotations = dynamic_decoupling_sequence.detuning_rotations[order]
+    number_of_offsets = offsets.shape[0]
+
+    # groups of coincident operations; the first and last operations are on their own
+    starts_group = np.ones(number_of_offsets, dtype=bool)
+    starts_group[1:] = np.diff(offsets) > tolerance * dynamic_decoupling_sequence.duration
+    starts_group[[1, -1]] = True
+    group_indices = np.cumsum(starts_group) - 1
+    group_starts = np.flatnonzero(starts_group)
+    group_sizes = np.diff(np.append(group_starts, number_of_offsets))
+
+    angles = np.hypot(rabi_rotations, detuning_rotations)
+    rotation_vectors = np.stack([rabi_rotations * np.cos(azimuthal_angles),
+                                 rabi_rotations * np.sin(azimuthal_angles),
+                                 detuning_rotations], axis=1)
+
+    # the axis of each group is the one of its largest rotation, if any
+    largest_angles = np.maximum.reduceat(angles, group_starts)
+    references = np.minimum.reduceat(
+        np.where(angles == largest_angles[group_indices], np.arange(number_of_offsets),
+                 number_of_offsets), group_starts)
+    largest_angles = np.where(largest_angles > 0., largest_angles, 1.)
+    axes = rotation_vectors[references] / largest_angles[:, None]
+
+    projections = np.sum(rotation_vectors * axes[group_indices], axis=1)
+    residuals = np.linalg.norm(
+        rotation_vectors - projections[:, None] * axes[group_indices], axis=1)
+    merged = np.logical_and.reduceat(residuals <= tolerance, group_starts) & (group_sizes > 1)
+    merged_angles = _reduce_angles(np.add.reduceat(projections, group_starts))
+
+    # a merged group keeps its first operation, unless the merged rotation is an identity
+    kept = np.where(merged[group_indices],
+                    starts_group & (np.abs(merged_angles) > tolerance)[group_indices],
+                    np.abs(_reduce_angles(angles)) > tolerance)
+    kept[[0, -1]] = True
+
+    # the merged rotation of a group scales the rotation of its reference
+    merged_starts = group_starts[merged]
+    scales = merged_angles[merged] / largest_angles[merged]
+    merged_references = references[merged]
+    # a negative rabi rotation flips the azimuthal angle, and a negative detuning
+    # rotation is stored as the equivalent rotation in [0, 2 pi), since the conversion
+    # to driven controls requires non-negative rotations
+    azimuthal_angles[merged_starts] = np.where(
+        (scales < 0.) & (rabi_rotations[merged_references] != 0.),
+        np.mod(azimuthal_angles[merged_references] + np.pi, 2 * np.pi),
+        azimuthal_angles[merged_references])
+    rabi_rotations[merged_starts] = np.abs(scales) * rabi_rotations[merged_references]
+    detuning_rotations[merged_starts] = np.mod(
+        scales * detuning_rotations[merged_references], 2 * np.pi)
+
+    simplified_sequence = DynamicDecouplingSequence(
+        duration=dynamic_decoupling_sequence.duration,
+        offsets=offsets[kept],
+        rabi_rotations=rabi_rotations[kept],
+        azimuthal_angles=azimuthal_angles[kept],
+        detuning_rotations=detuning_rotations[kept],
+        pre_post_rotation=dynamic_decoupling_sequence.pre_post_rotation,
+        name=dynamic_decoupling_sequence.name)
+
+    return (simplified_sequence,
+            dynamic_decoupling_sequence.number_of_offsets
+            - simplified_sequence.number_of_offsets)
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,213 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+========================
+sequences.template_store
+========================
+"""
+
+import os
+import struct
+
+import numpy as np
+
+from qctrlopencontrols.base import QctrlObject
+from qctrlopencontrols.exceptions import ArgumentsValueError
+
+_TEMPLATE_STORE_MAGIC = b'QDTS'
+
+_TEMPLATE_STORE_VERSION = 1
+
+# magic, version, reserved, number of templates, number of values
+_STORE_HEADER = struct.Struct('<4sHHQQ')
+
+# scheme, number of parameters, parameters, position of the first value, number of offsets
+_INDEX_ENTRY = struct.Struct('<32sQqqQQ')
+
+_MAXIMUM_SCHEME_LENGTH = 32
+
+_MAXIMUM_NUMBER_OF_PARAMETERS = 2
+
+_VALUE_DTYPE = np.dtype('<f8')
+
+
+def write_template_store(filename, templates):
+
+    """Writes relative templates of sequences in a template store file.
+
+    Parameters
+    ----------
+    filename : str
+        Name and path of the file; an existing file is replaced
+    templates : dict
+        The templates, keyed on (scheme, parameters) where parameters is a tuple of
+        at most two integers; each template is a tuple of the offsets of the sequence
+        of unit duration, its rabi rotations, azimuthal angles and detuning rotations
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if a key or a template is invalid.
+
+    Notes
+    -----
+    The file holds a header, an index of fixed-size entries and the values of all the
+    templates as little-endian 64-bit floats. The values of each template are its four
+    arrays, one after the other. The file is written next to its destination and moved
+    in place when complete, so that processes reading the store never see a partial file.
+    """
+
+    entries = []
+    number_of_values = 0
+    for (scheme, parameters), template in templates.items():
+        encoded_scheme = scheme.encode('utf-8')
+        if (len(encoded_scheme) > _MAXIMUM_SCHEME_LENGTH
+                or len(parameters) > _MAXIMUM_NUMBER_OF_PARAMETERS):
+            raise ArgumentsValueError('Invalid template key.',
+                                      {'scheme': scheme, 'parameters': parameters})
+
+        number_of_offsets = len(template[0])
+        if len(template) != 4 or any(len(array) != number_of_offsets for array in template):
+            raise ArgumentsValueError('Template must hold four arrays of the same length.',
+                                      {'scheme': scheme, 'parameters': parameters})
+
+        padded_parameters = tuple(parameters) + (0,) * (
+            _MAXIMUM_NUMBER_OF_PARAMETERS - len(parameters))
+        entries.append(_INDEX_ENTRY.pack(encoded_scheme, len(parameters),
+                                         *(padded_parameters + (number_of_values,
+                                                                number_of_offsets))))
+        number_of_values += 4 * number_of_offsets
+
+    temporary_filename = '{}.{}.tmp'.format(filename, os.getpid())
+    with open(temporary_filename, 'wb') as handle:
+        handle.write(_STORE_HEADER.pack(_TEMPLATE_STORE_MAGIC, _TEMPLATE_STORE_VERSION, 0,
+                                        len(entries), number_of_values))
+        handle.write(b''.join(entries))
+        for template in templates.values():
+            handle.write(np.ascontiguousarray(template, dtype=_VALUE_DTYPE).tobytes())
+    os.replace(temporary_filename, filename)
+
+
+class DynamicDecouplingTemplateStore(QctrlObject):
+    """Read-only store of relative templates of sequences, memory-mapped from a file.
+
+    The index of the store is read when it is opened; the values are memory-mapped,
+    so that processes opening the same store share its pages and only the templates
+    in use are read from disk.
+
+    Parameters
+    ----------
+    filename : str
+        Name and path of a file written by `write_template_store`
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the file is not a valid template store.
+    """
+
+    def __init__(self, filename=None):
+
+        if filename is None:
+            raise ArgumentsValueError('Invalid filename provided.',
+                                      {'filename': filename})
+
+        super(DynamicDecouplingTemplateStore, self).__init__(
+            base_attributes=['filename'])
+
+        self.filename = filename
+        self._index = dict()
+
+        with open(self.filename, 'rb') as handle:
+            header = handle.read(_STORE_HEADER.size)
+            if len(header) != _STORE_HEADER.size:
+                raise ArgumentsValueError('File does not contain a template store.',
+                                          {'filename': filename})
+
+            magic, version, _, number_of_templates, number_of_values = \
+                _STORE_HEADER.unpack(header)
+            if magic != _TEMPLATE_STORE_MAGIC or version != _TEMPLATE_STORE_VERSION:
+                raise ArgumentsValueError('File does not contain a supported template store.',
+                                          {'filename': filename},
+                                          extras={'magic': magic, 'version': version})
+
+            index = handle.read(number_of_templates * _INDEX_ENTRY.size)
+            if len(index) != number_of_templates * _INDEX_ENTRY.size:
+                raise ArgumentsValueError('Truncated template store index.',
+                                          {'filename': filename})
+
+        for entry in _INDEX_ENTRY.iter_unpack(index):
+            scheme, number_of_parameters = entry[0].rstrip(b'\0').decode('utf-8'), entry[1]
+            parameters = tuple(entry[2:2 + number_of_parameters])
+            self._index[(scheme, parameters)] = (entry[4], entry[5])
+
+        values_position = _STORE_HEADER.size + number_of_templates * _INDEX_ENTRY.size
+        if os.path.getsize(self.filename) != (values_position
+                                              + number_of_values * _VALUE_DTYPE.itemsize):
+            raise ArgumentsValueError('Truncated template store values.',
+                                      {'filename': filename})
+
+        self._values = np.memmap(self.filename, dtype=_VALUE_DTYPE, mode='r',
+                                 offset=values_position, shape=(number_of_values,)) \
+            if number_of_values else np.zeros((0,), dtype=_VALUE_DTYPE)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    @property
+    def keys(self):
+        """Keys of the stored templates
+
+        Returns
+        -------
+        list
+            The (scheme, parameters) of the templates, in the order they were written
+        """
+        return list(self._index)
+
+    def get(self, scheme, parameters):
+
+        """Returns a stored template.
+
+        Parameters
+        ----------
+        scheme : str
+            The name of the scheme
+        parameters : tuple
+            The order parameters of the scheme, as integers
+
+        Returns
+        -------
+        tuple or None
+            The offsets of the sequence of unit duration, its rabi rotations, azimuthal
+            angles and detuning rotations, as read-only arrays mapped from the file;
+            None if the template is not in the store
+        """
+
+        location = self._index.get((scheme, tuple(parameters)))
+        if location is None:
+            return None
+
+        start, number_of_offsets = location
+        values = self._values[start:start + 4 * number_of_offsets]
+
+        return tuple(np.reshape(values, (4, number_of_offsets)))
+
+
+if __name__ == '__main__':
+    pass
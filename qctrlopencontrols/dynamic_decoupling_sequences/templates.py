@@ -0,0 +1,824 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+===================
+sequences.templates
+===================
+"""
+
+import itertools
+
+import numpy as np
+
+from qctrlopencontrols.base import LRUCache
+from qctrlopencontrols.exceptions import ArgumentsValueError
+
+from .constants import (WALSH_SINGLE_AXIS,
+                        QUADRATIC,
+                        X_CONCATENATED,
+                        XY_CONCATENATED,
+                        UPPER_BOUND_OFFSETS)
+
+from .template_store import DynamicDecouplingTemplateStore, write_template_store
+from .scheme_registry import get_dds_scheme
+
+# highest paley order of the walsh sequences; the sequences of paley orders 2 ** k
+# and above have at least 2 ** k offsets
+_MAXIMUM_PALEY_ORDER = 2 ** UPPER_BOUND_OFFSETS.bit_length() - 1
+
+# relative templates of the predefined sequences, keyed on the scheme and its
+# order parameters
+_TEMPLATE_CACHE = LRUCache(maximum_size=128)
+
+# store of precomputed templates consulted before computing a template; see
+# set_template_store
+_TEMPLATE_STORE = None
+
+# highest order parameter of the templates written by build_template_store, for the
+# schemes whose order parameters are bounded only by the number of offsets
+_DEFAULT_STORE_MAXIMUM_ORDER = 100
+
+_DEFAULT_STORE_MAXIMUM_ORDERS = {
+    WALSH_SINGLE_AXIS: 256,
+    QUADRATIC: 20}
+
+
+def set_template_cache_size(maximum_size=128):
+
+    """Sets the maximum number of relative templates remembered by the
+    predefined sequences.
+
+    Parameters
+    ----------
+    maximum_size : int, optional
+        Maximum number of templates held in the cache; Defaults to 128.
+        0 disables the cache.
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the maximum size is negative.
+
+    Notes
+    -----
+    A template holds the offsets of a sequence of unit duration and its rotations; it
+    depends only on the scheme and its order parameters (e.g. number of offsets, paley
+    order or concatenation order), so that it is shared by the sequences of all
+    durations. The cache is enabled with a maximum size of 128 initially.
+    """
+
+    _TEMPLATE_CACHE.resize(maximum_size)
+
+
+def clear_template_cache():
+
+    """Discards the templates held in the cache of the predefined sequences
+    and resets its numbers of hits and misses.
+    """
+
+    _TEMPLATE_CACHE.clear()
+
+
+def get_template_cache_info():
+
+    """Returns the statistics of the cache of the predefined sequences.
+
+    Returns
+    -------
+    dict
+        The numbers of 'hits' and 'misses', the 'hit_rate' (None before the first lookup),
+        the current 'size' and the 'maximum_size' of the cache
+    """
+
+    return _TEMPLATE_CACHE.get_info()
+
+
+def set_template_store(filename=None):
+
+    """Sets the template store consulted by the predefined sequences.
+
+    Parameters
+    ----------
+    filename : str, optional
+        Name and path of a template store file written by `build_template_store`;
+        Defaults to None, which stops using a template store
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the file is not a valid template store.
+
+    Notes
+    -----
+    The templates missing from the cache are read from the store, if present, instead
+    of being computed. The store is memory-mapped, so that the worker processes using
+    the same store share it.
+    """
+
+    global _TEMPLATE_STORE     # pylint: disable=global-statement
+
+    _TEMPLATE_STORE = None if filename is None else DynamicDecouplingTemplateStore(filename)
+
+
+def build_template_store(filename, maximum_order=None, schemes=None):
+
+    """Computes the relative templates of predefined sequences and writes them in
+    a template store file.
+
+    Parameters
+    ----------
+    filename : str
+        Name and path of the template store file; an existing file is replaced
+    maximum_order : int, optional
+        The highest order parameter of the templates (number of offsets, paley order,
+        numbers of inner and outer offsets or concatenation order); Defaults to None,
+        which uses a limit per scheme
+    schemes : list, optional
+        The names of the schemes, which must have a template function; Defaults to None,
+        which selects the schemes that are the most expensive to generate:
+        'Walsh single-axis', 'quadratic', 'X concatenated' and 'XY concatenated'
+
+    Returns
+    -------
+    int
+        The number of templates written
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if an argument is invalid.
+
+    Notes
+    -----
+    The templates of all the orders up to the maximum order are written, except the ones
+    with more offsets than UPPER_BOUND_OFFSETS. The store can be built once, with
+    `python -m qctrlopencontrols.dynamic_decoupling_sequences FILENAME`,
+    and used by each process with `set_template_store`.
+    """
+
+    if schemes is None:
+        schemes = [WALSH_SINGLE_AXIS, QUADRATIC, X_CONCATENATED, XY_CONCATENATED]
+    schemes = [get_dds_scheme(scheme) for scheme in schemes]
+
+    for scheme in schemes:
+        if scheme.template_function is None:
+            raise ArgumentsValueError('Templates are not available for the scheme.',
+                                      {'scheme': scheme.name})
+
+    if maximum_order is not None and int(maximum_order) < 1:
+        raise ArgumentsValueError('Maximum order must be at least 1.',
+                                  {'maximum_order': maximum_order})
+
+    templates = dict()
+    for scheme in schemes:
+        scheme_maximum_order = int(maximum_order) if maximum_order is not None \
+            else _DEFAULT_STORE_MAXIMUM_ORDERS.get(scheme.name, _DEFAULT_STORE_MAXIMUM_ORDER)
+
+        orders = [range(minimum, scheme_maximum_order + 1 if maximum is None
+                        else min(maximum, scheme_maximum_order) + 1)
+                  for _, _, minimum, maximum in scheme.parameters]
+        for parameters in itertools.product(*orders):
+            if (scheme.number_of_offsets is not None
+                    and scheme.number_of_offsets(*parameters) > UPPER_BOUND_OFFSETS):
+                continue
+            template = scheme.template_function(*parameters)
+            if template[0].shape[0] <= UPPER_BOUND_OFFSETS:
+                templates[(scheme.name, parameters)] = tuple(
+                    np.asarray(array, dtype=np.float) for array in template)
+
+    write_template_store(filename, templates)
+
+    return len(templates)
+
+
+def _get_relative_template(scheme, template_function, *parameters):
+
+    """Private function to get the relative template of a predefined sequence
+    from the cache or the template store, computing it if needed, and caching it
+
+    Parameters
+    ----------
+    scheme : str
+        The name of the scheme
+    template_function : callable
+        The function computing the template from the parameters
+    parameters : tuple
+        The order parameters of the scheme, as integers
+
+    Returns
+    -------
+    tuple
+        The offsets of the sequence of unit duration, its rabi rotations, azimuthal
+        angles and detuning rotations; the arrays are read-only
+    """
+
+    template = _lookup_relative_template(scheme, parameters)
+    if template is None:
+        template = _cache_relative_template(scheme, parameters,
+                                            template_function(*parameters))
+
+    return template
+
+
+def _lookup_relative_template(scheme, parameters):
+
+    """Private function to look up the relative template of a sequence in the cache
+    and then in the template store
+
+    Parameters
+    ----------
+    scheme : str
+        The name of the scheme
+    parameters : tuple
+        The order parameters of the scheme, as integers
+
+    Returns
+    -------
+    tuple or None
+        The template; None if it is neither cached nor stored
+    """
+
+    template = _TEMPLATE_CACHE.get((scheme,) + parameters)
+    if template is None and _TEMPLATE_STORE is not None:
+        template = _TEMPLATE_STORE.get(scheme, parameters)
+
+    return template
+
+
+def _cache_relative_template(scheme, parameters, template):
+
+    """Private function to convert the arrays of a relative template to read-only
+    arrays of floats, check the template and add it to the cache
+
+    Parameters
+    ----------
+    scheme : str
+        The name of the scheme
+    parameters : tuple
+        The order parameters of the scheme, as integers
+    template : tuple
+        The offsets of the sequence of unit duration, its rabi rotations, azimuthal
+        angles and detuning rotations, as arrays or lists
+
+    Returns
+    -------
+    tuple
+        The template, as arrays
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the template is invalid.
+    """
+
+    template = tuple(np.array(array, dtype=np.float) for array in template)
+    _check_template(scheme, parameters, template)
+
+    for array in template:
+        array.setflags(write=False)
+    _TEMPLATE_CACHE.put((scheme,) + parameters, template)
+
+    return template
+
+
+def _check_template(scheme, parameters, template):
+
+    """Private function to check that a relative template can be scaled to
+    sequences of any duration
+
+    Parameters
+    ----------
+    scheme : str
+        The name of the scheme
+    parameters : tuple
+        The order parameters of the template
+    template : tuple
+        The offsets of the sequence of unit duration, its rabi rotations, azimuthal
+        angles and detuning rotations, as arrays
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the template is invalid.
+    """
+
+    if (len(template) != 4 or template[0].ndim != 1 or template[0].shape[0] == 0
+            or any(array.shape != template[0].shape for array in template)):
+        raise ArgumentsValueError('Template must hold four non-empty arrays of the same '
+                                  'length.',
+                                  {'scheme': scheme, 'parameters': parameters})
+
+    if template[0].shape[0] > UPPER_BOUND_OFFSETS:
+        raise ArgumentsValueError(
+            'Number of offsets is above the allowed number of maximum offsets. ',
+            {'number_of_offsets': template[0].shape[0],
+             'allowed_maximum_offsets': UPPER_BOUND_OFFSETS})
+
+    if np.any(template[0] < 0.) or np.any(template[0] > 1.):
+        raise ArgumentsValueError(
+            'Offsets for dynamic decoupling sequence must be between 0 and sequence '
+            'duration (inclusive). ',
+            {'scheme': scheme, 'parameters': parameters})
+
+
+def _carr_purcell_template(number_of_offsets):
+
+    """Private function to compute the relative template of Carr-Purcell sequence
+
+    Parameters
+    ----------
+    number_of_offsets : int
+        The number of offsets
+
+    Returns
+    -------
+    tuple
+        The relative offsets, rabi rotations, azimuthal angles and detuning rotations
+    """
+
+    offsets = _carr_purcell_meiboom_gill_offsets(1., number_of_offsets)
+
+    # all the pulses are X_pi
+    return (offsets, np.full(offsets.shape, np.pi),
+            np.zeros(offsets.shape), np.zeros(offsets.shape))
+
+
+def _carr_purcell_meiboom_gill_template(number_of_offsets):
+
+    """Private function to compute the relative template of Carr-Purcell-Meiboom-Gill
+    sequence
+
+    Parameters
+    ----------
+    number_of_offsets : int
+        The number of offsets
+
+    Returns
+    -------
+    tuple
+        The relative offsets, rabi rotations, azimuthal angles and detuning rotations
+    """
+
+    offsets = _carr_purcell_meiboom_gill_offsets(1., number_of_offsets)
+
+    # all the pulses are Y_pi
+    return (offsets, np.full(offsets.shape, np.pi),
+            np.full(offsets.shape, np.pi / 2), np.zeros(offsets.shape))
+
+
+def _uhrig_single_axis_template(number_of_offsets):
+
+    """Private function to compute the relative template of Uhrig single-axis sequence
+
+    Parameters
+    ----------
+    number_of_offsets : int
+        The number of offsets
+
+    Returns
+    -------
+    tuple
+        The relative offsets, rabi rotations, azimuthal angles and detuning rotations
+    """
+
+    offsets = _uhrig_single_axis_offsets(1., number_of_offsets)
+
+    # all the pulses are Y_pi
+    return (offsets, np.full(offsets.shape, np.pi),
+            np.full(offsets.shape, np.pi / 2), np.zeros(offsets.shape))
+
+
+def _periodic_single_axis_template(number_of_offsets):
+
+    """Private function to compute the relative template of periodic single-axis
+    sequence
+
+    Parameters
+    ----------
+    number_of_offsets : int
+        The number of offsets
+
+    Returns
+    -------
+    tuple
+        The relative offsets, rabi rotations, azimuthal angles and detuning rotations
+    """
+
+    spacing = 1./(number_of_offsets+1)
+    offsets = spacing * np.arange(1, number_of_offsets+1)
+
+    # all the pulses are X_pi
+    return (offsets, np.full(offsets.shape, np.pi),
+            np.zeros(offsets.shape), np.zeros(offsets.shape))
+
+
+def _walsh_single_axis_template(paley_order):
+
+    """Private function to compute the relative template of Walsh single-axis sequence
+
+    Parameters
+    ----------
+    paley_order : int
+        The paley order of the walsh sequence
+
+    Returns
+    -------
+    tuple
+        The relative offsets, rabi rotations, azimuthal angles and detuning rotations
+
+    Raises
+    ------
+    ArgumentsValueError
+        Raised if the sequence has more offsets than allowed.
+    """
+
+    hamming_weight = paley_order.bit_length()
+    samples = 2 ** hamming_weight
+    switching_mask = int(_walsh_switching_masks(np.array([paley_order]), hamming_weight)[0])
+
+    number_of_offsets = _inverse_gray_codes(paley_order, hamming_weight)
+    if number_of_offsets > UPPER_BOUND_OFFSETS:
+        raise ArgumentsValueError(
+            'Number of offsets is above the allowed number of maximum offsets. ',
+            {'paley_order': paley_order},
+            extras={'number_of_offsets': number_of_offsets,
+                    'allowed_maximum_offsets': UPPER_BOUND_OFFSETS})
+
+    # the walsh function switches between the samples i-1 and i if the lowest
+    # set bit of i is in the switching mask
+    steps = np.arange(1, samples, dtype=np.int64)
+    offsets = steps[((steps & -steps) & switching_mask) != 0] / samples
+
+    # all the pulses are X_pi
+    return (offsets, np.full(offsets.shape, np.pi),
+            np.zeros(offsets.shape), np.zeros(offsets.shape))
+
+
+def _quadratic_template(number_inner_offsets, number_outer_offsets):
+
+    """Private function to compute the relative template of quadratic sequence
+
+    Parameters
+    ----------
+    number_inner_offsets : int
+        Number of inner Z-pi Pulses
+    number_outer_offsets : int
+        Number of outer X-pi Pulses
+
+    Returns
+    -------
+    tuple
+        The relative offsets, rabi rotations, azimuthal angles and detuning rotations
+    """
+
+    outer_offsets = _uhrig_single_axis_offsets(1., number_outer_offsets)
+    outer_offsets = np.insert(outer_offsets, [0, outer_offsets.shape[0]], [0, 1.])
+    starts = outer_offsets[0:-1]
+    ends = outer_offsets[1:]
+    inner_durations = ends - starts
+
+    # the inner offsets scale the same relative offsets to each outer interval
+    relative_inner_offsets = _uhrig_single_axis_offsets(1., number_inner_offsets)
+    offsets = np.zeros((inner_durations.shape[0], number_inner_offsets + 1))
+    offsets[:, 0:number_inner_offsets] = (
+        inner_durations[:, np.newaxis] * relative_inner_offsets[np.newaxis, :]
+        + starts[:, np.newaxis])
+    offsets[0:number_outer_offsets, -1] = outer_offsets[1:-1]
+
+    rabi_rotations = np.zeros(offsets.shape)
+    detuning_rotations = np.zeros(offsets.shape)
+
+    rabi_rotations[0:number_outer_offsets, -1] = np.pi
+    detuning_rotations[0:(number_outer_offsets + 1), 0:number_inner_offsets] = np.pi
+
+    # make all the arrays 1D and remove the last entry corresponding to the duration
+    offsets = np.reshape(offsets, (-1,))[0:-1]
+    rabi_rotations = np.reshape(rabi_rotations, (-1,))[0:-1]
+    detuning_rotations = np.reshape(detuning_rotations, (-1,))[0:-1]
+
+    return offsets, rabi_rotations, np.zeros(offsets.shape), detuning_rotations
+
+
+def _x_concatenated_template(concatenation_order):
+
+    """Private function to compute the relative template of X-concatenated sequence
+
+    Parameters
+    ----------
+    concatenation_order : int
+        The number of concatenation of base sequence
+
+    Returns
+    -------
+    tuple
+        The relative offsets, rabi rotations, azimuthal angles and detuning rotations
+    """
+
+    offsets = _x_concatenated_offsets(1., concatenation_order)
+
+    # all the pulses are X_pi
+    return (offsets, np.full(offsets.shape, np.pi),
+            np.zeros(offsets.shape), np.zeros(offsets.shape))
+
+
+def _xy_concatenated_template(concatenation_order):
+
+    """Private function to compute the relative template of XY-concatenated sequence
+
+    Parameters
+    ----------
+    concatenation_order : int
+        The number of concatenation of base sequence
+
+    Returns
+    -------
+    tuple
+        The relative offsets, rabi rotations, azimuthal angles and detuning rotations
+    """
+
+    rabi_offsets, azimuthal_offsets, detuning_offsets = _xy_concatenated_offsets(
+        1., concatenation_order)
+
+    # merge the pulses by offset; the stable sort places y pulses before x pulses,
+    # and z pulses after both, when they coincide
+    offsets = np.concatenate((azimuthal_offsets, rabi_offsets, detuning_offsets))
+    axes = np.repeat([1, 0, 2], [len(azimuthal_offsets), len(rabi_offsets),
+                                 len(detuning_offsets)])
+
+    order = np.argsort(offsets, kind='stable')
+    offsets = offsets[order]
+    axes = axes[order]
+
+    rabi_rotations = np.where(axes != 2, np.pi, 0.)
+    azimuthal_angles = np.where(axes == 1, np.pi / 2, 0.)
+    detuning_rotations = np.where(axes == 2, np.pi, 0.)
+
+    return offsets, rabi_rotations, azimuthal_angles, detuning_rotations
+
+
+def _walsh_switching_masks(paley_orders, hamming_weight):
+
+    """Private function to compute the switching masks of Walsh functions
+
+    Parameters
+    ----------
+    paley_orders : numpy.ndarray
+        The paley orders, as integers of at most hamming_weight bits
+    hamming_weight : int
+        The number of bits of the sample indices; the Walsh functions are sampled
+        at 2 ** hamming_weight points
+
+    Returns
+    -------
+    numpy.ndarray
+        The switching masks; the Walsh function switches sign between the samples i-1
+        and i if the lowest set bit of i is set in the switching mask
+
+    Notes
+    -----
+    The Walsh function of paley order p has the sign (-1) ** popcount(i & r) at the
+    sample i, where r is p with its bits reversed. Between the samples i-1 and i, the
+    bits up to the lowest set bit k of i change, so the sign switches if the parity
+    of the bits 0 to k of r is odd. That parity is bit hamming_weight - 1 - k of the
+    inverse Gray code of p.
+    """
+
+    inverse_gray_codes = _inverse_gray_codes(np.array(paley_orders, dtype=np.int64),
+                                             hamming_weight)
+
+    switching_masks = np.zeros(inverse_gray_codes.shape, dtype=np.int64)
+    for bit in range(hamming_weight):
+        switching_masks |= ((inverse_gray_codes >> (hamming_weight - 1 - bit)) & 1) << bit
+
+    return switching_masks
+
+
+def _inverse_gray_codes(gray_codes, number_of_bits):
+
+    """Private function to invert Gray codes
+
+    Parameters
+    ----------
+    gray_codes : int or numpy.ndarray
+        The Gray codes, of at most number_of_bits bits
+    number_of_bits : int
+        The number of bits
+
+    Returns
+    -------
+    int or numpy.ndarray
+        The values whose Gray codes are given; bit k of the value is the parity of the
+        bits k and above of its Gray code
+
+    Notes
+    -----
+    The inverse Gray code of the paley order p is also the number of offsets of the Walsh
+    sequence of paley order p: the sample indices below 2 ** hamming_weight with the
+    lowest set bit k are 2 ** (hamming_weight - 1 - k), and the switching mask has the
+    bit k set if the inverse Gray code has the bit hamming_weight - 1 - k set.
+    """
+
+    shift = 1
+    while shift < number_of_bits:
+        gray_codes = gray_codes ^ (gray_codes >> shift)
+        shift *= 2
+
+    return gray_codes
+
+
+def _carr_purcell_meiboom_gill_offsets(duration=1.0, number_of_offsets=1):
+
+    """Offset values for Carr-Purcell_Meiboom-Gill sequence.
+
+    Parameters
+    ----------
+    duration : float, optional
+        Duration of the total sequence; defaults to 1.0
+    number_of_offsets : int, optional
+        The number of offsets; defaults to 1
+
+    Returns
+    ------
+    numpy.ndarray
+        The offset values
+    """
+
+    spacing = 1./number_of_offsets
+    start = spacing * 0.5
+
+    # prepare the offsets for delta comb
+    deltas = spacing * np.arange(number_of_offsets)
+    deltas += start
+
+    offsets = deltas * duration
+
+    return offsets
+
+
+def _uhrig_single_axis_offsets(duration=1.0, number_of_offsets=1):
+
+    """Offset values for Uhrig Single Axis Sequence.
+
+    Parameters
+    ----------
+    duration : float, optional
+        Duration of the total sequence; defaults to 1.0
+    number_of_offsets : int, optional
+        The number of offsets; defaults to 1
+
+    Returns
+    ------
+    numpy.ndarray
+        The offset values
+    """
+
+    # prepare the offsets for delta comb
+    constant = 1./(2*number_of_offsets+2)
+    deltas = np.sin(np.pi * np.arange(1, number_of_offsets+1) * constant) ** 2
+
+    offsets = duration * deltas
+
+    return offsets
+
+
+def _x_concatenated_offsets(duration=1.0, concatenation_order=1):
+
+    """Offset values for X-Concatenated Sequence.
+
+    Parameters
+    ----------
+    duration : float, optional
+        Duration of the total sequence; defaults to 1.0
+    concatenation_order : int, optional
+        The number of concatenation of base sequence; defaults to 1
+
+    Returns
+    ------
+    numpy.ndarray
+        The offset values
+
+    Notes
+    -----
+    Each concatenation splits the sequence into halves, so the pulses of the sequence of
+    order n lie on the grid :math:`k\\tau/2^n`. Coinciding X pulses of the nested
+    sequences cancel, which leaves a pulse at each k from 1 to :math:`2^n-1` whose
+    number of trailing zero bits is even.
+    """
+
+    steps = np.arange(1, 2 ** concatenation_order, dtype=np.int64)
+
+    # lowest set bit of each step; it is at an even position for the pulses
+    lowest_bits = steps & -steps
+    steps = steps[(lowest_bits & 0x5555555555555555) != 0]
+
+    return steps * (duration / 2 ** concatenation_order)
+
+
+def _xy_concatenated_operations(concatenation_order=1):
+
+    """Private function to prepare the sequence of operations for xy-concatenated
+    dynamical decoupling sequence
+
+    Parameters
+    ----------
+    concatenation_order : int, optional
+        The number of concatenation of base sequence; defaults to 1
+
+    Returns
+    ------
+    numpy.ndarray
+        The operations; 1 for a free evolution of one unit of time, and -1, -2 and -3
+        for a pi pulse around the x, y and z axis respectively
+
+    Notes
+    -----
+    The operations T of the previous order are concatenated as TXTYTXTY. Y followed by X
+    is replaced by Z and two consecutive Y pulses cancel; since T starts with a free
+    evolution, the operations of order n are T'ZT'T'ZTY with T' the operations T without
+    their last operation, where TY is replaced by T' if T ends with Y. The operations are
+    built in place, each order from copies of the start of the array.
+    """
+
+    base_operations = np.array([1, -1, 1, -2, 1, -1, 1, -2])
+
+    # each order has at most four times the operations of the previous order
+    operations = np.zeros(base_operations.shape[0] * 4 ** (concatenation_order - 1),
+                          dtype=np.int64)
+    operations[0:base_operations.shape[0]] = base_operations
+    number_of_operations = base_operations.shape[0]
+
+    for _ in range(1, concatenation_order):
+        size = number_of_operations
+        last_operation = operations[size - 1]
+
+        operations[size - 1] = -3
+        operations[size:2 * size - 1] = operations[0:size - 1]
+        operations[2 * size - 1:3 * size - 2] = operations[0:size - 1]
+        operations[3 * size - 2] = -3
+        operations[3 * size - 1:4 * size - 2] = operations[0:size - 1]
+
+        if last_operation == -2:
+            number_of_operations = 4 * size - 2
+        else:
+            operations[4 * size - 2] = last_operation
+            operations[4 * size - 1] = -2
+            number_of_operations = 4 * size
+
+    return operations[0:number_of_operations]
+
+
+def _xy_concatenated_offsets(duration=1.0, concatenation_order=1):
+
+    """Offset values for XY-Concatenated Sequence.
+
+    Parameters
+    ----------
+    duration : float, optional
+        Duration of the total sequence; defaults to 1.0
+    concatenation_order : int, optional
+        The number of concatenation of base sequence; defaults to 1
+
+    Returns
+    ------
+    tuple
+        The offsets of the pi pulses around the x, y and z axis
+
+    Notes
+    -----
+    Pulses around the same axis at the same time cancel, so there is a pulse around an
+    axis at the times with an odd number of operations around that axis.
+    """
+
+    operations = _xy_concatenated_operations(concatenation_order)
+    free_evolutions = operations == 1
+
+    # the times are accumulated unit by unit, as the operations are carried out
+    unit_spacing = duration / (2 ** (concatenation_order*2))
+    times = np.cumsum(np.full(np.count_nonzero(free_evolutions), unit_spacing))
+
+    # the operations take place after the free evolutions preceding them
+    time_indices = np.cumsum(free_evolutions) - 1
+
+    offsets = []
+    for operation in [-1, -2, -3]:
+        numbers_of_pulses = np.bincount(time_indices[operations == operation],
+                                        minlength=times.shape[0])
+        offsets.append(times[numbers_of_pulses % 2 == 1])
+
+    return offsets[0], offsets[1], offsets[2]
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,105 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+=====================================
+Tests for the batch conversion of DDS
+=====================================
+"""
+
+import pytest
+import numpy as np
+
+from qctrlopencontrols.exceptions import ArgumentsValueError
+from qctrlopencontrols import (
+    DynamicDecouplingSequence, new_predefined_dds,
+    convert_dds_to_driven_controls, convert_dds_batch_to_driven_controls)
+
+
+def test_batch_conversion():
+
+    """Tests that the batch conversion matches the conversion of each sequence
+    """
+
+    sequences = [
+        new_predefined_dds(scheme='Ramsey', duration=1.),
+        new_predefined_dds(scheme='spin echo', duration=1., pre_post_rotation=True),
+        new_predefined_dds(scheme='Carr-Purcell-Meiboom-Gill', duration=1.,
+                           number_of_offsets=20, pre_post_rotation=True),
+        new_predefined_dds(scheme='XY concatenated', duration=1., concatenation_order=2),
+        DynamicDecouplingSequence(duration=1., offsets=[0.25, 0.75],
+                                  rabi_rotations=[0., np.pi],
+                                  azimuthal_angles=[0., np.pi / 2],
+                                  detuning_rotations=[np.pi, 0.])]
+
+    maximum_rabi_rates, maximum_detuning_rates = np.meshgrid(
+        2 * np.pi * np.array([1e3, 1e4, 1e5]), 2 * np.pi * np.array([1e3, 1e5]))
+
+    batch = convert_dds_batch_to_driven_controls(
+        sequences, maximum_rabi_rates=maximum_rabi_rates,
+        maximum_detuning_rates=maximum_detuning_rates)
+
+    assert len(batch) == 30
+    assert np.all(batch.valid)
+    assert np.array_equal(batch.sequence_indices, np.repeat(np.arange(5), 6))
+
+    for index in range(len(batch)):
+        driven_control = convert_dds_to_driven_controls(
+            sequences[batch.sequence_indices[index]],
+            maximum_rabi_rate=batch.maximum_rabi_rates[index],
+            maximum_detuning_rate=batch.maximum_detuning_rates[index])
+        assert np.array_equal(driven_control.segments, batch.get_segments(index))
+        assert np.array_equal(driven_control.segments,
+                              batch.get_driven_control(index).segments)
+
+    assert batch.number_of_segments[0] == 1
+    assert np.allclose(batch.get_segments(0), [[0., 0., 0., 1.]])
+
+    pool_batch = convert_dds_batch_to_driven_controls(
+        sequences, maximum_rabi_rates=maximum_rabi_rates,
+        maximum_detuning_rates=maximum_detuning_rates, max_workers=2, chunk_size=2)
+
+    assert np.array_equal(batch.segments, pool_batch.segments)
+    assert np.array_equal(batch.segment_indices, pool_batch.segment_indices)
+
+
+def test_invalid_batch_conversion():
+
+    """Tests the conversion of sequences that cannot be converted at some rates
+    """
+
+    sequence = new_predefined_dds(scheme='Carr-Purcell', duration=1.,
+                                  number_of_offsets=10)
+    maximum_rabi_rates = 2 * np.pi * np.array([1., 1e4])
+
+    with pytest.raises(ArgumentsValueError):
+        _ = convert_dds_batch_to_driven_controls(
+            sequence, maximum_rabi_rates=maximum_rabi_rates)
+
+    batch = convert_dds_batch_to_driven_controls(
+        sequence, maximum_rabi_rates=maximum_rabi_rates, skip_invalid=True)
+
+    assert np.array_equal(batch.valid, [False, True])
+    assert np.array_equal(batch.number_of_segments, [0, 21])
+
+    with pytest.raises(ArgumentsValueError):
+        _ = batch.get_driven_control(0)
+
+    with pytest.raises(ArgumentsValueError):
+        _ = convert_dds_batch_to_driven_controls(
+            sequence, maximum_rabi_rates=[-1., 1.])
+
+
+if __name__ == '__main__':
+    pass
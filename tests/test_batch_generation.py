@@ -0,0 +1,119 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+=======================================
+Tests for grids of predefined sequences
+=======================================
+"""
+
+import pytest
+import numpy as np
+
+from qctrlopencontrols.exceptions import ArgumentsValueError
+from qctrlopencontrols import (
+    new_predefined_dds, new_predefined_dds_grid, DynamicDecouplingSequenceBatch,
+    register_dds_scheme, unregister_dds_scheme, get_dds_scheme_names, clear_template_cache)
+
+
+def _check_batch(batch):
+    """Checks the sequences of a batch against new_predefined_dds
+    """
+
+    for index in range(len(batch)):
+        sequence = new_predefined_dds(
+            scheme=batch.schemes[index], duration=batch.durations[index],
+            pre_post_rotation=bool(batch.pre_post_rotations[index]),
+            **batch.order_parameters[index])
+        batch_sequence = batch.get_sequence(index)
+        assert batch_sequence.number_of_offsets == batch.number_of_offsets[index]
+        for name in ['offsets', 'rabi_rotations', 'azimuthal_angles', 'detuning_rotations']:
+            assert np.array_equal(getattr(sequence, name), getattr(batch_sequence, name))
+
+
+def test_predefined_dds_grid():
+
+    """Tests creating a grid of the predefined sequences
+    """
+
+    clear_template_cache()
+    batch = new_predefined_dds_grid(
+        get_dds_scheme_names(), durations=[0.5, 3.], pre_post_rotations=[False, True],
+        number_of_offsets=[1, 4], paley_order=[5, 6, 7], concatenation_order=3,
+        number_inner_offsets=[1, 2], number_outer_offsets=2)
+
+    assert len(batch) == (2 + 4 * 2 + 3 + 2 + 1 + 1) * 2 * 2
+    assert batch.schemes[0:4] == ['Ramsey'] * 4
+    assert batch.order_parameters[-1] == {'concatenation_order': 3}
+    assert np.array_equal(batch.durations[0:4], [0.5, 0.5, 3., 3.])
+    assert np.array_equal(batch.pre_post_rotations[0:4], [False, True, False, True])
+    _check_batch(batch)
+
+    parallel_batch = new_predefined_dds_grid(
+        get_dds_scheme_names(), durations=[0.5, 3.], pre_post_rotations=[False, True],
+        number_of_offsets=[1, 4], paley_order=[5, 6, 7], concatenation_order=3,
+        number_inner_offsets=[1, 2], number_outer_offsets=2, max_workers=2, chunk_size=2)
+    assert np.array_equal(batch.offsets, parallel_batch.offsets)
+    assert np.array_equal(batch.offset_indices, parallel_batch.offset_indices)
+
+    with pytest.raises(ArgumentsValueError):
+        _ = new_predefined_dds_grid('Carr-Purcell', number_of_offsets=[1, 10001])
+    with pytest.raises(ArgumentsValueError):
+        _ = new_predefined_dds_grid('Carr-Purcell', paley_order=2)
+    with pytest.raises(ArgumentsValueError):
+        _ = new_predefined_dds_grid('Carr-Purcell', durations=[1., 0.])
+    with pytest.raises(ArgumentsValueError):
+        _ = new_predefined_dds_grid('Walsh single-axis', paley_order=16000)
+    with pytest.raises(ArgumentsValueError):
+        _ = DynamicDecouplingSequenceBatch(
+            offsets=[0., 1.], rabi_rotations=[0., 0.], azimuthal_angles=[0., 0.],
+            detuning_rotations=[0., 0.], offset_indices=[0, 1], durations=[1., 1.],
+            pre_post_rotations=[False])
+
+
+def _edge_template(number_of_pulses):
+    """Relative template of pulses including the start and the end of the sequence
+    """
+
+    offsets = np.linspace(0., 1., number_of_pulses)
+    return (offsets, np.full(offsets.shape, np.pi),
+            np.zeros(offsets.shape), np.zeros(offsets.shape))
+
+
+def test_registered_scheme_grid():
+
+    """Tests creating a grid of sequences of registered schemes
+    """
+
+    register_dds_scheme('edge pulses', template_function=_edge_template,
+                        parameters=[('number_of_pulses', 2, 2, 100)])
+    register_dds_scheme('generated', generator=lambda **kwargs: new_predefined_dds(
+        scheme='Carr-Purcell', **kwargs), parameters=[('number_of_offsets', 1, 1, 100)])
+
+    try:
+        clear_template_cache()
+        batch = new_predefined_dds_grid(['edge pulses', 'generated'], durations=[1., 2.5],
+                                        pre_post_rotations=[True, False],
+                                        number_of_pulses=[2, 5], number_of_offsets=3)
+        assert np.array_equal(batch.number_of_offsets, [2] * 4 + [5] * 4 + [5] * 4)
+        assert np.array_equal(batch.rabi_rotations[0:2], [np.pi / 2, np.pi / 2])
+        _check_batch(batch)
+    finally:
+        unregister_dds_scheme('edge pulses')
+        unregister_dds_scheme('generated')
+        clear_template_cache()
+
+
+if __name__ == '__main__':
+    pass
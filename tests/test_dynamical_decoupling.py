@@ -22,7 +22,9 @@ import pytest
 import numpy as np
 from qctrlopencontrols.exceptions import ArgumentsValueError
 from qctrlopencontrols import (
-    DynamicDecouplingSequence, convert_dds_to_driven_controls)
+    DynamicDecouplingSequence, convert_dds_to_driven_controls, new_predefined_dds,
+    set_conversion_cache_size, clear_conversion_cache, get_conversion_cache_info,
+    iterate_driven_control_segments, convert_dds_to_shaped_driven_controls)
 
 
 def _remove_file(filename):
@@ -362,6 +364,33 @@ def test_pretty_string_format():
     assert _pretty_string == str(dd_sequence)
 
 
+def test_summarized_string_format():
+
+    """Tests __str__ and __repr__ of a sequence with more offsets than the print threshold
+    """
+
+    _duration = 1.
+    _offsets = np.linspace(0., _duration, 5000)
+
+    dd_sequence = DynamicDecouplingSequence(duration=_duration, offsets=_offsets)
+
+    _pretty_string = str(dd_sequence).split('\n')
+
+    assert _pretty_string[0] == 'Duration = {}'.format(_duration)
+    assert _pretty_string[1] == 'Number of offsets = 5000'
+    assert _pretty_string[2] == 'Offsets = [{},{},{},...,{},{},{}] x {}'.format(
+        *(_offsets[[0, 1, 2, -3, -2, -1]] / _duration), _duration)
+    assert _pretty_string[3] == 'Rabi Rotations = [1.0,1.0,1.0,...,1.0,1.0,1.0] x pi'
+    assert len(repr(dd_sequence)) < 2000
+
+    with np.printoptions(threshold=10000):
+        _pretty_string = str(dd_sequence).split('\n')
+
+    assert len(_pretty_string) == 5
+    assert _pretty_string[1] == 'Offsets = [{}] x {}'.format(
+        ','.join(str(offset) for offset in _offsets / _duration), _duration)
+
+
 def test_conversion_to_driven_controls():
 
     """Tests the method to convert a DDS to Driven Control
@@ -406,6 +435,172 @@ def test_conversion_to_driven_controls():
     _name = 'test_sequence'
 
 
+def test_conversion_of_predefined_sequences():
+
+    """Tests the conversion of a sequence with many pulses to driven controls
+    """
+
+    _duration = 1.
+    _number_of_offsets = 100
+    _maximum_rabi_rate = 2e4 * np.pi
+
+    sequence = new_predefined_dds(scheme='Carr-Purcell-Meiboom-Gill',
+                                  duration=_duration,
+                                  number_of_offsets=_number_of_offsets,
+                                  pre_post_rotation=True)
+    driven_control = convert_dds_to_driven_controls(sequence,
+                                                    maximum_rabi_rate=_maximum_rabi_rate,
+                                                    maximum_detuning_rate=_maximum_rabi_rate)
+
+    # pre-post rotations, pi pulses and the free evolution between them
+    assert driven_control.number_of_segments == 2 * (_number_of_offsets + 2) - 1
+    assert np.isclose(np.sum(driven_control.segments[:, 3]), _duration)
+
+    pulse_segments = driven_control.segments[0::2]
+    assert np.allclose(pulse_segments[1:-1, 0], 0.)
+    assert np.allclose(pulse_segments[1:-1, 1], _maximum_rabi_rate)
+    assert np.allclose(pulse_segments[1:-1, 3], np.pi / _maximum_rabi_rate)
+    assert np.allclose(pulse_segments[[0, -1], 0], _maximum_rabi_rate)
+    assert np.allclose(pulse_segments[[0, -1], 3], 0.5 * np.pi / _maximum_rabi_rate)
+    assert np.allclose(driven_control.segments[1::2, 0:3], 0.)
+
+    with pytest.raises(ArgumentsValueError):
+        _ = convert_dds_to_driven_controls(sequence, maximum_rabi_rate=2 * np.pi,
+                                           maximum_detuning_rate=2 * np.pi)
+
+
+def test_conversion_cache():
+
+    """Tests reusing the conversions of sequences with the same content
+    """
+
+    sequence = new_predefined_dds(scheme='Uhrig single-axis', duration=1.,
+                                  number_of_offsets=10)
+    same_sequence = new_predefined_dds(scheme='Uhrig single-axis', duration=1.,
+                                       number_of_offsets=10, name='same')
+
+    set_conversion_cache_size(2)
+    clear_conversion_cache()
+
+    try:
+        driven_control = convert_dds_to_driven_controls(sequence,
+                                                        maximum_rabi_rate=2e3 * np.pi)
+        cached_driven_control = convert_dds_to_driven_controls(same_sequence,
+                                                               maximum_rabi_rate=2e3 * np.pi,
+                                                               name='cached')
+        _ = convert_dds_to_driven_controls(sequence, maximum_rabi_rate=4e3 * np.pi)
+
+        assert np.array_equal(driven_control.segments, cached_driven_control.segments)
+        assert cached_driven_control.name == 'cached'
+        assert get_conversion_cache_info() == {'hits': 1, 'misses': 2, 'hit_rate': 1 / 3,
+                                               'size': 2, 'maximum_size': 2}
+
+        clear_conversion_cache()
+        assert get_conversion_cache_info()['size'] == 0
+    finally:
+        set_conversion_cache_size(0)
+        clear_conversion_cache()
+
+
+def test_streamed_conversion():
+
+    """Tests converting a sequence to control segments block by block
+    """
+
+    sequence = new_predefined_dds(scheme='Uhrig single-axis', duration=1.,
+                                  number_of_offsets=25, pre_post_rotation=True)
+    driven_control = convert_dds_to_driven_controls(sequence, maximum_rabi_rate=2e3 * np.pi)
+
+    blocks = list(iterate_driven_control_segments(sequence, maximum_rabi_rate=2e3 * np.pi,
+                                                  block_size=4))
+
+    assert len(blocks) == 7
+    assert all(block.shape[0] <= 8 for block in blocks)
+    assert np.array_equal(np.concatenate(blocks), driven_control.segments)
+
+    # a sequence above the bound on the number of offsets
+    number_of_offsets = 20000
+    offsets = np.linspace(0., 1., number_of_offsets)
+    rabi_rotations = np.pi * np.ones(number_of_offsets)
+    rabi_rotations[[0, -1]] = 0.
+
+    number_of_segments = 0
+    duration = 0.
+    for segments in iterate_driven_control_segments(
+            maximum_rabi_rate=1e5 * np.pi, duration=1., offsets=offsets,
+            rabi_rotations=rabi_rotations, azimuthal_angles=np.zeros(number_of_offsets),
+            detuning_rotations=np.zeros(number_of_offsets)):
+        number_of_segments += segments.shape[0]
+        duration += np.sum(segments[:, 3])
+
+    assert number_of_segments == 2 * (number_of_offsets - 2) + 1
+    assert np.isclose(duration, 1.)
+
+    # the leading blocks of free evolution are not held back until the first pulse
+    rabi_rotations[1:10001] = 0.
+    blocks = list(iterate_driven_control_segments(
+        maximum_rabi_rate=1e5 * np.pi, block_size=16, duration=1., offsets=offsets,
+        rabi_rotations=rabi_rotations, azimuthal_angles=np.zeros(number_of_offsets),
+        detuning_rotations=np.zeros(number_of_offsets)))
+    assert all(block.shape[0] <= 32 for block in blocks)
+    assert np.isclose(np.sum(np.concatenate(blocks)[:, 3]), 1.)
+
+    sequence = DynamicDecouplingSequence(
+        duration=1., offsets=offsets[0:100], rabi_rotations=rabi_rotations[9940:10040],
+        azimuthal_angles=np.zeros(100), detuning_rotations=np.zeros(100))
+    driven_control = convert_dds_to_driven_controls(sequence, maximum_rabi_rate=1e5 * np.pi)
+    blocks = list(iterate_driven_control_segments(sequence, maximum_rabi_rate=1e5 * np.pi,
+                                                  block_size=8))
+    assert np.array_equal(np.concatenate(blocks), driven_control.segments)
+
+    with pytest.raises(ArgumentsValueError):
+        _ = list(iterate_driven_control_segments(sequence, maximum_rabi_rate=2 * np.pi))
+
+
+def test_shaped_conversion():
+
+    """Tests the conversion of a sequence to shaped pulses
+    """
+
+    _maximum_rabi_rate = 2e3 * np.pi
+    _resolution = 12
+
+    sequence = new_predefined_dds(scheme='XY concatenated', duration=1.,
+                                  concatenation_order=2, pre_post_rotation=True)
+    flat_driven_control = convert_dds_to_driven_controls(
+        sequence, maximum_rabi_rate=_maximum_rabi_rate,
+        maximum_detuning_rate=_maximum_rabi_rate)
+
+    for pulse_shape in ['gaussian', 'cosine']:
+        driven_control = convert_dds_to_shaped_driven_controls(
+            sequence, maximum_rabi_rate=_maximum_rabi_rate,
+            maximum_detuning_rate=_maximum_rabi_rate,
+            pulse_shape=pulse_shape, resolution=_resolution, name='shaped')
+
+        assert driven_control.name == 'shaped'
+        assert np.isclose(driven_control.duration, 1.)
+        assert driven_control.maximum_rabi_rate <= _maximum_rabi_rate
+
+        # each flat rabi pulse is replaced by a shaped pulse
+        flat_rabi_pulses = flat_driven_control.rabi_rates > 0.
+        assert (driven_control.number_of_segments
+                == flat_driven_control.number_of_segments
+                + (_resolution - 1) * np.sum(flat_rabi_pulses))
+        assert np.isclose(np.sum(driven_control.angles),
+                          np.sum(flat_driven_control.angles))
+        assert np.allclose(driven_control.segments[0:_resolution, 0:2],
+                           driven_control.segments[0:_resolution, 0:2][::-1])
+        assert np.allclose(np.sum(driven_control.angles[0:_resolution]), np.pi / 2)
+
+        # detuning pulses stay flat
+        assert np.array_equal(
+            np.sort(driven_control.segments[driven_control.segments[:, 2] != 0., 2]),
+            np.sort(flat_driven_control.segments[flat_driven_control.segments[:, 2] != 0., 2]))
+
+    with pytest.raises(ArgumentsValueError):
+        _ = convert_dds_to_shaped_driven_controls(sequence, pulse_shape='square')
+
+
 def test_free_evolution_conversion():
 
     """Tests the conversion of free evolution
@@ -0,0 +1,206 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+=============================
+Tests for the filter function
+=============================
+"""
+
+import pytest
+import numpy as np
+
+from qctrlopencontrols.exceptions import ArgumentsValueError
+from qctrlopencontrols import (
+    new_predefined_dds, calculate_filter_function,
+    estimate_dephasing_infidelity, rank_dds_by_dephasing_infidelity,
+    sample_switching_function, iterate_switching_function)
+
+
+def test_filter_function():
+
+    """Tests the filter function against the closed forms for Ramsey and spin echo
+    and against a numerical integration of the switching function
+    """
+
+    duration = 2.
+    angular_frequencies = np.linspace(0.1, 50., 101)
+
+    ramsey = new_predefined_dds(scheme='Ramsey', duration=duration)
+    spin_echo = new_predefined_dds(scheme='spin echo', duration=duration,
+                                   pre_post_rotation=True)
+
+    assert np.allclose(calculate_filter_function(ramsey, angular_frequencies),
+                       4. * np.sin(angular_frequencies * duration / 2.) ** 2)
+    assert np.allclose(calculate_filter_function(spin_echo, angular_frequencies),
+                       16. * np.sin(angular_frequencies * duration / 4.) ** 4)
+
+    uhrig = new_predefined_dds(scheme='Uhrig single-axis', duration=3.,
+                               number_of_offsets=3)
+    _times = np.linspace(0., 3., 200001)
+    _switching_function = (-1.) ** np.searchsorted(uhrig.offsets[1:-1], _times,
+                                                   side='right')
+    _filter_function = np.array([
+        np.abs(frequency * np.trapz(_switching_function * np.exp(1j * frequency * _times),
+                                    _times)) ** 2
+        for frequency in angular_frequencies])
+
+    assert np.allclose(calculate_filter_function(uhrig, angular_frequencies),
+                       _filter_function, atol=1e-2)
+
+    with pytest.raises(ArgumentsValueError):
+        _ = calculate_filter_function(uhrig, None)
+
+
+def test_batched_filter_function():
+
+    """Tests the filter function of a ragged batch of sequences
+    """
+
+    angular_frequencies = np.linspace(0., 100., 257)
+
+    sequences = [new_predefined_dds(scheme='Carr-Purcell-Meiboom-Gill', duration=1. + idx,
+                                    number_of_offsets=idx + 1)
+                 for idx in range(5)]
+    sequences.append(new_predefined_dds(scheme='XY concatenated', duration=1.,
+                                        concatenation_order=2))
+
+    filter_functions = calculate_filter_function(sequences, angular_frequencies,
+                                                 frequency_chunk_size=10)
+
+    assert filter_functions.shape == (6, 257)
+    for sequence, filter_function in zip(sequences, filter_functions):
+        assert np.allclose(calculate_filter_function(sequence, angular_frequencies),
+                           filter_function)
+
+
+def test_dephasing_infidelity():
+
+    """Tests the infidelity estimate for white noise and the ranking of sequences
+    """
+
+    duration = 1.
+    angular_frequencies = np.linspace(0., 2000., 20001)
+
+    # for white noise the decay exponent is proportional to the duration,
+    # independent of the pulse positions: chi = S * duration
+    ramsey = new_predefined_dds(scheme='Ramsey', duration=duration)
+    infidelity = estimate_dephasing_infidelity(ramsey, 1e-3 * np.ones(20001),
+                                               angular_frequencies)
+    assert np.isclose(infidelity, 0.5 * (1. - np.exp(-1e-3 * duration)), rtol=1e-2)
+
+    # with 1/f noise, more pulses decouple the low frequency noise better
+    def _noise_power_density(frequencies):
+        return 1e-2 / np.maximum(frequencies, 1.)
+
+    ranking = rank_dds_by_dephasing_infidelity(
+        noise_power_density=_noise_power_density,
+        angular_frequencies=angular_frequencies,
+        dynamic_decoupling_sequences=[ramsey],
+        parameter_grid={'scheme': 'Carr-Purcell-Meiboom-Gill', 'duration': duration,
+                        'number_of_offsets': [1, 4, 16]},
+        chunk_size=2)
+
+    assert [entry['index'] for entry in ranking] == [3, 2, 1, 0]
+    assert ranking[0]['parameters']['number_of_offsets'] == 16
+    assert ranking[-1]['parameters'] is None
+    assert np.all(np.diff([entry['infidelity'] for entry in ranking]) >= 0.)
+
+    parallel_ranking = rank_dds_by_dephasing_infidelity(
+        noise_power_density=_noise_power_density(angular_frequencies),
+        angular_frequencies=angular_frequencies,
+        dynamic_decoupling_sequences=[ramsey],
+        parameter_grid={'scheme': 'Carr-Purcell-Meiboom-Gill', 'duration': duration,
+                        'number_of_offsets': [1, 4, 16]},
+        max_workers=2, chunk_size=2)
+
+    assert np.allclose([entry['infidelity'] for entry in ranking],
+                       [entry['infidelity'] for entry in parallel_ranking])
+
+    with pytest.raises(ArgumentsValueError):
+        _ = rank_dds_by_dephasing_infidelity(
+            noise_power_density=np.ones(3), angular_frequencies=angular_frequencies,
+            dynamic_decoupling_sequences=[ramsey])
+
+
+def test_switching_function():
+
+    """Tests sampling the switching function, in one pass and in chunks
+    """
+
+    duration = 4.
+    sequence = new_predefined_dds(scheme='Carr-Purcell', duration=duration,
+                                  number_of_offsets=2, pre_post_rotation=True)
+    sample_times = np.array([-1., 0., 0.5, 1., 1.5, 2.5, 3., 3.5, 4., 5.])
+
+    _switching_function = np.array([0., 1., 1., -1., -1., -1., 1., 1., 1., 0.])
+    assert np.allclose(sample_switching_function(sequence, sample_times),
+                       _switching_function)
+
+    spin_echo = new_predefined_dds(scheme='spin echo', duration=duration)
+    switching_functions = sample_switching_function([sequence, spin_echo], sample_times)
+    assert switching_functions.shape == (2, 10)
+    assert np.allclose(switching_functions[1],
+                       [0., 1., 1., 1., 1., -1., -1., -1., -1., 0.])
+
+    chunks = list(iterate_switching_function(sequence, time_step=0.5, chunk_size=4))
+    assert [times.shape[0] for times, _ in chunks] == [4, 4, 1]
+    times = np.concatenate([times for times, _ in chunks])
+    values = np.concatenate([values for _, values in chunks])
+    assert np.allclose(times, 0.5 * np.arange(9))
+    assert np.allclose(values, sample_switching_function(sequence, times))
+
+    chunks = list(iterate_switching_function(sequence, sample_times=sample_times,
+                                             chunk_size=3))
+    assert np.allclose(np.concatenate([values for _, values in chunks]),
+                       _switching_function)
+
+    with pytest.raises(ArgumentsValueError):
+        _ = list(iterate_switching_function(sequence))
+    with pytest.raises(ArgumentsValueError):
+        _ = list(iterate_switching_function([sequence, spin_echo], time_step=0.5))
+
+    # the final sample is kept when the time step does not divide the duration exactly
+    short_sequence = new_predefined_dds(scheme='spin echo', duration=0.3)
+    chunks = list(iterate_switching_function(short_sequence, time_step=0.1))
+    times = np.concatenate([times for times, _ in chunks])
+    values = np.concatenate([values for _, values in chunks])
+    assert times.shape == (4,)
+    assert np.isclose(times[-1], 0.3)
+    assert np.allclose(values, [1., 1., -1., -1.])
+
+
+def test_switching_function_batch():
+
+    """Tests that sampling a batch of sequences of different durations matches
+    sampling each sequence on its own
+    """
+
+    sequences = [new_predefined_dds(scheme='Uhrig single-axis', duration=1.,
+                                    number_of_offsets=3),
+                 new_predefined_dds(scheme='Carr-Purcell', duration=3.,
+                                    number_of_offsets=4, pre_post_rotation=True),
+                 new_predefined_dds(scheme='Ramsey', duration=2.)]
+    sample_times = np.concatenate((np.linspace(-0.5, 3.5, 41),
+                                   sequences[0].offsets, sequences[1].offsets))
+
+    switching_functions = sample_switching_function(sequences, sample_times)
+    assert switching_functions.shape == (3, sample_times.shape[0])
+    for sequence, switching_function in zip(sequences, switching_functions):
+        _, values = next(iterate_switching_function(sequence, sample_times=sample_times))
+        assert np.array_equal(switching_function, values)
+
+
+if __name__ == '__main__':
+    pass
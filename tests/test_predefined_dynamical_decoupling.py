@@ -29,7 +29,9 @@ from qctrlopencontrols.dynamic_decoupling_sequences import (
     SPIN_ECHO, CARR_PURCELL, CARR_PURCELL_MEIBOOM_GILL,
     WALSH_SINGLE_AXIS, PERIODIC_SINGLE_AXIS,
     UHRIG_SINGLE_AXIS, QUADRATIC, X_CONCATENATED,
-    XY_CONCATENATED)
+    XY_CONCATENATED, new_walsh_offsets_batch, new_quadratic_offsets_batch,
+    new_carr_purcell_meiboom_gill_offsets_batch, new_uhrig_single_axis_offsets_batch,
+    set_template_cache_size, clear_template_cache, get_template_cache_info)
 
 
 def test_ramsey():
@@ -203,6 +205,34 @@ def test_uhrig_single_axis_sequence():
 
 
 
+def test_single_axis_offsets_batch():
+    """
+    Test the batch generation of the offsets of CPMG and Uhrig Sequences
+    """
+
+    numbers_of_offsets = np.array([[1], [2], [7], [40]])
+    durations = np.array([0.5, 1., 6.])
+
+    for scheme, offsets_batch in [
+            (CARR_PURCELL_MEIBOOM_GILL, new_carr_purcell_meiboom_gill_offsets_batch),
+            (UHRIG_SINGLE_AXIS, new_uhrig_single_axis_offsets_batch)]:
+        offsets, offset_indices = offsets_batch(numbers_of_offsets, duration=durations)
+
+        assert np.array_equal(np.diff(offset_indices), np.repeat([1, 2, 7, 40], 3))
+
+        for index, (number_of_offsets, duration) in enumerate(zip(
+                np.repeat(numbers_of_offsets.ravel(), 3), np.tile(durations, 4))):
+            sequence = pre.new_predefined_dds(scheme=scheme, duration=duration,
+                                              number_of_offsets=number_of_offsets)
+            assert np.array_equal(sequence.offsets[1:-1],
+                                  offsets[offset_indices[index]:offset_indices[index + 1]])
+
+        with pytest.raises(ArgumentsValueError):
+            _ = offsets_batch([3, 0])
+        with pytest.raises(ArgumentsValueError):
+            _ = offsets_batch(3, duration=[1., -1.])
+
+
 def test_periodic_single_axis_sequence():      # pylint: disable=invalid-name
     """
     Test for Periodic Single Axis Sequence
@@ -296,6 +326,57 @@ def test_walsh_single_axis_sequence():
     assert np.allclose(_detuning_rotations, sequence.detuning_rotations)
 
 
+def _walsh_reference(paley_order):
+    """Switching times of the Walsh function of a paley order, in units of the
+    sampling period, from the product of its Rademacher functions
+    """
+
+    hamming_weight = int(np.floor(np.log2(paley_order))) + 1
+    samples = 2 ** hamming_weight
+    relative_offset = np.arange(1. / (2 * samples), 1., 1. / samples)
+
+    walsh_array = np.ones([samples])
+    for i in range(hamming_weight):
+        if (paley_order >> i) & 1:
+            walsh_array *= np.sign(np.sin(2 ** (i + 1) * np.pi * relative_offset))
+
+    return np.nonzero(np.diff(walsh_array))[0] + 1, samples
+
+
+def test_high_order_walsh_sequences():
+    """
+    Test Walsh Sequences above the former paley order limit and their batch generation
+    """
+
+    duration = 2.
+
+    for paley_order in [2047, 2048, 3001, 5000]:
+        sequence = pre.new_predefined_dds(scheme=WALSH_SINGLE_AXIS,
+                                          duration=duration,
+                                          paley_order=paley_order)
+        _steps, _samples = _walsh_reference(paley_order)
+        assert np.allclose(sequence.offsets[1:-1], _steps * duration / _samples)
+
+    for paley_order in [12000, 2 ** 14, 2 ** 70]:
+        with pytest.raises(ArgumentsValueError):
+            _ = pre.new_predefined_dds(scheme=WALSH_SINGLE_AXIS, duration=duration,
+                                       paley_order=paley_order)
+    with pytest.raises(ArgumentsValueError):
+        _ = new_walsh_offsets_batch(2 ** 70, duration=duration)
+
+    offsets, offset_indices = new_walsh_offsets_batch(100, duration=duration)
+
+    assert offset_indices.shape == (101,)
+    assert offset_indices[-1] == offsets.shape[0]
+    for paley_order in range(1, 101):
+        sequence = pre.new_predefined_dds(scheme=WALSH_SINGLE_AXIS,
+                                          duration=duration,
+                                          paley_order=paley_order)
+        assert np.array_equal(
+            sequence.offsets[1:-1],
+            offsets[offset_indices[paley_order - 1]:offset_indices[paley_order]])
+
+
 def test_quadratic_sequence():
     """
     Test for Quadratic Sequence
@@ -369,6 +450,37 @@ def test_quadratic_sequence():
     assert np.allclose(_detuning_rotations, sequence.detuning_rotations)
 
 
+def test_quadratic_sequence_batch():
+    """
+    Test the batch generation of Quadratic Sequences
+    """
+
+    number_inner_offsets, number_outer_offsets = np.meshgrid([1, 2, 5], [1, 3, 4])
+    durations = np.array([[1.], [3.], [10.]])
+
+    offsets, rabi_rotations, detuning_rotations, offset_indices = \
+        new_quadratic_offsets_batch(number_inner_offsets, number_outer_offsets,
+                                    duration=durations)
+
+    assert offset_indices.shape == (10,)
+    assert offset_indices[-1] == offsets.shape[0]
+
+    for index, (number_inner, number_outer, duration) in enumerate(zip(
+            number_inner_offsets.ravel(), number_outer_offsets.ravel(),
+            np.repeat(durations.ravel(), 3))):
+        sequence = pre.new_predefined_dds(scheme=QUADRATIC, duration=duration,
+                                          number_inner_offsets=number_inner,
+                                          number_outer_offsets=number_outer)
+        _slice = slice(offset_indices[index], offset_indices[index + 1])
+
+        assert np.array_equal(sequence.offsets[1:-1], offsets[_slice])
+        assert np.array_equal(sequence.rabi_rotations[1:-1], rabi_rotations[_slice])
+        assert np.array_equal(sequence.detuning_rotations[1:-1], detuning_rotations[_slice])
+
+    with pytest.raises(ArgumentsValueError):
+        _ = new_quadratic_offsets_batch([1, 0], 2)
+
+
 def test_xconcatenated_sequence():
     """
     Test X-CDD Sequence
@@ -411,6 +523,43 @@ def test_xconcatenated_sequence():
     assert np.allclose(_detuning_rotations, sequence.detuning_rotations)
 
 
+def _x_concatenated_reference(concatenation_order):
+    """Pulse times of the x-concatenated sequence, in units of the finest spacing,
+    obtained by concatenating C(tau/2)XC(tau/2)X and cancelling coinciding pulses
+    """
+
+    if concatenation_order == 0:
+        return []
+
+    half = 2 ** (concatenation_order - 1)
+    inner = _x_concatenated_reference(concatenation_order - 1)
+    times = inner + [half] + [half + time for time in inner] + [2 * half]
+    times, counts = np.unique(times, return_counts=True)
+
+    return list(times[counts % 2 == 1])
+
+
+def test_high_order_xconcatenated_sequence():   # pylint: disable=invalid-name
+    """
+    Test X-CDD Sequence against the concatenation of its base sequence
+    """
+
+    duration = 3.
+
+    for concatenation_order in range(1, 11):
+        sequence = pre.new_predefined_dds(scheme=X_CONCATENATED,
+                                          duration=duration,
+                                          concatenation_order=concatenation_order)
+
+        _times = np.array(_x_concatenated_reference(concatenation_order))
+        _offsets = _times[_times < 2 ** concatenation_order] * (
+            duration / 2 ** concatenation_order)
+        _offsets = np.insert(_offsets, [0, _offsets.shape[0]], [0, duration])
+
+        assert np.allclose(_offsets, sequence.offsets)
+        assert np.allclose(sequence.rabi_rotations[1:-1], np.pi)
+
+
 def test_xyconcatenated_sequence():
     """
     Test XY4-CDD Sequence
@@ -461,6 +610,86 @@ def test_xyconcatenated_sequence():
     assert np.allclose(_detuning_rotations, sequence.detuning_rotations)
 
 
+def _xy_concatenated_reference(concatenation_order):
+    """Operations of the xy-concatenated sequence, obtained by concatenating the
+    sequence of the previous order as CXCYCXCY; the last operation of C is replaced
+    by the following x pulse (as Z) or removed by the following y pulse
+    """
+
+    if concatenation_order == 1:
+        return [1, -1, 1, -2, 1, -1, 1, -2]
+
+    inner = _xy_concatenated_reference(concatenation_order - 1)
+    operations = inner[:-1] + [-3] + inner[:-1] + inner[:-1] + [-3] + inner + [-2]
+    if operations[-2:] == [-2, -2]:
+        operations = operations[:-2]
+
+    return operations
+
+
+def test_high_order_xyconcatenated_sequence():   # pylint: disable=invalid-name
+    """
+    Test XY4-CDD Sequence against the concatenation of its base sequence
+    """
+
+    duration = 2.
+
+    for concatenation_order in range(1, 6):
+        operations = np.array(_xy_concatenated_reference(concatenation_order))
+
+        sequence = pre.new_xy_concatenated_sequence(duration=duration,
+                                                    concatenation_order=concatenation_order)
+
+        assert np.all(np.diff(sequence.offsets) >= 0)
+        _x_pulses = (sequence.rabi_rotations == np.pi) & (sequence.azimuthal_angles == 0)
+        _y_pulses = sequence.azimuthal_angles == np.pi / 2
+        _z_pulses = sequence.detuning_rotations == np.pi
+
+        # pulses around the same axis at the same time cancel
+        times = np.cumsum(operations == 1)
+        for operation, _pulses in zip([-1, -2, -3], [_x_pulses, _y_pulses, _z_pulses]):
+            _times, _counts = np.unique(times[operations == operation],
+                                        return_counts=True)
+            _times = _times[_counts % 2 == 1] * duration / 4 ** concatenation_order
+            assert np.allclose(_times, sequence.offsets[_pulses])
+
+        assert np.all(sequence.rabi_rotations[_z_pulses] == 0)
+
+
+def test_template_cache():
+    """
+    Test that the sequences of all durations share the cached relative templates
+    """
+
+    clear_template_cache()
+
+    sequence = pre.new_predefined_dds(scheme=UHRIG_SINGLE_AXIS, duration=1.,
+                                      number_of_offsets=10)
+    sequence.offsets[1] = 0.
+    scaled_sequence = pre.new_predefined_dds(scheme=UHRIG_SINGLE_AXIS, duration=3.,
+                                             number_of_offsets=10)
+    _ = pre.new_predefined_dds(scheme=WALSH_SINGLE_AXIS, duration=2., paley_order=10)
+
+    info = get_template_cache_info()
+    assert info['hits'] == 1
+    assert info['misses'] == 2
+    assert info['size'] == 2
+
+    # the cached template is not changed by the sequences built from it
+    uhrig_sequence = pre.new_predefined_dds(scheme=UHRIG_SINGLE_AXIS, duration=1.,
+                                            number_of_offsets=10)
+    assert np.allclose(3. * uhrig_sequence.offsets, scaled_sequence.offsets)
+    assert uhrig_sequence.offsets[1] > 0.
+
+    set_template_cache_size(0)
+    _ = pre.new_predefined_dds(scheme=UHRIG_SINGLE_AXIS, duration=1.,
+                               number_of_offsets=10)
+    assert get_template_cache_info()['size'] == 0
+
+    set_template_cache_size()
+    clear_template_cache()
+
+
 def test_attribute_values():
     """
     Test for the correctness of the attribute values
@@ -0,0 +1,137 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+==========================
+Tests for the pulse timing
+==========================
+"""
+
+import pytest
+import numpy as np
+
+from qctrlopencontrols.exceptions import ArgumentsValueError
+from qctrlopencontrols import (
+    DynamicDecouplingSequence, new_predefined_dds, convert_dds_to_driven_controls,
+    compute_minimum_rabi_rate, compute_minimum_detuning_rate, diagnose_dds_conversion)
+
+
+def _converts(sequence, maximum_rabi_rate, maximum_detuning_rate):
+    """Checks if a sequence can be converted at the rates
+    """
+
+    try:
+        _ = convert_dds_to_driven_controls(sequence, maximum_rabi_rate=maximum_rabi_rate,
+                                           maximum_detuning_rate=maximum_detuning_rate)
+    except ArgumentsValueError:
+        return False
+    return True
+
+
+def test_minimum_rabi_rate():
+
+    """Tests the minimum rabi rate against the conversion of the sequences
+    """
+
+    sequences = [
+        new_predefined_dds(scheme='spin echo', duration=1.),
+        new_predefined_dds(scheme='Carr-Purcell', duration=1., number_of_offsets=8),
+        new_predefined_dds(scheme='Uhrig single-axis', duration=2., number_of_offsets=10,
+                           pre_post_rotation=True),
+        new_predefined_dds(scheme='XY concatenated', duration=1., concatenation_order=2)]
+
+    minimum_rabi_rates = compute_minimum_rabi_rate(sequences)
+
+    # the pi pulse of a spin echo fills the sequence
+    assert np.isclose(minimum_rabi_rates[0], np.pi)
+    # pi pulses at 1/16, 3/16, ... of the sequence duration
+    assert np.isclose(minimum_rabi_rates[1], 8 * np.pi)
+
+    for sequence, minimum_rabi_rate in zip(sequences, minimum_rabi_rates):
+        assert minimum_rabi_rate == compute_minimum_rabi_rate(sequence)
+        assert _converts(sequence, 1.001 * minimum_rabi_rate, 1.001 * minimum_rabi_rate)
+        assert not _converts(sequence, 0.999 * minimum_rabi_rate, 0.999 * minimum_rabi_rate)
+
+    # the detuning pulse between the pi pulses takes a fixed time
+    sequence = DynamicDecouplingSequence(duration=1., offsets=[0.25, 0.5, 0.75],
+                                         rabi_rotations=[np.pi, 0., np.pi],
+                                         detuning_rotations=[0., np.pi, 0.])
+    assert np.isclose(compute_minimum_rabi_rate(sequence), 4 * np.pi)
+    assert np.isclose(compute_minimum_detuning_rate(sequence), 4 * np.pi)
+
+    maximum_detuning_rate = 16 * np.pi
+    minimum_rabi_rate = compute_minimum_rabi_rate(
+        sequence, maximum_detuning_rate=maximum_detuning_rate)
+
+    assert np.isclose(minimum_rabi_rate, 16 * np.pi / 7)
+    assert _converts(sequence, 1.001 * minimum_rabi_rate, maximum_detuning_rate)
+    assert not _converts(sequence, 0.999 * minimum_rabi_rate, maximum_detuning_rate)
+
+    with pytest.raises(ArgumentsValueError):
+        _ = compute_minimum_rabi_rate(sequence, maximum_detuning_rate=0.)
+
+
+def test_unconstrained_rates():
+
+    """Tests the minimum rates of sequences that do not depend on a rate
+    """
+
+    sequence = new_predefined_dds(scheme='Carr-Purcell', duration=1., number_of_offsets=4)
+    assert compute_minimum_detuning_rate(sequence, maximum_rabi_rate=100.) == 0.
+
+    # a detuning rotation at the same offset as a rabi rotation
+    sequence = DynamicDecouplingSequence(duration=1., offsets=[0.5],
+                                         rabi_rotations=[np.pi],
+                                         detuning_rotations=[np.pi])
+    assert np.isinf(compute_minimum_rabi_rate(sequence))
+
+
+def test_conversion_diagnostics():
+
+    """Tests the diagnostics of the overlapping pulses of a sequence
+    """
+
+    sequence = DynamicDecouplingSequence(duration=1., offsets=[0.1, 0.2, 0.3, 0.9],
+                                         rabi_rotations=[np.pi, np.pi, np.pi, np.pi],
+                                         azimuthal_angles=[0., 0., 0., 0.],
+                                         detuning_rotations=[0., 0., 0., 0.])
+
+    # pulses of duration 0.25; only the identities added at 0 and 1 are shifted
+    diagnostics = diagnose_dds_conversion(sequence, maximum_rabi_rate=4 * np.pi,
+                                          maximum_detuning_rate=4 * np.pi)
+
+    assert not diagnostics['valid']
+    assert np.allclose(diagnostics['pulse_start_ends'][1],
+                       [0.1 - 0.125, 0.1 + 0.125])
+    assert np.array_equal(diagnostics['overlapping_pulses'],
+                          [[0, 1], [1, 2], [1, 3], [2, 3], [4, 5]])
+    assert np.allclose(diagnostics['overlaps'], [0.025, 0.15, 0.05, 0.15, 0.025])
+    assert np.array_equal(diagnostics['boundary_violations'], [1, 4])
+    assert np.allclose(diagnostics['boundary_overlaps'], [0.025, 0.025])
+    assert diagnostics['simultaneous_rotations'].shape == (0,)
+    assert diagnostics['inverted_pulses'].shape == (0,)
+
+    diagnostics = diagnose_dds_conversion(
+        sequence, maximum_rabi_rate=compute_minimum_rabi_rate(sequence) * 1.001,
+        maximum_detuning_rate=4 * np.pi)
+
+    assert diagnostics['valid']
+    assert diagnostics['overlapping_pulses'].shape == (0, 2)
+
+    with pytest.raises(ArgumentsValueError):
+        _ = diagnose_dds_conversion(None)
+
+
+if __name__ == '__main__':
+    pass
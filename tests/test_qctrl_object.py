@@ -20,7 +20,7 @@ Tests for base module
 
 import pytest
 from qctrlopencontrols.exceptions import ArgumentsValueError
-from qctrlopencontrols.base import QctrlObject
+from qctrlopencontrols.base import QctrlObject, LRUCache
 
 
 class SampleClass(QctrlObject):  #pylint: disable=too-few-public-methods
@@ -59,8 +59,47 @@ def test_qctrl_object():    # pylint: disable=too-few-public-methods
     assert repr(sample_class) == _sample_repr
     assert str(sample_class) == str(_sample_repr)
 
+    sample_class = SampleClass(sample_attribute=list(range(5000)),
+                               base_attributes=['sample_attribute'])
+
+    assert repr(sample_class) == 'SampleClass(sample_attribute=[0, 1, 2, ..., 4997, 4998, 4999])'
+
     with pytest.raises(ArgumentsValueError):
 
         _ = SampleClass(sample_attribute=50., base_attributes=[])
         _ = SampleClass(sample_attribute=50., base_attributes=['sample_1', 40])
         _ = SampleClass(sample_attribute=50., base_attributes='no list')
+
+
+def test_lru_cache():
+    """Tests the eviction and the statistics of base.LRUCache
+    """
+
+    cache = LRUCache(maximum_size=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+
+    # 'b' is the least recently used entry
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    assert cache.get_info() == {'hits': 2, 'misses': 1, 'hit_rate': 2 / 3,
+                                'size': 2, 'maximum_size': 2}
+
+    cache.resize(1)
+    assert len(cache) == 1
+    assert 'c' in cache
+
+    cache.resize(0)
+    cache.put('d', 4)
+    assert not cache.enabled
+    assert len(cache) == 0
+
+    cache.clear()
+    assert cache.get_info()['hit_rate'] is None
+
+    with pytest.raises(ArgumentsValueError):
+        cache.resize(-1)
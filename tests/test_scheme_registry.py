@@ -0,0 +1,202 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+=====================================
+Tests for the registry of DDS schemes
+=====================================
+"""
+
+import pytest
+import numpy as np
+
+from qctrlopencontrols.exceptions import ArgumentsValueError
+from qctrlopencontrols import (
+    new_predefined_dds, register_dds_scheme, unregister_dds_scheme, get_dds_scheme,
+    get_dds_scheme_names, clear_template_cache, get_template_cache_info,
+    count_predefined_dds_offsets, new_predefined_dds_grid)
+
+
+def test_predefined_scheme_metadata():
+
+    """Tests the metadata of the predefined schemes
+    """
+
+    assert get_dds_scheme_names()[0:3] == ['Ramsey', 'spin echo', 'Carr-Purcell']
+
+    scheme = get_dds_scheme('quadratic')
+    assert scheme.parameter_names == ['number_inner_offsets', 'number_outer_offsets']
+    assert scheme.get_parameter_ranges()['number_inner_offsets'][0] == 1
+
+    for name, parameters in [('Ramsey', {}),
+                             ('spin echo', {}),
+                             ('Uhrig single-axis', {'number_of_offsets': 7}),
+                             ('Walsh single-axis', {'paley_order': 77}),
+                             ('quadratic', {'number_inner_offsets': 3,
+                                            'number_outer_offsets': 5}),
+                             ('X concatenated', {'concatenation_order': 13}),
+                             ('XY concatenated', {'concatenation_order': 6})]:
+        sequence = new_predefined_dds(scheme=name, **parameters)
+        number_of_offsets = get_dds_scheme(name).get_number_of_offsets(**parameters)
+        padding = 0 if name == 'Ramsey' else 2
+        assert sequence.number_of_offsets == number_of_offsets + padding
+
+    with pytest.raises(ArgumentsValueError):
+        _ = get_dds_scheme('X concatenated').get_number_of_offsets(concatenation_order=14)
+
+    with pytest.raises(ArgumentsValueError):
+        _ = get_dds_scheme('unknown scheme')
+
+
+def test_count_predefined_dds_offsets():
+
+    """Tests counting the offsets and pulses of the predefined sequences
+    """
+
+    counts = count_predefined_dds_offsets(scheme='quadratic',
+                                          number_inner_offsets=[[1], [3]],
+                                          number_outer_offsets=[2, 4, 6])
+    assert counts['number_of_offsets'].shape == (2, 3)
+    for inner, outer in [(0, 1), (1, 2)]:
+        sequence = new_predefined_dds(scheme='quadratic', number_inner_offsets=[1, 3][inner],
+                                      number_outer_offsets=[2, 4, 6][outer])
+        assert counts['number_of_offsets'][inner, outer] == sequence.number_of_offsets - 2
+        assert counts['number_of_x_pulses'][inner, outer] == np.sum(
+            sequence.rabi_rotations != 0)
+        assert counts['number_of_z_pulses'][inner, outer] == np.sum(
+            sequence.detuning_rotations != 0)
+
+    paley_orders = np.arange(1, 200)
+    counts = count_predefined_dds_offsets(scheme='Walsh single-axis',
+                                          paley_order=paley_orders)
+    assert np.array_equal(counts['number_of_offsets'], counts['number_of_x_pulses'])
+    assert [counts['number_of_offsets'][order - 1] for order in [37, 198]] == [
+        new_predefined_dds(scheme='Walsh single-axis', paley_order=order)
+        .number_of_offsets - 2 for order in [37, 198]]
+
+    counts = count_predefined_dds_offsets(scheme='XY concatenated', concatenation_order=3)
+    sequence = new_predefined_dds(scheme='XY concatenated', concatenation_order=3)
+    assert counts['number_of_offsets'] == sequence.number_of_offsets - 2
+    assert counts['number_of_y_pulses'] == np.sum(sequence.azimuthal_angles != 0)
+    assert count_predefined_dds_offsets(scheme='Ramsey') == {
+        'number_of_offsets': 2, 'number_of_x_pulses': 0,
+        'number_of_y_pulses': 0, 'number_of_z_pulses': 0}
+
+    with pytest.raises(ArgumentsValueError):
+        _ = count_predefined_dds_offsets(scheme='X concatenated',
+                                         concatenation_order=[1, 14])
+    with pytest.raises(ArgumentsValueError):
+        _ = count_predefined_dds_offsets(scheme='Ramsey', number_of_offsets=2)
+
+
+    for scheme in [['Ramsey'], {'Ramsey': 1}, None]:
+        with pytest.raises(ArgumentsValueError):
+            _ = new_predefined_dds(scheme=scheme)
+
+
+def _in_house_template(number_of_pulses, number_of_repetitions):
+    """Relative template of repeated CPMG-like blocks of X pulses
+    """
+
+    number_of_offsets = number_of_pulses * number_of_repetitions
+    offsets = (np.arange(number_of_offsets) + 0.5) / number_of_offsets
+    return (offsets, np.full(offsets.shape, np.pi),
+            np.zeros(offsets.shape), np.zeros(offsets.shape))
+
+
+def test_register_scheme():
+
+    """Tests creating the sequences of a registered scheme
+    """
+
+    register_dds_scheme('in-house', template_function=_in_house_template,
+                        parameters=[('number_of_pulses', 2, 1, 100),
+                                    ('number_of_repetitions', 1, 1, None)],
+                        number_of_offsets=lambda pulses, repetitions: pulses * repetitions)
+
+    try:
+        with pytest.raises(ArgumentsValueError):
+            register_dds_scheme('in-house', template_function=_in_house_template)
+
+        clear_template_cache()
+        sequence = new_predefined_dds(scheme='in-house', duration=4.,
+                                      number_of_repetitions=2, name='in-house')
+        assert np.allclose(sequence.offsets, [0., 0.5, 1.5, 2.5, 3.5, 4.])
+        assert sequence.name == 'in-house'
+
+        _ = new_predefined_dds(scheme='in-house', duration=2., number_of_repetitions=2)
+        assert get_template_cache_info()['hits'] == 1
+
+        assert get_dds_scheme('in-house').get_number_of_offsets(
+            number_of_pulses=3, number_of_repetitions=4) == 12
+        counts = count_predefined_dds_offsets(scheme='in-house',
+                                              number_of_repetitions=[1, 5])
+        assert np.array_equal(counts['number_of_offsets'], [2, 10])
+        assert counts['number_of_x_pulses'] is None
+
+        with pytest.raises(ArgumentsValueError):
+            _ = new_predefined_dds(scheme='in-house', number_of_pulses=101)
+    finally:
+        unregister_dds_scheme('in-house')
+        clear_template_cache()
+
+    assert 'in-house' not in get_dds_scheme_names()
+
+
+def _listed_template():
+    """Relative template of two X pulses, as lists
+    """
+
+    return [0.25, 0.75], [np.pi, np.pi], [0, 0], [0, 0]
+
+
+def _invalid_template():
+    """Relative template with offsets beyond the end of the sequence
+    """
+
+    return [0.5, 1.5], [np.pi, np.pi], [0, 0], [0, 0]
+
+
+def test_register_listed_template():
+
+    """Tests that the templates returned as lists create the same sequences
+    one by one and in grids
+    """
+
+    register_dds_scheme('listed', template_function=_listed_template)
+    register_dds_scheme('invalid', template_function=_invalid_template)
+
+    try:
+        clear_template_cache()
+        sequence = new_predefined_dds(scheme='listed', duration=2.)
+        assert np.allclose(sequence.offsets, [0., 0.5, 1.5, 2.])
+        assert np.allclose(sequence.rabi_rotations, [0., np.pi, np.pi, 0.])
+
+        clear_template_cache()
+        batch = new_predefined_dds_grid(schemes=['listed'], durations=2.)
+        assert np.array_equal(batch.get_sequence(0).offsets, sequence.offsets)
+
+        clear_template_cache()
+        with pytest.raises(ArgumentsValueError):
+            _ = new_predefined_dds(scheme='invalid')
+        with pytest.raises(ArgumentsValueError):
+            _ = new_predefined_dds_grid(schemes=['invalid'])
+    finally:
+        unregister_dds_scheme('listed')
+        unregister_dds_scheme('invalid')
+        clear_template_cache()
+
+
+if __name__ == '__main__':
+    pass
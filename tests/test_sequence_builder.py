@@ -0,0 +1,102 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+===================================
+Tests for the builder of a sequence
+===================================
+"""
+
+import pytest
+import numpy as np
+
+from qctrlopencontrols.exceptions import ArgumentsValueError
+from qctrlopencontrols import (
+    DynamicDecouplingSequence, DynamicDecouplingSequenceBuilder)
+from qctrlopencontrols.dynamic_decoupling_sequences import UPPER_BOUND_OFFSETS
+
+
+def test_sequence_builder():
+
+    """Tests building sequences one operation at a time
+    """
+
+    for offsets, pre_post_rotation in [([0.5, 1., 1.5], False),
+                                       ([0., 0.5, 2.], True),
+                                       ([0.25, 0.25, 2.], False),
+                                       ([0., 1.], True)]:
+        rabi_rotations = np.pi * np.arange(1, len(offsets) + 1) / 4
+        detuning_rotations = np.pi * (np.arange(len(offsets)) % 2)
+
+        builder = DynamicDecouplingSequenceBuilder(duration=2.,
+                                                   pre_post_rotation=pre_post_rotation,
+                                                   name='built', capacity=1)
+        builder.append(offsets[0], rabi_rotation=rabi_rotations[0],
+                       azimuthal_angle=np.pi / 2, detuning_rotation=detuning_rotations[0])
+        builder.extend(offsets[1:], rabi_rotations=rabi_rotations[1:],
+                       azimuthal_angles=np.full(len(offsets) - 1, np.pi / 2),
+                       detuning_rotations=detuning_rotations[1:])
+        assert len(builder) == builder.number_of_offsets == len(offsets)
+
+        built_sequence = builder.freeze()
+        sequence = DynamicDecouplingSequence(
+            duration=2., offsets=offsets, rabi_rotations=rabi_rotations,
+            azimuthal_angles=np.full(len(offsets), np.pi / 2),
+            detuning_rotations=detuning_rotations,
+            pre_post_rotation=pre_post_rotation, name='built')
+
+        assert built_sequence.get_fingerprint() == sequence.get_fingerprint()
+        assert built_sequence.number_of_offsets == sequence.number_of_offsets
+        assert built_sequence.name == 'built'
+
+    builder = DynamicDecouplingSequenceBuilder(duration=3.)
+    assert np.array_equal(builder.freeze().offsets, [0., 3.])
+
+    # the builder keeps growing the sequence after it is frozen
+    builder.append(1.)
+    first_sequence = builder.freeze()
+    builder.append(2., rabi_rotation=np.pi / 2)
+    assert np.array_equal(first_sequence.offsets, [0., 1., 3.])
+    assert np.array_equal(builder.freeze().rabi_rotations, [0., np.pi, np.pi / 2, 0.])
+
+
+def test_sequence_builder_checks():
+
+    """Tests the checks of the appended operations
+    """
+
+    with pytest.raises(ArgumentsValueError):
+        _ = DynamicDecouplingSequenceBuilder(duration=0.)
+
+    builder = DynamicDecouplingSequenceBuilder(duration=1.)
+    builder.append(0.5)
+
+    for offset in [0.25, 1.5, np.nan]:
+        with pytest.raises(ArgumentsValueError):
+            builder.append(offset)
+
+    with pytest.raises(ArgumentsValueError):
+        builder.extend([0.75, 0.6])
+    with pytest.raises(ArgumentsValueError):
+        builder.extend([0.75, 0.8], rabi_rotations=[np.pi])
+    assert builder.number_of_offsets == 1
+
+    builder.extend(np.linspace(0.5, 1., UPPER_BOUND_OFFSETS - 1))
+    with pytest.raises(ArgumentsValueError):
+        builder.append(1.)
+    assert builder.freeze().number_of_offsets == UPPER_BOUND_OFFSETS + 1
+
+
+if __name__ == '__main__':
+    pass
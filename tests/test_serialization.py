@@ -0,0 +1,116 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+=====================================
+Tests for binary sequence persistence
+=====================================
+"""
+
+import os
+import pytest
+import numpy as np
+
+from qctrlopencontrols.exceptions import ArgumentsValueError
+from qctrlopencontrols import (
+    new_predefined_dds, save_dds, load_dds, DynamicDecouplingSequenceArchive)
+
+
+def _remove_file(filename):
+    """Removes the file after test done
+    """
+
+    if os.path.exists(filename):
+        os.remove(filename)
+    else:
+        raise IOError('Could not find file {}'.format(
+            filename))
+
+
+def _assert_same_sequence(sequence, other_sequence):
+    """Checks that two sequences have identical content
+    """
+
+    assert sequence.duration == other_sequence.duration
+    assert sequence.name == other_sequence.name
+    assert sequence.pre_post_rotation == other_sequence.pre_post_rotation
+    assert np.array_equal(sequence.offsets, other_sequence.offsets)
+    assert np.array_equal(sequence.rabi_rotations, other_sequence.rabi_rotations)
+    assert np.array_equal(sequence.azimuthal_angles, other_sequence.azimuthal_angles)
+    assert np.array_equal(sequence.detuning_rotations, other_sequence.detuning_rotations)
+
+
+def test_save_and_load():
+
+    """Tests saving and loading a single sequence
+    """
+
+    sequence = new_predefined_dds(scheme='XY concatenated', duration=10.,
+                                  concatenation_order=2, pre_post_rotation=True,
+                                  name='xy_cdd')
+
+    _filename = 'dds_binary.qdds'
+    save_dds(sequence, _filename)
+    loaded_sequence = load_dds(_filename)
+
+    _assert_same_sequence(sequence, loaded_sequence)
+    assert sequence.get_fingerprint() == loaded_sequence.get_fingerprint()
+
+    _remove_file(_filename)
+
+    with pytest.raises(ArgumentsValueError):
+        save_dds(None, _filename)
+
+
+def test_sequence_archive():
+
+    """Tests appending to and loading from a sequence archive
+    """
+
+    _filename = 'dds_archive.qdds'
+    archive = DynamicDecouplingSequenceArchive(_filename)
+
+    sequences = [new_predefined_dds(scheme='Carr-Purcell', duration=2.,
+                                    number_of_offsets=number_of_offsets,
+                                    name='cp_{}'.format(number_of_offsets))
+                 for number_of_offsets in range(1, 6)]
+    sequences.append(new_predefined_dds(scheme='spin echo', duration=1.))
+
+    for sequence in sequences:
+        archive.append(sequence)
+
+    assert len(archive) == 6
+    assert archive.names == ['cp_1', 'cp_2', 'cp_3', 'cp_4', 'cp_5', None]
+
+    _assert_same_sequence(sequences[2], archive.load(name='cp_3'))
+    _assert_same_sequence(sequences[5], archive.load(
+        fingerprint=sequences[5].get_fingerprint()))
+    _assert_same_sequence(sequences[-1], archive.load(index=-1))
+
+    # reopening the archive rebuilds the index from the record headers
+    archive = DynamicDecouplingSequenceArchive(_filename)
+    assert len(archive) == 6
+    assert archive.fingerprints == [sequence.get_fingerprint() for sequence in sequences]
+    _assert_same_sequence(sequences[4], archive.load(name='cp_5'))
+
+    with pytest.raises(ArgumentsValueError):
+        _ = archive.load(name='unknown')
+    with pytest.raises(ArgumentsValueError):
+        _ = archive.load(name='cp_1', index=0)
+
+    _remove_file(_filename)
+
+
+if __name__ == '__main__':
+    pass
@@ -0,0 +1,113 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+=====================================
+Tests for the simplification of a DDS
+=====================================
+"""
+
+import pytest
+import numpy as np
+
+from qctrlopencontrols.exceptions import ArgumentsValueError
+from qctrlopencontrols import (
+    DynamicDecouplingSequence, new_predefined_dds, simplify_dds,
+    convert_dds_to_driven_controls)
+
+
+def test_simplify_dds():
+
+    """Tests merging and removing the operations of a sequence
+    """
+
+    _pi = np.pi
+    sequence = DynamicDecouplingSequence(
+        duration=2.,
+        offsets=[0.5, 0.5, 1., 1., 1., 1.2, 1.5, 1.5, 1.8, 1.8 + 1e-14],
+        rabi_rotations=[_pi, _pi, 0., _pi / 2, _pi / 2, 2 * _pi, _pi, 0., _pi, _pi / 2],
+        azimuthal_angles=[0., 0., 0., _pi / 2, _pi / 2, 0., 0., 0., 0., _pi],
+        detuning_rotations=[0., 0., 0., 0., 0., 0., 0., _pi, 0., 0.],
+        name='composed')
+
+    simplified_sequence, number_of_removed_operations = simplify_dds(sequence)
+
+    # the X pulses at 0.5 cancel, the Y pulses at 1 merge into one, the 2 pi rotation
+    # at 1.2 is an identity, the X and Z pulses at 1.5 do not commute and the pulses
+    # about opposite axes at 1.8 merge into an X pi/2 pulse
+    assert number_of_removed_operations == 6
+    assert simplified_sequence.name == 'composed'
+    assert np.allclose(simplified_sequence.offsets, [0., 1., 1.5, 1.5, 1.8, 2.])
+    assert np.allclose(simplified_sequence.rabi_rotations,
+                       [0., _pi, _pi, 0., _pi / 2, 0.])
+    assert np.allclose(simplified_sequence.azimuthal_angles, [0., _pi / 2, 0., 0., 0., 0.])
+    assert np.allclose(simplified_sequence.detuning_rotations, [0., 0., 0., _pi, 0., 0.])
+
+    with pytest.raises(ArgumentsValueError):
+        _ = simplify_dds(sequence, tolerance=-1.)
+    with pytest.raises(ArgumentsValueError):
+        _ = simplify_dds(sequence.offsets)
+
+
+def test_simplify_detuning_rotations():
+
+    """Tests that the merged detuning rotations are not negative
+    """
+
+    sequence = DynamicDecouplingSequence(duration=1., offsets=[0.5, 0.5],
+                                         rabi_rotations=[0., 0.],
+                                         detuning_rotations=[np.pi, np.pi / 2])
+    simplified_sequence, number_of_removed_operations = simplify_dds(sequence)
+
+    # Z(pi) Z(pi/2) is Z(3 pi/2), stored as such rather than as Z(-pi/2)
+    assert number_of_removed_operations == 1
+    assert np.allclose(simplified_sequence.detuning_rotations, [0., 3 * np.pi / 2, 0.])
+    assert np.allclose(simplified_sequence.azimuthal_angles, 0.)
+
+    driven_control = convert_dds_to_driven_controls(simplified_sequence)
+    expected_driven_control = convert_dds_to_driven_controls(DynamicDecouplingSequence(
+        duration=1., offsets=[0.5], rabi_rotations=[0.], detuning_rotations=[3 * np.pi / 2]))
+    assert np.allclose(driven_control.segments, expected_driven_control.segments)
+
+
+def test_simplify_predefined_dds():
+
+    """Tests that the predefined sequences are already simplified
+    """
+
+    for scheme, parameters in [('Ramsey', {'pre_post_rotation': True}),
+                               ('spin echo', {'pre_post_rotation': True}),
+                               ('quadratic', {'number_inner_offsets': 3,
+                                              'number_outer_offsets': 4}),
+                               ('XY concatenated', {'concatenation_order': 3})]:
+        sequence = new_predefined_dds(scheme=scheme, **parameters)
+        simplified_sequence, number_of_removed_operations = simplify_dds(sequence)
+
+        assert number_of_removed_operations == 0
+        for name in ['offsets', 'rabi_rotations', 'azimuthal_angles', 'detuning_rotations']:
+            assert np.array_equal(getattr(sequence, name), getattr(simplified_sequence, name))
+
+    # the pulses at the start and end of the sequence are kept apart from the
+    # coincident pulses
+    sequence = DynamicDecouplingSequence(duration=1., offsets=[0., 0., 0.5, 1.],
+                                         rabi_rotations=[np.pi, np.pi, np.pi, 0.],
+                                         pre_post_rotation=True)
+    simplified_sequence, number_of_removed_operations = simplify_dds(sequence)
+    assert number_of_removed_operations == 0
+    assert np.allclose(simplified_sequence.rabi_rotations,
+                       [np.pi / 2, np.pi, np.pi, np.pi / 2])
+
+
+if __name__ == '__main__':
+    pass
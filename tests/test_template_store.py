@@ -0,0 +1,120 @@
+# Copyright 2019 Q-CTRL Pty Ltd & Q-CTRL Inc
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+=============================
+Tests for the template stores
+=============================
+"""
+
+import os
+import pytest
+import numpy as np
+
+from qctrlopencontrols.exceptions import ArgumentsValueError
+from qctrlopencontrols import (
+    new_predefined_dds, clear_template_cache, set_template_store, build_template_store,
+    DynamicDecouplingTemplateStore, write_template_store)
+from qctrlopencontrols.dynamic_decoupling_sequences.__main__ import main
+
+
+def _remove_file(filename):
+    """Removes the file after test done
+    """
+
+    if os.path.exists(filename):
+        os.remove(filename)
+    else:
+        raise IOError('Could not find file {}'.format(
+            filename))
+
+
+def test_build_template_store():
+
+    """Tests building a template store and generating sequences from it
+    """
+
+    _filename = 'dds_templates.qdts'
+    number_of_templates = build_template_store(_filename, maximum_order=4)
+
+    store = DynamicDecouplingTemplateStore(_filename)
+    assert len(store) == number_of_templates == 4 + 16 + 4 + 4
+    assert ('quadratic', (2, 3)) in store
+    assert store.get('Carr-Purcell', (1,)) is None
+
+    sequence = new_predefined_dds(scheme='quadratic', duration=2.,
+                                  number_inner_offsets=2, number_outer_offsets=3)
+    offsets, rabi_rotations, azimuthal_angles, detuning_rotations = \
+        store.get('quadratic', (2, 3))
+    assert np.array_equal(2. * offsets, sequence.offsets[1:-1])
+    assert np.array_equal(rabi_rotations, sequence.rabi_rotations[1:-1])
+    assert np.array_equal(azimuthal_angles, sequence.azimuthal_angles[1:-1])
+    assert np.array_equal(detuning_rotations, sequence.detuning_rotations[1:-1])
+
+    try:
+        clear_template_cache()
+        set_template_store(_filename)
+        stored_sequence = new_predefined_dds(scheme='quadratic', duration=2.,
+                                             number_inner_offsets=2,
+                                             number_outer_offsets=3)
+        assert np.array_equal(sequence.offsets, stored_sequence.offsets)
+    finally:
+        set_template_store(None)
+        clear_template_cache()
+
+    main([_filename, '--maximum-order', '2', '--schemes', 'Carr-Purcell'])
+    assert DynamicDecouplingTemplateStore(_filename).keys == [
+        ('Carr-Purcell', (1,)), ('Carr-Purcell', (2,))]
+
+    _remove_file(_filename)
+
+    with pytest.raises(ArgumentsValueError):
+        _ = build_template_store(_filename, schemes=['Ramsey'])
+
+
+def test_template_store_lookup():
+
+    """Tests that the predefined sequences use the templates of the store
+    """
+
+    _filename = 'dds_templates.qdts'
+    template = (np.array([0.25, 0.5]), np.array([np.pi, 0.]),
+                np.array([np.pi / 2, 0.]), np.array([0., np.pi]))
+    write_template_store(_filename, {('XY concatenated', (2,)): template})
+
+    try:
+        clear_template_cache()
+        set_template_store(_filename)
+        sequence = new_predefined_dds(scheme='XY concatenated', duration=4.,
+                                      concatenation_order=2)
+    finally:
+        set_template_store(None)
+        clear_template_cache()
+
+    assert np.array_equal(sequence.offsets, [0., 1., 2., 4.])
+    assert np.array_equal(sequence.detuning_rotations, [0., 0., np.pi, 0.])
+
+    with pytest.raises(ArgumentsValueError):
+        write_template_store(_filename, {('XY concatenated', (2, 3, 4)): template})
+
+    with open(_filename, 'wb') as handle:
+        handle.write(b'QDDS')
+    with pytest.raises(ArgumentsValueError):
+        _ = DynamicDecouplingTemplateStore(_filename)
+
+    _remove_file(_filename)
+
+
+if __name__ == '__main__':
+    pass